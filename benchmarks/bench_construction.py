@@ -0,0 +1,22 @@
+from clasp_diagrams.objects import ClaspDiagram
+from clasp_diagrams.packed import PackedClaspDiagram
+from clasp_diagrams.generators import random_valid_matrix, random_valid_array
+from benchmarks.harness import Benchmark
+
+def _from_matrix(n):
+    matrix = random_valid_matrix(n)
+    return lambda: ClaspDiagram.from_matrix(matrix=matrix)
+
+def _from_array(n):
+    array = random_valid_array(n)
+    return lambda: ClaspDiagram.from_array(array)
+
+def _from_packed(n):
+    packed = PackedClaspDiagram.from_matrix(random_valid_matrix(n))
+    return lambda: ClaspDiagram.from_packed(packed)
+
+BENCHMARKS = [
+    Benchmark('construction.from_matrix', _from_matrix, expected=1),
+    Benchmark('construction.from_array', _from_array, expected=1),
+    Benchmark('construction.from_packed', _from_packed, expected=1),
+]
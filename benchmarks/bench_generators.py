@@ -0,0 +1,13 @@
+from clasp_diagrams.generators import random_valid_matrix, random_valid_array, random_chord_batch
+from benchmarks.harness import Benchmark
+import numpy as np
+
+def _batch(n):
+    rng = np.random.default_rng(0)
+    return lambda: random_chord_batch(1000, n, rng)
+
+BENCHMARKS = [
+    Benchmark('generators.random_valid_matrix', lambda n: lambda: random_valid_matrix(n), expected=1),
+    Benchmark('generators.random_valid_array', lambda n: lambda: random_valid_array(n), expected=1),
+    Benchmark('generators.random_chord_batch_1000', _batch, expected=1),
+]
@@ -0,0 +1,64 @@
+from clasp_diagrams.objects import ClaspDiagram
+from clasp_diagrams.generators import random_valid_matrix
+import clasp_diagrams.moves as moves
+from benchmarks.harness import Benchmark
+
+# Moves are timed with the isotopy check off (the check is timed separately, capped),
+# on a fresh parent without computed invariants.
+
+def _clasp(n):
+    return ClaspDiagram.from_matrix(matrix=random_valid_matrix(n))
+
+def _unchecked(fn):
+    def timed():
+        with moves.isotopy_check('off'):
+            return fn()
+    return timed
+
+def _exchange_heights(n):
+    clasp = _clasp(n)
+    legal = moves.legal_moves(clasp, move_nums=(1,))
+    if not legal: # Make a legal move A: an isolated chord next to chord 1, with consecutive heights
+        with moves.isotopy_check('off'):
+            clasp, _ = moves.add_isolated_chord(_clasp(n - 1), after_point=-1, new_sign='+', new_height=1)
+        legal = moves.legal_moves(clasp, move_nums=(1,))
+    kwargs = legal[0][1]
+    return _unchecked(lambda: moves.exchange_heights(clasp, **kwargs))
+
+def _cyclic_height_shift(n):
+    clasp = _clasp(n)
+    return _unchecked(lambda: moves.cyclic_height_shift(clasp))
+
+def _inverse_cyclic_height_shift(n):
+    clasp = _clasp(n)
+    return _unchecked(lambda: moves.inverse_cyclic_height_shift(clasp))
+
+def _erase_isolated_chord(n):
+    with moves.isotopy_check('off'):
+        clasp, _ = moves.add_isolated_chord(_clasp(n - 1), after_point=-1, new_sign='+', new_height=1)
+    return _unchecked(lambda: moves.erase_isolated_chord(clasp, i=1))
+
+def _add_isolated_chord(n):
+    clasp = _clasp(n)
+    return _unchecked(lambda: moves.add_isolated_chord(clasp, after_point=n - 1, new_sign='-', new_height=1))
+
+def _legal_moves(n):
+    clasp = _clasp(n)
+    return lambda: moves.legal_moves(clasp, move_nums=(1, 2, -2, 3))
+
+def _checked_cyclic_height_shift(n):
+    matrix = random_valid_matrix(n)
+    def timed():
+        with moves.isotopy_check('always'):
+            return moves.cyclic_height_shift(ClaspDiagram.from_matrix(matrix=matrix))
+    return timed
+
+BENCHMARKS = [
+    Benchmark('moves.exchange_heights', _exchange_heights, expected=1),
+    Benchmark('moves.cyclic_height_shift', _cyclic_height_shift, expected=1),
+    Benchmark('moves.inverse_cyclic_height_shift', _inverse_cyclic_height_shift, expected=1),
+    Benchmark('moves.erase_isolated_chord', _erase_isolated_chord, expected=1),
+    Benchmark('moves.add_isolated_chord', _add_isolated_chord, expected=1),
+    Benchmark('moves.legal_moves', _legal_moves, expected=2),
+    Benchmark('moves.cyclic_height_shift_checked', _checked_cyclic_height_shift, expected=4, max_n=48),
+]
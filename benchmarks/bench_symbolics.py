@@ -0,0 +1,63 @@
+from clasp_diagrams.generators import random_valid_matrix, random_chord_batch
+import clasp_diagrams.symbolics as symbolics
+import numpy as np
+from benchmarks.harness import Benchmark
+
+def _matrices(n):
+    matrix = random_valid_matrix(n)
+    e_matrix = symbolics.get_e_matrix(matrix)
+    l_matrix = symbolics.get_l_matrix(matrix)
+    return matrix, e_matrix, l_matrix, symbolics.get_le_matrix(e_matrix, l_matrix)
+
+def _e_matrix(n):
+    matrix = random_valid_matrix(n)
+    return lambda: symbolics.get_e_matrix(matrix)
+
+def _l_matrix(n):
+    matrix = random_valid_matrix(n)
+    return lambda: symbolics.get_l_matrix(matrix)
+
+def _le_matrix(n):
+    _, e_matrix, l_matrix, _ = _matrices(n)
+    return lambda: symbolics.get_le_matrix(e_matrix, l_matrix)
+
+def _sd_matrix(n):
+    le_matrix = _matrices(n)[3]
+    return lambda: symbolics.get_sd_matrix(le_matrix)
+
+def _alexander_polynomial(n):
+    sd_matrix = symbolics.get_sd_matrix(_matrices(n)[3])
+    return lambda: symbolics.get_alexander_polynomial(sd_matrix)
+
+def _alexander_coefficients(method):
+    def make(n):
+        le_matrix = _matrices(n)[3]
+        return lambda: symbolics.get_alexander_coefficients(le_matrix, method=method)
+    return make
+
+BATCH_SIZE = 64 # Diagrams per call of the batched benchmarks
+
+def _alexander_batch(evaluate):
+    def make(n):
+        chords = random_chord_batch(BATCH_SIZE, n, np.random.default_rng(n))
+        le_matrices = symbolics.get_le_matrix_from_arrays(chords['start_point'], chords['end_point'],
+                                                          chords['height'], chords['sign'])
+        return lambda: evaluate(le_matrices)
+    return make
+
+BENCHMARKS = [
+    Benchmark('symbolics.get_e_matrix', _e_matrix, expected=2),
+    Benchmark('symbolics.get_l_matrix', _l_matrix, expected=2),
+    Benchmark('symbolics.get_le_matrix', _le_matrix, expected=2),
+    Benchmark('symbolics.get_sd_matrix', _sd_matrix, expected=2, max_n=64),
+    # The sympy determinant blows up quickly (no polynomial slope to check): capped
+    Benchmark('symbolics.get_alexander_polynomial', _alexander_polynomial, expected=None, max_n=12),
+    Benchmark('symbolics.get_alexander_coefficients[bareiss]', _alexander_coefficients('bareiss'), expected=4, max_n=64),
+    # O(n⁴) and O(n³) per prime, times O(n) primes for the coefficient bound
+    Benchmark('symbolics.get_alexander_coefficients[interpolation]', _alexander_coefficients('interpolation'), expected=5, max_n=128),
+    Benchmark('symbolics.get_alexander_coefficients[modular]', _alexander_coefficients('modular'), expected=4, max_n=256),
+    Benchmark('symbolics.get_alexander_coefficients_batch[64]', _alexander_batch(symbolics.get_alexander_coefficients_batch),
+              expected=4, max_n=64),
+    Benchmark('symbolics.get_alexander_values[64]', _alexander_batch(lambda le: symbolics.get_alexander_values(le, 2.0, log=True)),
+              expected=3),
+]
@@ -0,0 +1,16 @@
+from clasp_diagrams.generators import random_valid_matrix, random_valid_array
+from clasp_diagrams.transformations import transform_matrix_to_array, transform_array_to_matrix
+from benchmarks.harness import Benchmark
+
+def _matrix_to_array(n):
+    matrix = random_valid_matrix(n)
+    return lambda: transform_matrix_to_array(matrix)
+
+def _array_to_matrix(n):
+    array = random_valid_array(n)
+    return lambda: transform_array_to_matrix(array)
+
+BENCHMARKS = [
+    Benchmark('transformations.matrix_to_array', _matrix_to_array, expected=1),
+    Benchmark('transformations.array_to_matrix', _array_to_matrix, expected=1),
+]
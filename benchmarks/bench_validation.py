@@ -0,0 +1,22 @@
+from clasp_diagrams.packed import PackedClaspDiagram
+from clasp_diagrams.generators import random_valid_matrix, random_valid_array
+from clasp_diagrams.validators import validate_clasp_matrix, validate_clasp_array, validate_clasp_chords
+from benchmarks.harness import Benchmark
+
+def _matrix(n):
+    matrix = random_valid_matrix(n)
+    return lambda: validate_clasp_matrix(matrix)
+
+def _array(n):
+    array = random_valid_array(n)
+    return lambda: validate_clasp_array(array)
+
+def _chords(n):
+    chords = PackedClaspDiagram.from_matrix(random_valid_matrix(n)).chords
+    return lambda: validate_clasp_chords(chords)
+
+BENCHMARKS = [
+    Benchmark('validators.validate_clasp_matrix', _matrix, expected=1),
+    Benchmark('validators.validate_clasp_array', _array, expected=1),
+    Benchmark('validators.validate_clasp_chords', _chords, expected=1),
+]
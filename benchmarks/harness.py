@@ -0,0 +1,94 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Callable
+import numpy as np
+import platform
+import random
+import time
+
+# ==================== Benchmark harness ====================
+# A benchmark builds, for a number of chords n, a zero-argument callable to time.
+# Each size is timed as the best of `repeat` rounds, where a round calls the function until
+# `min_time` seconds have passed. Sizes stop growing once a single call takes more than `max_seconds`,
+# which caps the slow (sympy) paths automatically.
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    make: Callable[[int], Callable[[], object]] # n -> function to time
+    expected: float | None # Expected scaling exponent, e.g. 2 for O(n²). None skips the slope check
+    max_n: int | None = None
+
+def time_call(fn: Callable[[], object], *, min_time: float = 0.05, repeat: int = 3) -> float:
+    """
+    Best time per call (in seconds) over `repeat` rounds of at least min_time seconds.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        calls, began = 0, time.perf_counter()
+        while True:
+            fn()
+            calls += 1
+            elapsed = time.perf_counter() - began
+            if elapsed >= min_time:
+                break
+        best = min(best, elapsed / calls)
+    return best
+
+def scaling_slope(sizes: list[int], seconds: list[float], min_n: int = 8) -> float | None:
+    """
+    Slope of log(time) against log(n) (the empirical exponent k of O(nᵏ)), fitted on the sizes >= min_n
+    (on the two largest sizes if there are not enough of those, e.g. for capped benchmarks).
+    """
+    points = [(n, t) for n, t in zip(sizes, seconds) if t > 0]
+    if len(points) < 2:
+        return None
+    points = [(n, t) for n, t in points if n >= min_n] if sum(n >= min_n for n, _ in points) >= 2 else points[-2:]
+    n, t = np.log(np.array(points, dtype=float)).T
+    return float(np.polyfit(n, t, 1)[0])
+
+def run_benchmarks(benchmarks: list[Benchmark], sizes: list[int], *, min_time: float = 0.05, repeat: int = 3,
+                   max_seconds: float = 1.0, log: Callable[[str], None] = lambda line: None) -> dict:
+    """
+    Runs every benchmark over the sizes and returns a JSON-serializable report.
+    """
+    results = {}
+    for benchmark in benchmarks:
+        measured_sizes, seconds = [], []
+        for n in sizes:
+            if benchmark.max_n is not None and n > benchmark.max_n:
+                break
+            random.seed(n) # Same diagrams on every run, so reports are comparable
+            np.random.seed(n)
+            fn = benchmark.make(n)
+            t = time_call(fn, min_time=min_time, repeat=repeat)
+            measured_sizes.append(n)
+            seconds.append(t)
+            log(f"{benchmark.name:<40} n={n:<5} {t * 1e6:12.1f} us")
+            if t > max_seconds:
+                break
+        slope = scaling_slope(measured_sizes, seconds)
+        results[benchmark.name] = {'sizes': measured_sizes, 'seconds': seconds, 'slope': slope,
+                                   'expected_slope': benchmark.expected}
+    return {'meta': {'python': platform.python_version(), 'numpy': np.__version__,
+                     'machine': platform.machine(), 'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')},
+            'results': results}
+
+def compare(report: dict, baseline: dict, *, tolerance: float = 1.5, slope_margin: float = 0.5) -> list[str]:
+    """
+    Lists the regressions of a report: sizes more than `tolerance` times slower than in the baseline,
+    and scaling slopes exceeding the expected exponent by more than slope_margin.
+    """
+    regressions = []
+    for name, result in report['results'].items():
+        expected = result['expected_slope']
+        if result['slope'] is not None and expected is not None and result['slope'] > expected + slope_margin:
+            regressions.append(f"{name}: scaling slope {result['slope']:.2f} (expected {expected})")
+        old = baseline.get('results', {}).get(name)
+        if old is None:
+            continue
+        old_times = dict(zip(old['sizes'], old['seconds']))
+        for n, t in zip(result['sizes'], result['seconds']):
+            if n in old_times and t > tolerance * old_times[n]:
+                regressions.append(f"{name} n={n}: {t * 1e6:.1f} us vs {old_times[n] * 1e6:.1f} us in the baseline")
+    return regressions
@@ -0,0 +1,52 @@
+"""
+Runs the benchmark suite and writes a JSON report.
+
+    python -m benchmarks.run                          # n = 2..200, all benchmarks
+    python -m benchmarks.run --filter symbolics --sizes 2,4,8,16 --output symbolics.json
+    python -m benchmarks.run --baseline old.json      # exits with 1 on regressions
+"""
+from benchmarks.harness import run_benchmarks, compare
+from benchmarks import (bench_construction, bench_symbolics, bench_moves, bench_validation,
+                        bench_transformations, bench_generators)
+import argparse
+import json
+import sys
+
+SUITES = [bench_construction, bench_symbolics, bench_moves, bench_validation, bench_transformations, bench_generators]
+DEFAULT_SIZES = [2, 4, 8, 16, 32, 64, 100, 150, 200]
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)), help="Comma-separated numbers of chords")
+    parser.add_argument('--filter', default='', help="Only run benchmarks whose name contains this")
+    parser.add_argument('--min-time', type=float, default=0.05, help="Seconds per timing round")
+    parser.add_argument('--repeat', type=int, default=3, help="Timing rounds per size (best is kept)")
+    parser.add_argument('--max-seconds', type=float, default=1.0, help="Stop growing n past this time per call")
+    parser.add_argument('--output', default='benchmarks.json', help="Path of the JSON report")
+    parser.add_argument('--baseline', help="JSON report to compare against")
+    parser.add_argument('--tolerance', type=float, default=1.5, help="Slowdown factor counted as a regression")
+    args = parser.parse_args(argv)
+
+    benchmarks = [b for suite in SUITES for b in suite.BENCHMARKS if args.filter in b.name]
+    sizes = [int(n) for n in args.sizes.split(',')]
+    report = run_benchmarks(benchmarks, sizes, min_time=args.min_time, repeat=args.repeat,
+                            max_seconds=args.max_seconds, log=print)
+    with open(args.output, 'w') as file:
+        json.dump(report, file, indent=2)
+
+    print(f"\n{'benchmark':<40} {'slope':>6} {'expected':>9}")
+    for name, result in report['results'].items():
+        slope = 'n/a' if result['slope'] is None else f"{result['slope']:.2f}"
+        expected = 'n/a' if result['expected_slope'] is None else result['expected_slope']
+        print(f"{name:<40} {slope:>6} {expected:>9}")
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(report, json.load(file), tolerance=args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,175 @@
+from __future__ import annotations
+from clasp_diagrams.objects import ClaspDiagram
+from clasp_diagrams.packed import PackedClaspDiagram, CHORD_DTYPE
+import clasp_diagrams.symbolics as symbolics
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
+from typing import Iterable, Iterator
+import numpy as np
+import os
+
+# ==================== Batch invariant computation ====================
+# Diagrams are sent to the worker processes in chunks, as a single CHORD_DTYPE array with the chords
+# of every diagram of the chunk one after the other, plus the offsets where each diagram starts
+# (13 bytes per chord in total). Workers answer with the integer coefficient tuples of the
+# Alexander polynomials, so no sympy object ever crosses a process boundary. Within a chunk, diagrams
+# with the same number of chords are stacked and go through the batched engine together.
+
+def _as_packed(diagram) -> PackedClaspDiagram:
+    if isinstance(diagram, PackedClaspDiagram):
+        return diagram
+    if isinstance(diagram, ClaspDiagram):
+        return diagram.packed
+    return PackedClaspDiagram.from_matrix(diagram)
+
+def _pack_chunk(packed: list[PackedClaspDiagram]) -> tuple[np.ndarray, np.ndarray]:
+    offsets = np.zeros(len(packed) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(p) for p in packed])
+    chords = np.concatenate([p.chords for p in packed]) if packed else np.empty(0, dtype=CHORD_DTYPE)
+    return chords, offsets
+
+def _chunk_coefficients(chords: np.ndarray, offsets: np.ndarray) -> list[tuple[int, ...]]:
+    """
+    Worker: Alexander coefficients of every diagram of a chunk.
+    """
+    sizes = np.diff(offsets)
+    results = [None] * len(sizes)
+    for n in np.unique(sizes):
+        indices = np.flatnonzero(sizes == n)
+        batch = chords[offsets[indices][:, None] + np.arange(n)]
+        for k, coefficients in zip(indices, symbolics.get_alexander_coefficients_batch(stack_le_matrices(batch))):
+            results[k] = coefficients
+    return results
+
+def _chunks(diagrams: Iterable, chunksize: int) -> Iterator[tuple[int, list]]:
+    iterator, start = iter(diagrams), 0
+    while chunk := list(islice(iterator, chunksize)):
+        yield start, chunk
+        start += len(chunk)
+
+def iter_invariants(diagrams: Iterable, *, workers: int | None = None, chunksize: int = 64,
+                    ordered: bool = True, seed: bool = True) -> Iterator[tuple[int, tuple[int, ...]]]:
+    """
+    Computes the Alexander polynomial coefficients (as in ClaspDiagram.alexander_coefficients) of many diagrams
+    with a process pool, yielding (index, coefficients) pairs.
+
+    Parameters
+    ----------
+    diagrams : iterable
+        ClaspDiagram, PackedClaspDiagram or clasp matrices. Consumed lazily, so it can be a generator.
+    workers : int | None
+        Number of worker processes (defaults to os.cpu_count()). With workers <= 1 everything runs in-process.
+    chunksize : int
+        Number of diagrams sent to a worker at a time.
+    ordered : bool
+        If True, results are yielded in input order; otherwise as soon as their chunk completes.
+    seed : bool
+        If True, the coefficients are also stored in the ClaspDiagram inputs, so they are not recomputed.
+
+    At most 2·workers chunks are in flight at any time, so memory stays bounded for long inputs.
+
+    Time complexity: O(N·P·n³ / workers) for N diagrams of n chords, P primes (see symbolics.get_alexander_coefficients_batch)
+    """
+    if chunksize < 1:
+        raise ValueError(f"Invalid chunksize={chunksize}. Must be at least 1.")
+    workers = (os.cpu_count() or 1) if workers is None else workers
+
+    def results(start, chunk, coefficients):
+        for k, (diagram, coeffs) in enumerate(zip(chunk, coefficients)):
+            if seed and isinstance(diagram, ClaspDiagram):
+                diagram._seed(alexander_coefficients=coeffs)
+            yield start + k, coeffs
+
+    if workers <= 1:
+        for start, chunk in _chunks(diagrams, chunksize):
+            yield from results(start, chunk, _chunk_coefficients(*_pack_chunk([_as_packed(d) for d in chunk])))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = {} # future -> (start, chunk)
+        finished = {} # start -> (chunk, coefficients), completed out of order
+        next_start = 0
+        chunks = _chunks(diagrams, chunksize)
+        exhausted = False
+
+        while pending or not exhausted:
+            while not exhausted and len(pending) < 2 * workers:
+                item = next(chunks, None)
+                if item is None:
+                    exhausted = True
+                    break
+                start, chunk = item
+                future = executor.submit(_chunk_coefficients, *_pack_chunk([_as_packed(d) for d in chunk]))
+                pending[future] = (start, chunk)
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                start, chunk = pending.pop(future)
+                if not ordered:
+                    yield from results(start, chunk, future.result())
+                else:
+                    finished[start] = (chunk, future.result())
+            while next_start in finished:
+                chunk, coefficients = finished.pop(next_start)
+                yield from results(next_start, chunk, coefficients)
+                next_start += len(chunk)
+
+def compute_invariants(diagrams: Iterable, *, workers: int | None = None, chunksize: int = 64,
+                       seed: bool = True) -> list[tuple[int, ...]]:
+    """
+    Returns the Alexander polynomial coefficients of every diagram, in input order. See iter_invariants().
+    """
+    return [coefficients for _, coefficients in
+            iter_invariants(diagrams, workers=workers, chunksize=chunksize, ordered=True, seed=seed)]
+
+# ==================== Same-size batches ====================
+# Diagrams with the same number of chords are evaluated together on a (B, n, n) stack of LE-matrices,
+# e.g. to score a whole search frontier at once. See the "Batched evaluation" section of symbolics.py.
+
+def stack_le_matrices(diagrams) -> np.ndarray:
+    """
+    Returns the (B, n, n) stack of LE-matrices of B diagrams with n chords each.
+
+    diagrams : np.ndarray or iterable
+        A (B, n) structured array of CHORD_DTYPE (e.g. from generators.random_chord_batch), or
+        ClaspDiagram, PackedClaspDiagram or clasp matrices, all with the same number of chords.
+
+    Time complexity: O(B·n²) (vectorized)
+    Space complexity: O(B·n²)
+    """
+    if isinstance(diagrams, np.ndarray):
+        chords = diagrams
+    else:
+        packed = [_as_packed(diagram) for diagram in diagrams]
+        sizes = {len(p) for p in packed}
+        if len(sizes) > 1:
+            raise ValueError(f"All diagrams must have the same number of chords (got sizes {sorted(sizes)}).")
+        chords = np.stack([p.chords for p in packed]) if packed else np.empty((0, 0), dtype=CHORD_DTYPE)
+    return symbolics.get_le_matrix_from_arrays(chords['start_point'], chords['end_point'], chords['height'], chords['sign'])
+
+def alexander_values(diagrams, t0: complex, *, log: bool = False):
+    """
+    Floating point values at t0 of the Alexander polynomials of same-size diagrams (centered and signed as
+    in symbolics.get_alexander_values), from one batched numpy.linalg.det, or slogdet if log is True.
+
+    Time complexity: O(B·n³) (LAPACK, batched)
+    """
+    return symbolics.get_alexander_values(stack_le_matrices(diagrams), t0, log=log)
+
+def alexander_fingerprints(diagrams, *, seed: bool = True) -> list[tuple[int, ...]]:
+    """
+    Fingerprints (as in ClaspDiagram.fingerprint) of same-size diagrams, from one batched modular elimination.
+    If seed is True, they are also stored in the ClaspDiagram inputs.
+
+    Time complexity: O(B·k·n³) for k fingerprint points (vectorized)
+    """
+    diagrams = diagrams if isinstance(diagrams, np.ndarray) else list(diagrams)
+    fingerprints = [tuple(int(v) for v in row)
+                    for row in symbolics.get_alexander_fingerprints(stack_le_matrices(diagrams))]
+    if seed and not isinstance(diagrams, np.ndarray):
+        for diagram, fingerprint in zip(diagrams, fingerprints):
+            if isinstance(diagram, ClaspDiagram):
+                diagram._seed(fingerprint=fingerprint)
+    return fingerprints
@@ -0,0 +1,169 @@
+from __future__ import annotations
+from clasp_diagrams.objects import ClaspDiagram
+from clasp_diagrams.canonical import canonical_key, _as_packed
+import clasp_diagrams.symbolics as symbolics
+from collections import OrderedDict
+import sqlite3
+import sympy as sp
+
+# ==================== Memoization of the Alexander polynomial ====================
+# Rotating the base point of the circle and cyclically shifting the heights (move B) give isotopic diagrams,
+# so their Alexander polynomials are equal and can share a cache entry keyed by canonical.canonical_key.
+# Entries are the integer coefficient tuples of ClaspDiagram.alexander_coefficients.
+
+class InvariantCache:
+    """
+    Size-bounded LRU cache of Alexander polynomial coefficients, keyed by the canonical key of the diagrams,
+    with an optional persistent sqlite tier.
+
+    Parameters
+    ----------
+    max_entries : int
+        Maximum number of entries kept in memory. The least recently used ones are evicted first.
+    path : str | None
+        Path of a sqlite database. Every computed entry is also written there, and memory misses are
+        looked up there before computing, so repeated runs over the same diagrams start warm.
+    b_shifts : bool
+        Whether diagrams equal up to a B-shift share an entry (in addition to rotations).
+    commit_every : int
+        Number of writes to the sqlite tier between commits.
+
+    Attributes:
+        hits, misses (int): memory lookups that found / did not find an entry.
+        disk_hits (int): memory misses found in the sqlite tier.
+        evictions (int): entries dropped from memory.
+    """
+    def __init__(self, max_entries: int = 100_000, *, path: str | None = None, b_shifts: bool = True,
+                 commit_every: int = 1000):
+        if max_entries < 1:
+            raise ValueError(f"Invalid max_entries={max_entries}. Must be at least 1.")
+        self.max_entries = max_entries
+        self.b_shifts = b_shifts
+        self.commit_every = commit_every
+        self._entries = OrderedDict()
+        self.hits = self.misses = self.disk_hits = self.evictions = 0
+
+        self._connection = None
+        self._uncommitted = 0
+        if path is not None:
+            self._connection = sqlite3.connect(path)
+            self._connection.execute("CREATE TABLE IF NOT EXISTS alexander (key BLOB PRIMARY KEY, coefficients TEXT NOT NULL)")
+
+    # ---------- keys and lookups ----------
+    def key(self, diagram) -> bytes:
+        """
+        Cache key of a ClaspDiagram, PackedClaspDiagram or clasp matrix.
+        """
+        return canonical_key(_as_packed(diagram), b_shifts=self.b_shifts)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, diagram) -> bool:
+        return self.key(diagram) in self._entries
+
+    def get(self, diagram) -> tuple[int, ...] | None:
+        """
+        Returns the cached coefficients of the diagram, or None. Looks up the sqlite tier on memory misses.
+        """
+        return self._get(self.key(diagram))
+
+    def _get(self, key: bytes) -> tuple[int, ...] | None:
+        coefficients = self._entries.get(key)
+        if coefficients is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return coefficients
+        self.misses += 1
+
+        if self._connection is not None:
+            row = self._connection.execute("SELECT coefficients FROM alexander WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self.disk_hits += 1
+                coefficients = tuple(int(c) for c in row[0].split(','))
+                self._insert(key, coefficients)
+                return coefficients
+        return None
+
+    def put(self, diagram, coefficients: tuple[int, ...]):
+        key = self.key(diagram)
+        self._insert(key, tuple(coefficients))
+        self._write(key, coefficients)
+
+    def _insert(self, key: bytes, coefficients: tuple[int, ...]):
+        self._entries[key] = coefficients
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _write(self, key: bytes, coefficients: tuple[int, ...]):
+        if self._connection is None:
+            return
+        self._connection.execute("INSERT OR REPLACE INTO alexander VALUES (?, ?)",
+                                 (key, ','.join(str(c) for c in coefficients)))
+        self._uncommitted += 1
+        if self._uncommitted >= self.commit_every:
+            self.flush()
+
+    # ---------- computing through the cache ----------
+    def alexander_coefficients(self, diagram) -> tuple[int, ...]:
+        """
+        Returns the Alexander polynomial coefficients of the diagram, computing and caching them on a miss.
+        ClaspDiagram inputs get the coefficients seeded, so their .alexander_coefficients and .alexander are free.
+        """
+        key = self.key(diagram)
+        coefficients = self._get(key)
+        if coefficients is None:
+            if isinstance(diagram, ClaspDiagram):
+                coefficients = diagram.alexander_coefficients
+            else:
+                packed = _as_packed(diagram)
+                le_matrix = symbolics.get_le_matrix_from_arrays(packed.starts, packed.ends, packed.heights, packed.signs)
+                coefficients = symbolics.get_alexander_coefficients(le_matrix)
+            self._insert(key, coefficients)
+            self._write(key, coefficients)
+        elif isinstance(diagram, ClaspDiagram) and 'alexander_coefficients' not in diagram.__dict__:
+            diagram._seed(alexander_coefficients=coefficients)
+        return coefficients
+
+    def alexander(self, diagram) -> sp.Expr:
+        """
+        Returns the Alexander polynomial of the diagram as a sympy expression, through the cache.
+        """
+        return symbolics.coefficients_to_polynomial(self.alexander_coefficients(diagram))
+
+    # ---------- bookkeeping ----------
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        return {'entries': len(self._entries), 'max_entries': self.max_entries, 'hits': self.hits,
+                'misses': self.misses, 'disk_hits': self.disk_hits, 'evictions': self.evictions,
+                'hit_rate': self.hit_rate}
+
+    def clear(self):
+        """
+        Empties the in-memory tier (the sqlite tier is kept) and resets the counters.
+        """
+        self._entries.clear()
+        self.hits = self.misses = self.disk_hits = self.evictions = 0
+
+    def flush(self):
+        if self._connection is not None:
+            self._connection.commit()
+            self._uncommitted = 0
+
+    def close(self):
+        if self._connection is not None:
+            self.flush()
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,120 @@
+from __future__ import annotations
+from clasp_diagrams.objects import ChordForMatrix, ClaspDiagram
+from clasp_diagrams.packed import PackedClaspDiagram
+import numpy as np
+import struct
+
+# ==================== Canonical form of a clasp diagram ====================
+# A diagram is read as a sequence over its 2n points: for every point p, the triple
+# (offset to the other endpoint of its chord mod 2n, height of its chord, 1 if the chord is positive else 0).
+# Offsets are relative, so rotating the base point of the circle just rotates this sequence.
+# The canonical form is the lexicographically minimal sequence over all rotations and, optionally,
+# over cyclic height shifts (move B) and the reflection of the circle (p -> 2n - 1 - p).
+# Reflecting the points alone changes the knot, so the reflection also flips the sign of every chord,
+# which keeps the Alexander polynomial.
+
+def _point_sequence(packed: PackedClaspDiagram) -> np.ndarray:
+    """
+    Returns the (2n, 3) sequence of (offset, height, positive) triples of the diagram.
+
+    Time complexity: O(n)
+    Space complexity: O(n)
+    """
+    m = 2 * len(packed)
+    partner = np.empty(m, dtype=np.int64)
+    partner[packed.starts] = packed.ends
+    partner[packed.ends] = packed.starts
+
+    sequence = np.empty((m, 3), dtype=np.int64)
+    sequence[:, 0] = (partner - np.arange(m)) % m
+    sequence[:, 1] = packed.heights[packed.point_to_chord]
+    sequence[:, 2] = packed.signs[packed.point_to_chord] > 0
+    return sequence
+
+def canonical_sequence(packed: PackedClaspDiagram, *, b_shifts: bool = False, reflection: bool = False) -> np.ndarray:
+    """
+    Returns the lexicographically minimal point sequence of the diagram under rotations
+    (and optionally B-shifts and reflection).
+
+    With B-shifts, only the shift that brings the height at point 0 to 1 can be minimal,
+    so there is a single candidate per rotation.
+
+    Time complexity: O(n²)
+    Space complexity: O(n²)
+    """
+    n = len(packed)
+    if n == 0:
+        return np.empty((0, 3), dtype=np.int64)
+    m = 2 * n
+
+    sequences = [_point_sequence(packed)]
+    if reflection:
+        reflected = sequences[0][::-1].copy()
+        reflected[:, 0] = (m - reflected[:, 0]) % m
+        reflected[:, 2] = 1 - reflected[:, 2] # Flip the signs
+        sequences.append(reflected)
+
+    rotations = (np.arange(m)[:, None] + np.arange(m)[None, :]) % m # Row r starts at point r
+    candidates = np.concatenate([sequence[rotations] for sequence in sequences]) # (K, 2n, 3)
+
+    if b_shifts:
+        shift = 1 - candidates[:, :1, 1] # Per candidate, the shift bringing the first height to 1
+        candidates[:, :, 1] = (candidates[:, :, 1] - 1 + shift) % n + 1
+
+    flat = candidates.reshape(len(candidates), -1)
+    best = np.lexsort(flat.T[::-1])[0]
+    return candidates[best]
+
+def _sequence_to_packed(sequence: np.ndarray) -> PackedClaspDiagram:
+    """
+    Rebuilds the packed diagram (chords sorted by start point) described by a point sequence.
+    """
+    m = len(sequence)
+    points = np.arange(m)
+    starts = points[points + sequence[:, 0] < m]
+    ends = starts + sequence[starts, 0]
+    signs = np.where(sequence[starts, 2] == 1, 1, -1)
+    return PackedClaspDiagram.from_arrays(starts, ends, sequence[starts, 1], signs)
+
+def _as_packed(diagram) -> PackedClaspDiagram:
+    if isinstance(diagram, PackedClaspDiagram):
+        return diagram
+    if isinstance(diagram, ClaspDiagram):
+        return diagram.packed
+    return PackedClaspDiagram.from_matrix(diagram)
+
+def canonical_matrix(diagram, *, b_shifts: bool = False, reflection: bool = False) -> tuple[ChordForMatrix]:
+    """
+    Returns the canonical representative (as a clasp matrix) of a ClaspDiagram, PackedClaspDiagram or clasp matrix,
+    under rotation of the 2n points and, optionally, B-shifts and reflection.
+
+    Time complexity: O(n²)
+    Space complexity: O(n²)
+    """
+    sequence = canonical_sequence(_as_packed(diagram), b_shifts=b_shifts, reflection=reflection)
+    return _sequence_to_packed(sequence).matrix
+
+def canonical_key(diagram, *, b_shifts: bool = False, reflection: bool = False) -> bytes:
+    """
+    Returns a compact bytes key that is equal for two diagrams iff they have the same canonical form.
+    Suitable for dedup sets and dictionaries.
+
+    The key is the number of chords (uint32) followed by the canonical point sequence as uint16
+    (uint32 for diagrams with more than 32767 chords).
+
+    Time complexity: O(n²)
+    Space complexity: O(n²)
+    """
+    packed = _as_packed(diagram)
+    n = len(packed)
+    sequence = canonical_sequence(packed, b_shifts=b_shifts, reflection=reflection)
+    dtype = '<u2' if 2 * n <= np.iinfo(np.uint16).max else '<u4'
+    return struct.pack('<I', n) + sequence.astype(dtype).tobytes()
+
+def is_canonical(diagram, *, b_shifts: bool = False, reflection: bool = False) -> bool:
+    """
+    Checks whether the diagram is its own canonical representative.
+    """
+    packed = _as_packed(diagram)
+    sequence = canonical_sequence(packed, b_shifts=b_shifts, reflection=reflection)
+    return np.array_equal(sequence, _point_sequence(packed))
@@ -0,0 +1,175 @@
+from __future__ import annotations
+from clasp_diagrams.packed import PackedClaspDiagram, CHORD_DTYPE
+from clasp_diagrams.canonical import _as_packed
+from array import array
+from typing import Iterable, Iterator
+import numpy as np
+import os
+
+# ==================== Memory-mapped corpus of diagrams ====================
+# A corpus is a directory of .npy files:
+#   chords.npy   CHORD_DTYPE, the chords of every diagram, one diagram after the other
+#   offsets.npy  int64, count + 1 entries; diagram i is chords[offsets[i]:offsets[i + 1]]
+#   <name>.npy   optional invariant columns, one row per diagram
+#   <name>.values.npy + <name>.offsets.npy  optional variable-length invariant columns (e.g. Alexander coefficients)
+# Files are opened with mmap_mode='r', so worker processes opening the same corpus share the pages
+# of the OS cache instead of loading their own copies.
+
+_CHORDS, _OFFSETS = 'chords.npy', 'offsets.npy'
+_RESERVED_NAMES = ('chords', 'offsets')
+_RAGGED_SUFFIXES = ('.values', '.offsets')
+
+def _save_atomic(path: str, values: np.ndarray) -> None:
+    """
+    Saves an array as a .npy file through a temporary file in the same directory, so that memory maps
+    of the previous contents stay valid.
+    """
+    temporary = f'{path}.tmp'
+    with open(temporary, 'wb') as file:
+        np.save(file, values)
+    os.replace(temporary, path)
+
+class MemmapCorpus:
+    """
+    Read-only corpus of diagrams backed by numpy memory maps. corpus[i] is a PackedClaspDiagram whose
+    chords are a view on the memory map (no copy). Pickling a corpus only pickles its path, so it can be
+    handed to worker processes cheaply.
+    """
+    def __init__(self, path: str | os.PathLike):
+        self.path = os.fspath(path)
+        self.chords = np.load(os.path.join(self.path, _CHORDS), mmap_mode='r')
+        self.offsets = np.load(os.path.join(self.path, _OFFSETS), mmap_mode='r')
+        self._ragged = {} # name -> (values, offsets) memory maps of the variable-length columns read so far
+        if self.chords.dtype != CHORD_DTYPE:
+            raise ValueError(f"{self.path} is not a clasp diagram corpus (chords have dtype {self.chords.dtype}).")
+
+    @classmethod
+    def create(cls, path: str | os.PathLike, diagrams: Iterable) -> MemmapCorpus:
+        """
+        Writes the diagrams (ClaspDiagram, PackedClaspDiagram or clasp matrices) into a new corpus directory.
+        Chords are streamed to disk, so the diagrams can come from a generator of any length.
+
+        Time complexity: O(total chords)
+        """
+        path = os.fspath(path)
+        os.makedirs(path, exist_ok=True)
+        raw_path = os.path.join(path, 'chords.raw')
+        offsets = array('q', [0])
+        with open(raw_path, 'wb') as raw:
+            for diagram in diagrams:
+                chords = _as_packed(diagram).chords
+                raw.write(chords.astype(CHORD_DTYPE, copy=False).tobytes())
+                offsets.append(offsets[-1] + len(chords))
+
+        # The number of chords is only known now: copy them into a .npy file of the right shape
+        chords = np.lib.format.open_memmap(os.path.join(path, _CHORDS), mode='w+', dtype=CHORD_DTYPE, shape=(offsets[-1],))
+        if offsets[-1]:
+            chords[:] = np.memmap(raw_path, dtype=CHORD_DTYPE, mode='r')
+        chords.flush()
+        del chords
+        os.remove(raw_path)
+        np.save(os.path.join(path, _OFFSETS), np.frombuffer(offsets, dtype=np.int64))
+        return cls(path)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, idx: int) -> PackedClaspDiagram:
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError(f"Corpus index {idx} out of range.")
+        return PackedClaspDiagram(self.chords[self.offsets[idx]:self.offsets[idx + 1]])
+
+    def __iter__(self) -> Iterator[PackedClaspDiagram]:
+        for idx in range(len(self)):
+            yield self[idx]
+
+    @property
+    def num_chords(self) -> np.ndarray:
+        """
+        Number of chords of every diagram.
+        """
+        return np.diff(self.offsets)
+
+    def __reduce__(self):
+        return self.__class__, (self.path,)
+
+    # ---------- invariant columns ----------
+    @staticmethod
+    def _check_column_name(name: str) -> None:
+        if name in _RESERVED_NAMES or name.endswith(_RAGGED_SUFFIXES):
+            raise ValueError(f"Invalid column name ({name}). Must not be one of {_RESERVED_NAMES} "
+                             f"or end with one of {_RAGGED_SUFFIXES}.")
+
+    def _column_path(self, name: str, suffix: str = '') -> str:
+        return os.path.join(self.path, f'{name}{suffix}.npy')
+
+    def columns(self) -> list[str]:
+        names = set()
+        for file in os.listdir(self.path):
+            if file in (_CHORDS, _OFFSETS) or not file.endswith('.npy'):
+                continue
+            name = file[:-len('.npy')]
+            for suffix in _RAGGED_SUFFIXES:
+                if name.endswith(suffix):
+                    name = name[:-len(suffix)]
+            names.add(name)
+        return sorted(names)
+
+    def add_column(self, name: str, values) -> np.ndarray:
+        """
+        Stores a fixed-size invariant column (one row per diagram) and returns it memory-mapped.
+        """
+        self._check_column_name(name)
+        values = np.asarray(values)
+        if len(values) != len(self):
+            raise ValueError(f"Column {name} has {len(values)} rows, but the corpus has {len(self)} diagrams.")
+        _save_atomic(self._column_path(name), values)
+        return self.column(name)
+
+    def add_ragged_column(self, name: str, rows: Iterable) -> None:
+        """
+        Stores a variable-length invariant column, e.g. the Alexander coefficients of every diagram.
+        """
+        self._check_column_name(name)
+        values, offsets = array('q'), array('q', [0])
+        for row in rows:
+            values.extend(row)
+            offsets.append(len(values))
+        if len(offsets) - 1 != len(self):
+            raise ValueError(f"Column {name} has {len(offsets) - 1} rows, but the corpus has {len(self)} diagrams.")
+        self._ragged.pop(name, None) # Drop the memory maps of the previous contents
+        _save_atomic(self._column_path(name, '.values'), np.frombuffer(values, dtype=np.int64))
+        _save_atomic(self._column_path(name, '.offsets'), np.frombuffer(offsets, dtype=np.int64))
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        A fixed-size invariant column, memory-mapped.
+        """
+        return np.load(self._column_path(name), mmap_mode='r')
+
+    def ragged_row(self, name: str, idx: int) -> np.ndarray:
+        """
+        Row `idx` of a variable-length invariant column (a view on the memory map).
+        The column files are memory-mapped on the first call, and the maps are reused afterwards.
+        """
+        if name not in self._ragged:
+            self._ragged[name] = (np.load(self._column_path(name, '.values'), mmap_mode='r'),
+                                  np.load(self._column_path(name, '.offsets'), mmap_mode='r'))
+        values, offsets = self._ragged[name]
+        return values[offsets[idx]:offsets[idx + 1]]
+
+    def compute_alexander(self, **kwargs) -> None:
+        """
+        Computes the Alexander coefficients of every diagram with batch.iter_invariants (kwargs are passed on)
+        and stores them as the ragged column 'alexander', along with the fixed column 'alexander_degree'.
+        """
+        from clasp_diagrams.batch import compute_invariants
+
+        coefficients = compute_invariants(iter(self), **kwargs)
+        self.add_ragged_column('alexander', coefficients)
+        self.add_column('alexander_degree', np.array([len(c) - 1 for c in coefficients], dtype=np.int32))
+
+    def alexander_coefficients(self, idx: int) -> tuple[int, ...]:
+        return tuple(self.ragged_row('alexander', idx).tolist())
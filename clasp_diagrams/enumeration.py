@@ -0,0 +1,172 @@
+from __future__ import annotations
+from clasp_diagrams.objects import ClaspDiagram
+from clasp_diagrams.packed import PackedClaspDiagram, CHORD_DTYPE
+from clasp_diagrams.canonical import is_canonical
+from itertools import product
+from math import factorial
+from typing import Iterator
+import numpy as np
+
+# ==================== Exhaustive enumeration of clasp diagrams ====================
+# Every clasp matrix with n chords is a perfect matching of the 2n points, a permutation of the heights
+# 1..n and a sign per chord, so there are (2n - 1)!!·n!·2ⁿ of them. They are ranked in mixed radix:
+#   index = (matching rank · n! + height permutation rank) · 2ⁿ + sign rank
+# where matchings are ranked by the choice of partner of the lowest free point (among the remaining ones),
+# height permutations in lexicographic order and signs as bits ('+' = 0, first chord most significant).
+# An index identifies a diagram, so an enumeration can be resumed from the index after the last diagram
+# seen, and split into shards of contiguous index ranges.
+
+SYMMETRIES = (None, 'rotation', 'rotation+b_shift')
+
+def _double_factorial(k: int) -> int:
+    result = 1
+    while k > 1:
+        result, k = result * k, k - 2
+    return result
+
+def count_diagrams(n: int) -> int:
+    """
+    Number of clasp matrices with n chords: (2n - 1)!!·n!·2ⁿ.
+    """
+    return _double_factorial(2 * n - 1) * factorial(n) * 2 ** n
+
+def unrank_matching(n: int, rank: int) -> list[tuple[int, int]]:
+    """
+    The matching of rank `rank` among the (2n - 1)!! perfect matchings of 2n points, as (start, end)
+    chords sorted by start point.
+
+    Time complexity: O(n²)
+    """
+    free = list(range(2 * n))
+    radix = _double_factorial(2 * n - 1)
+    chords = []
+    while free:
+        radix //= len(free) - 1
+        choice, rank = divmod(rank, radix)
+        start = free.pop(0)
+        chords.append((start, free.pop(choice)))
+    return chords
+
+def unrank_permutation(n: int, rank: int) -> list[int]:
+    """
+    The permutation of rank `rank` among the n! permutations of 1..n in lexicographic order,
+    read from the factorial number system (Lehmer code) digits of the rank.
+
+    Time complexity: O(n²)
+    """
+    remaining = list(range(1, n + 1))
+    permutation = []
+    for k in range(n - 1, -1, -1):
+        digit, rank = divmod(rank, factorial(k))
+        permutation.append(remaining.pop(digit))
+    return permutation
+
+def _permutations_from(n: int, rank: int) -> Iterator[tuple[int, ...]]:
+    """
+    Yields the permutations of 1..n in lexicographic order, starting from the one of rank `rank`.
+
+    Time complexity: O(n²) to start, then O(n) per permutation
+    """
+    permutation = unrank_permutation(n, rank)
+    while True:
+        yield tuple(permutation)
+        # Next permutation: swap the last ascent with the smallest larger entry after it, reverse the tail
+        i = n - 2
+        while i >= 0 and permutation[i] > permutation[i + 1]:
+            i -= 1
+        if i < 0:
+            return
+        j = n - 1
+        while permutation[j] < permutation[i]:
+            j -= 1
+        permutation[i], permutation[j] = permutation[j], permutation[i]
+        permutation[i + 1:] = permutation[:i:-1]
+
+def unrank_diagram(n: int, index: int) -> PackedClaspDiagram:
+    """
+    The diagram with the given index in the enumeration order.
+
+    Time complexity: O(n²)
+    """
+    if not 0 <= index < count_diagrams(n):
+        raise ValueError(f"Invalid index {index} for n={n}. Must be in [0, {count_diagrams(n)}).")
+    rest, sign_rank = divmod(index, 2 ** n)
+    matching_rank, height_rank = divmod(rest, factorial(n))
+    heights = unrank_permutation(n, height_rank)
+    signs = [-1 if sign_rank >> (n - 1 - k) & 1 else 1 for k in range(n)]
+    return _packed(unrank_matching(n, matching_rank), heights, signs)
+
+def _packed(matching, heights, signs) -> PackedClaspDiagram:
+    chords = np.empty(len(matching), dtype=CHORD_DTYPE)
+    if len(matching):
+        chords['start_point'], chords['end_point'] = zip(*matching)
+    chords['height'] = heights
+    chords['sign'] = signs
+    return PackedClaspDiagram(chords)
+
+def shard_range(n: int, shard: int, num_shards: int) -> tuple[int, int]:
+    """
+    The [start, stop) index range of shard `shard` (0-indexed) out of num_shards.
+    """
+    if not 0 <= shard < num_shards:
+        raise ValueError(f"Invalid shard {shard}. Must be in [0, {num_shards}).")
+    total = count_diagrams(n)
+    return total * shard // num_shards, total * (shard + 1) // num_shards
+
+def enumerate_diagrams(n: int, *, start: int = 0, stop: int | None = None,
+                       shard: int | None = None, num_shards: int | None = None,
+                       symmetry: str | None = None, with_index: bool = False,
+                       output: str = 'packed') -> Iterator:
+    """
+    Lazily yields every clasp diagram with n chords whose index is in [start, stop).
+
+    Parameters
+    ----------
+    start, stop : int
+        Index range (stop defaults to count_diagrams(n)). To resume an interrupted enumeration,
+        pass start = last index seen + 1.
+    shard, num_shards : int | None
+        Only enumerate shard `shard` of num_shards contiguous index ranges; start and stop are then
+        relative to the shard. Both or neither must be given, with 0 <= shard < num_shards.
+    symmetry : str | None
+        None yields every diagram. 'rotation' only yields the canonical representative of each class
+        under rotation, and 'rotation+b_shift' under rotation and B-shifts (see canonical.is_canonical).
+    with_index : bool
+        If True, yields (index, diagram) pairs, e.g. to checkpoint the enumeration.
+    output : str
+        'packed' yields PackedClaspDiagram instances, 'clasp' yields ClaspDiagram instances.
+
+    Time complexity: O(n) per diagram (plus O(n²) per diagram with a symmetry filter)
+    """
+    if symmetry not in SYMMETRIES:
+        raise ValueError(f"Invalid symmetry ({symmetry}). Must be one of {SYMMETRIES}.")
+    if output not in ('packed', 'clasp'):
+        raise ValueError(f"Invalid output ({output}). Must be 'packed' or 'clasp'.")
+    if (shard is None) != (num_shards is None):
+        raise ValueError(f"shard ({shard}) and num_shards ({num_shards}) must be given together.")
+
+    low, high = (0, count_diagrams(n)) if shard is None else shard_range(n, shard, num_shards)
+    start, stop = low + start, high if stop is None else min(high, low + stop)
+    if start >= stop:
+        return
+
+    num_signs, num_heights = 2 ** n, factorial(n)
+    sign_vectors = list(product((1, -1), repeat=n))
+    index = start
+    matching_rank, rest = divmod(start, num_heights * num_signs)
+    height_rank, sign_rank = divmod(rest, num_signs)
+
+    while index < stop:
+        matching = unrank_matching(n, matching_rank)
+        for heights in _permutations_from(n, height_rank):
+            for signs in sign_vectors[sign_rank:]:
+                if index >= stop:
+                    return
+                packed = _packed(matching, heights, signs)
+                if symmetry is None or is_canonical(packed, b_shifts=symmetry == 'rotation+b_shift'):
+                    diagram = packed if output == 'packed' else ClaspDiagram._from_trusted(matrix=packed.matrix)
+                    yield (index, diagram) if with_index else diagram
+                index += 1
+            sign_rank = 0
+        height_rank = 0
+        matching_rank += 1
@@ -0,0 +1,390 @@
+from __future__ import annotations
+from clasp_diagrams.objects import ClaspDiagram
+from clasp_diagrams.packed import PackedClaspDiagram
+from clasp_diagrams.exploration import apply_move
+from clasp_diagrams.generators import random_chord_batch
+import clasp_diagrams.moves as moves
+from typing import Callable
+import numpy as np
+
+# ==================== Reinforcement learning environments ====================
+# Gym-style environments (reset/step) whose goal is to unknot a clasp diagram, i.e. to erase all of its chords.
+# Both follow the gymnasium API: reset() -> (observation, info), step(action) -> (observation, reward,
+# terminated, truncated, info), without depending on gymnasium itself.
+#
+# Observations are dicts of NumPy arrays, padded to `max_chords`:
+#   - 'l_matrix': (N, N) int8, the L-matrix.
+#   - 'signs': (N,) int8, +1/-1 (0 for padding).
+#   - 'heights': (N,) int32 (0 for padding).
+#   - 'num_chords': () int32.
+# info['action_mask'] is a boolean vector over the actions, True for the legal ones.
+
+MOVE_A, MOVE_B, MOVE_INVERSE_B, MOVE_C1, MOVE_INVERSE_C1 = range(5)
+_KIND_TO_MOVE_NUM = {MOVE_A: 1, MOVE_B: 2, MOVE_INVERSE_B: -2, MOVE_C1: 3, MOVE_INVERSE_C1: -3}
+
+# Fixed-size discrete encoding of the moves, for diagrams with at most max_chords chords.
+class ClaspActions:
+    """
+    Enumerates, in a fixed order, every move that can be applied to a diagram with at most N = max_chords chords:
+        - Move A on every pair of chords i < j: N(N - 1)/2 actions.
+        - Moves B and -B: 2 actions.
+        - Move C1 on every chord i: N actions.
+        - Move -C1 after every point, with every sign and height, for diagrams with less than N chords:
+          (2N - 1)·2·N actions, plus 2N actions with reverse_points=True.
+
+    Attributes:
+        actions (list[tuple[int, dict]]):
+            The (move_num, kwargs) of every action, as accepted by ClaspDiagram.move.
+        kind, i, j, point, sign, height, reverse (np.ndarray):
+            The same actions, as arrays (kind is one of MOVE_A, ..., MOVE_INVERSE_C1; sign is +1/-1).
+    """
+    def __init__(self, max_chords: int):
+        if max_chords < 1:
+            raise ValueError(f"Invalid max_chords={max_chords}. Must be at least 1.")
+        N = self.max_chords = max_chords
+
+        rows = [(MOVE_A, i, j, 0, 0, 0, False) for i in range(1, N + 1) for j in range(i + 1, N + 1)]
+        rows += [(MOVE_B, 0, 0, 0, 0, 0, False), (MOVE_INVERSE_B, 0, 0, 0, 0, 0, False)]
+        rows += [(MOVE_C1, i, 0, 0, 0, 0, False) for i in range(1, N + 1)]
+        rows += [(MOVE_INVERSE_C1, 0, 0, point, sign, height, False)
+                 for point in range(-1, 2 * N - 2) for sign in (1, -1) for height in range(1, N + 1)]
+        rows += [(MOVE_INVERSE_C1, 0, 0, -1, sign, height, True) for sign in (1, -1) for height in range(1, N + 1)]
+
+        columns = list(zip(*rows))
+        self.kind, self.i, self.j, self.point, self.sign, self.height = (np.array(c, dtype=np.int32) for c in columns[:6])
+        self.reverse = np.array(columns[6], dtype=bool)
+        self.actions = [self._decode(k) for k in range(len(rows))]
+        self._index = {self._signature(*action): k for k, action in enumerate(self.actions)}
+
+    def _decode(self, k: int) -> tuple[int, dict]:
+        kind = int(self.kind[k])
+        if kind == MOVE_A:
+            return 1, {'i': int(self.i[k]), 'j': int(self.j[k])}
+        if kind == MOVE_C1:
+            return 3, {'i': int(self.i[k])}
+        if kind == MOVE_INVERSE_C1:
+            kwargs = {'after_point': int(self.point[k]), 'new_sign': '+' if self.sign[k] > 0 else '-',
+                      'new_height': int(self.height[k])}
+            if self.reverse[k]:
+                kwargs['reverse_points'] = True
+            return -3, kwargs
+        return _KIND_TO_MOVE_NUM[kind], {}
+
+    @staticmethod
+    def _signature(move_num: int, kwargs: dict) -> tuple:
+        if kwargs.get('reverse_points'):
+            kwargs = {**kwargs, 'after_point': -1}
+        return move_num, tuple(sorted(kwargs.items()))
+
+    def __len__(self):
+        return len(self.actions)
+
+    def index(self, move_num: int, kwargs: dict) -> int:
+        """
+        Returns the action index of a (move_num, kwargs) move. Raises KeyError if it is not encoded.
+        """
+        return self._index[self._signature(move_num, kwargs)]
+
+    def mask(self, clasp: ClaspDiagram) -> np.ndarray:
+        """
+        Boolean mask of the legal actions on a diagram, derived from moves.legal_moves.
+        """
+        mask = np.zeros(len(self), dtype=bool)
+        n = len(clasp.matrix)
+        move_nums = (1, 2, -2, 3, -3) if n < self.max_chords else (1, 2, -2, 3)
+        for move in moves.legal_moves(clasp, move_nums=move_nums):
+            mask[self.index(*move)] = True
+        return mask
+
+# ==================== Single environment ====================
+def random_packed_diagram(n: int, rng: np.random.Generator) -> PackedClaspDiagram:
+    """
+    A random diagram with n chords (see generators.random_chord_batch).
+    """
+    return PackedClaspDiagram(random_chord_batch(1, n, rng)[0])
+
+class ClaspEnv:
+    """
+    Environment around a single ClaspDiagram. Actions are indices into ClaspActions(max_chords) and are applied
+    with ClaspDiagram.move (with the isotopy check off).
+
+    The reward of a step is the number of chords erased by it minus step_penalty. An episode terminates when
+    the diagram has no chords, and is truncated after max_steps steps.
+
+    Parameters
+    ----------
+    max_chords : int
+        Maximum number of chords (size of the padded observations and of the action space).
+    min_chords : int
+        Random initial diagrams have between min_chords and max_chords chords.
+    initial : callable | None
+        rng -> ClaspDiagram, to choose the initial diagrams instead.
+    """
+    def __init__(self, max_chords: int = 10, *, min_chords: int = 1, max_steps: int = 100,
+                 step_penalty: float = 0.01, initial: Callable[[np.random.Generator], ClaspDiagram] | None = None,
+                 seed: int | None = None):
+        self.actions = ClaspActions(max_chords)
+        self.max_chords = max_chords
+        self.min_chords = min_chords
+        self.max_steps = max_steps
+        self.step_penalty = step_penalty
+        self.initial = initial
+        self.rng = np.random.default_rng(seed)
+        self.clasp = None
+        self.steps = 0
+
+    def reset(self, *, seed: int | None = None, clasp: ClaspDiagram | None = None) -> tuple[dict, dict]:
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        if clasp is None:
+            if self.initial is not None:
+                clasp = self.initial(self.rng)
+            else:
+                n = int(self.rng.integers(self.min_chords, self.max_chords + 1))
+                clasp = ClaspDiagram._from_trusted(matrix=random_packed_diagram(n, self.rng).matrix)
+        if len(clasp.matrix) > self.max_chords:
+            raise ValueError(f"Diagram has {len(clasp.matrix)} chords, more than max_chords={self.max_chords}.")
+        self.clasp = clasp
+        self.steps = 0
+        return self.observation(), {'action_mask': self.action_mask()}
+
+    def step(self, action: int) -> tuple[dict, float, bool, bool, dict]:
+        if self.clasp is None:
+            raise RuntimeError("Call reset() before step().")
+        mask = self.action_mask()
+        if not mask[action]:
+            raise ValueError(f"Illegal action {action}: {self.actions.actions[action]}.")
+
+        n = len(self.clasp.matrix)
+        with moves.isotopy_check('off'):
+            self.clasp = apply_move(self.clasp, *self.actions.actions[action])
+        self.steps += 1
+
+        reward = n - len(self.clasp.matrix) - self.step_penalty
+        terminated = len(self.clasp.matrix) == 0
+        truncated = not terminated and self.steps >= self.max_steps
+        return self.observation(), reward, terminated, truncated, {'action_mask': self.action_mask()}
+
+    def action_mask(self) -> np.ndarray:
+        return self.actions.mask(self.clasp)
+
+    def observation(self) -> dict:
+        N, n = self.max_chords, len(self.clasp.matrix)
+        packed = self.clasp.packed
+        observation = {'l_matrix': np.zeros((N, N), dtype=np.int8),
+                       'signs': np.zeros(N, dtype=np.int8),
+                       'heights': np.zeros(N, dtype=np.int32),
+                       'num_chords': np.int32(n)}
+        observation['l_matrix'][:n, :n] = self.clasp.l_matrix
+        observation['signs'][:n] = packed.signs
+        observation['heights'][:n] = packed.heights
+        return observation
+
+# ==================== Vectorized environment ====================
+class VectorClaspEnv:
+    """
+    Steps num_envs diagrams at once. The diagrams are kept as padded (num_envs, max_chords) arrays of start points,
+    end points, heights and signs, sorted by start point, and the moves are applied directly on these arrays,
+    without creating ClaspDiagram objects. Finished episodes are reset automatically; the final observation of
+    an episode is in info['final_observation'].
+
+    Same actions, rewards and observations as ClaspEnv, batched along the first axis.
+    """
+    def __init__(self, num_envs: int, max_chords: int = 10, *, min_chords: int = 1, max_steps: int = 100,
+                 step_penalty: float = 0.01, seed: int | None = None):
+        self.num_envs = num_envs
+        self.max_chords = max_chords
+        self.min_chords = min_chords
+        self.max_steps = max_steps
+        self.step_penalty = step_penalty
+        self.actions = ClaspActions(max_chords)
+        self.rng = np.random.default_rng(seed)
+
+        shape = (num_envs, max_chords)
+        self.starts = np.zeros(shape, dtype=np.int32)
+        self.ends = np.zeros(shape, dtype=np.int32)
+        self.heights = np.zeros(shape, dtype=np.int32)
+        self.signs = np.zeros(shape, dtype=np.int8)
+        self.num_chords = np.zeros(num_envs, dtype=np.int32)
+        self.steps = np.zeros(num_envs, dtype=np.int32)
+
+    # ---------- state handling ----------
+    def set_diagram(self, env: int, packed: PackedClaspDiagram):
+        """
+        Loads a diagram into one of the environments.
+        """
+        n = len(packed)
+        if n > self.max_chords:
+            raise ValueError(f"Diagram has {n} chords, more than max_chords={self.max_chords}.")
+        self._clear(np.array([env]))
+        self.starts[env, :n], self.ends[env, :n] = packed.starts, packed.ends
+        self.heights[env, :n], self.signs[env, :n] = packed.heights, packed.signs
+        self.num_chords[env] = n
+        self.steps[env] = 0
+
+    def get_diagram(self, env: int) -> PackedClaspDiagram:
+        n = self.num_chords[env]
+        return PackedClaspDiagram.from_arrays(self.starts[env, :n], self.ends[env, :n],
+                                              self.heights[env, :n], self.signs[env, :n])
+
+    def _clear(self, envs: np.ndarray):
+        # Padding: points past every real point (keeps rows sorted by start), zero heights and signs
+        self.starts[envs] = 2 * self.max_chords + 2 * np.arange(self.max_chords)
+        self.ends[envs] = self.starts[envs] + 1
+        self.heights[envs] = 0
+        self.signs[envs] = 0
+
+    def _reset_envs(self, envs: np.ndarray):
+        for env in envs.tolist():
+            n = int(self.rng.integers(self.min_chords, self.max_chords + 1))
+            self.set_diagram(env, random_packed_diagram(n, self.rng))
+
+    def reset(self, *, seed: int | None = None) -> tuple[dict, dict]:
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        self._reset_envs(np.arange(self.num_envs))
+        return self.observation(), {'action_mask': self.action_mask()}
+
+    # ---------- observations and masks ----------
+    def _valid(self) -> np.ndarray:
+        return np.arange(self.max_chords)[None, :] < self.num_chords[:, None]
+
+    def _intersections(self) -> np.ndarray:
+        s, e = self.starts, self.ends
+        crosses = (s[:, :, None] < s[:, None, :]) & (s[:, None, :] < e[:, :, None]) & (e[:, :, None] < e[:, None, :])
+        return crosses | crosses.transpose(0, 2, 1)
+
+    def observation(self) -> dict:
+        h = self.heights
+        over = self._intersections() & (h[:, :, None] > h[:, None, :])
+        upper = np.triu(np.ones((self.max_chords, self.max_chords), dtype=bool), 1)
+        l_matrix = np.where(over, np.where(upper, 1, -1), 0).astype(np.int8)
+        return {'l_matrix': l_matrix, 'signs': self.signs.copy(), 'heights': self.heights.copy(),
+                'num_chords': self.num_chords.copy()}
+
+    def action_mask(self) -> np.ndarray:
+        """
+        (num_envs, num_actions) boolean mask of the legal actions, computed on the padded arrays.
+        """
+        a = self.actions
+        n = self.num_chords[:, None]
+        valid = self._valid()
+        mask = np.zeros((self.num_envs, len(a)), dtype=bool)
+
+        # Move A: non-intersecting chords with consecutive heights (mod n)
+        kind_a = np.flatnonzero(a.kind == MOVE_A)
+        i, j = a.i[kind_a] - 1, a.j[kind_a] - 1
+        h_i, h_j = self.heights[:, i], self.heights[:, j]
+        difference = np.mod(h_i - h_j, np.maximum(n, 1))
+        consecutive = (difference == 1) | (difference == n - 1)
+        disjoint = ~self._intersections()[:, i, j]
+        mask[:, kind_a] = valid[:, i] & valid[:, j] & consecutive & disjoint & (n >= 2)
+
+        # Moves B and -B always apply
+        mask[:, a.kind == MOVE_B] = True
+        mask[:, a.kind == MOVE_INVERSE_B] = True
+
+        # Move C1: chords that close immediately
+        kind_c1 = np.flatnonzero(a.kind == MOVE_C1)
+        closes = (self.ends - self.starts == 1) | ((self.starts == 0) & (self.ends == 2 * n - 1))
+        mask[:, kind_c1] = (valid & closes)[:, a.i[kind_c1] - 1]
+
+        # Move -C1: points and heights within the current diagram, with room for one more chord
+        kind_ic1 = np.flatnonzero(a.kind == MOVE_INVERSE_C1)
+        fits = (a.point[kind_ic1][None, :] < 2 * n) & (a.height[kind_ic1][None, :] <= n + 1)
+        mask[:, kind_ic1] = fits & (n < self.max_chords)
+        return mask
+
+    # ---------- moves on the padded arrays ----------
+    def _exchange_heights(self, envs, i, j):
+        h_i, h_j = self.heights[envs, i].copy(), self.heights[envs, j].copy()
+        self.heights[envs, i], self.heights[envs, j] = h_j, h_i
+
+    def _cyclic_height_shift(self, envs, shift):
+        n = self.num_chords[envs][:, None]
+        valid = self._valid()[envs]
+        shifted = np.mod(self.heights[envs] - 1 + shift, np.maximum(n, 1)) + 1
+        self.heights[envs] = np.where(valid, shifted, 0)
+
+    def _resort(self, envs):
+        order = np.argsort(self.starts[envs], axis=1, kind='stable')
+        for field in (self.starts, self.ends, self.heights, self.signs):
+            field[envs] = np.take_along_axis(field[envs], order, axis=1)
+
+    def _erase_isolated_chord(self, envs, rows):
+        sp, ep, height = self.starts[envs, rows], self.ends[envs, rows], self.heights[envs, rows]
+        valid = self._valid()[envs]
+        for field in (self.starts, self.ends):
+            points = field[envs]
+            shifted = points - (points > sp[:, None]) - (points > ep[:, None])
+            field[envs] = np.where(valid, shifted, points)
+        heights = self.heights[envs]
+        self.heights[envs] = np.where(valid & (heights > height[:, None]), heights - 1, heights)
+        self._clear_row(envs, rows)
+        self.num_chords[envs] -= 1
+
+    def _clear_row(self, envs, rows):
+        # Moves the row past the last chord (keeping rows sorted by start) and makes it padding
+        self.starts[envs, rows] = 4 * self.max_chords + 2 * rows
+        self.ends[envs, rows] = self.starts[envs, rows] + 1
+        self.heights[envs, rows] = 0
+        self.signs[envs, rows] = 0
+        self._resort(envs)
+
+    def _add_isolated_chord(self, envs, points, signs, heights, reverse):
+        n = self.num_chords[envs]
+        valid = self._valid()[envs]
+        new_sp = np.where(reverse, 0, points + 1)
+        new_ep = np.where(reverse, 2 * n + 1, points + 2)
+        for field in (self.starts, self.ends):
+            old = field[envs]
+            shifted = np.where(reverse[:, None], old + 1, old + 2 * (old >= new_sp[:, None]))
+            field[envs] = np.where(valid, shifted, old)
+        old_heights = self.heights[envs]
+        self.heights[envs] = np.where(valid & (old_heights >= heights[:, None]), old_heights + 1, old_heights)
+
+        # The new chord goes in the first padding row, then rows are sorted by start point again
+        self.starts[envs, n], self.ends[envs, n] = new_sp, new_ep
+        self.heights[envs, n], self.signs[envs, n] = heights, signs
+        self.num_chords[envs] += 1
+        self._resort(envs)
+
+    def step(self, actions) -> tuple[dict, np.ndarray, np.ndarray, np.ndarray, dict]:
+        actions = np.asarray(actions)
+        if actions.shape != (self.num_envs,):
+            raise ValueError(f"Expected {self.num_envs} actions, got shape {actions.shape}.")
+        legal = self.action_mask()[np.arange(self.num_envs), actions]
+        if not np.all(legal):
+            raise ValueError(f"Illegal actions in environments {np.flatnonzero(~legal).tolist()}.")
+
+        a = self.actions
+        kind = a.kind[actions]
+        before = self.num_chords.copy()
+
+        envs = np.flatnonzero(kind == MOVE_A)
+        if len(envs):
+            self._exchange_heights(envs, a.i[actions[envs]] - 1, a.j[actions[envs]] - 1)
+        for move_kind, shift in ((MOVE_B, 1), (MOVE_INVERSE_B, -1)):
+            envs = np.flatnonzero(kind == move_kind)
+            if len(envs):
+                self._cyclic_height_shift(envs, shift)
+        envs = np.flatnonzero(kind == MOVE_C1)
+        if len(envs):
+            self._erase_isolated_chord(envs, a.i[actions[envs]] - 1)
+        envs = np.flatnonzero(kind == MOVE_INVERSE_C1)
+        if len(envs):
+            chosen = actions[envs]
+            self._add_isolated_chord(envs, a.point[chosen], a.sign[chosen], a.height[chosen], a.reverse[chosen])
+
+        self.steps += 1
+        rewards = (before - self.num_chords) - self.step_penalty
+        terminated = self.num_chords == 0
+        truncated = ~terminated & (self.steps >= self.max_steps)
+
+        info = {}
+        done = np.flatnonzero(terminated | truncated)
+        if len(done):
+            info['final_observation'] = self.observation()
+            self._reset_envs(done)
+        info['action_mask'] = self.action_mask()
+        return self.observation(), rewards, terminated, truncated, info
@@ -0,0 +1,148 @@
+from __future__ import annotations
+from clasp_diagrams.objects import ClaspDiagram
+import clasp_diagrams.moves as moves
+from clasp_diagrams.moves import ALL_MOVES
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+# A state discovered while exploring the move graph.
+@dataclass(frozen=True)
+class ExploredState:
+    clasp: ClaspDiagram
+    depth: int
+    key: bytes
+    parent_key: bytes | None
+    move: tuple[int, dict] | None
+
+def diagram_key(clasp: ClaspDiagram) -> bytes:
+    """
+    Compact key identifying a diagram exactly (its packed chords, 13 bytes per chord).
+    Use canonical.canonical_key instead to identify diagrams up to rotation (and B-shifts/reflection).
+    """
+    return clasp.packed.tobytes()
+
+# ==================== Move enumeration ====================
+def enumerate_moves(clasp: ClaspDiagram, *, move_nums=ALL_MOVES) -> Iterator[tuple[int, dict]]:
+    """
+    Yields every legal (move_num, kwargs) application of the given moves on the diagram,
+    as accepted by ClaspDiagram.move. Legality is decided by the valid_* checkers of moves.py.
+    Reference implementation: moves.legal_moves returns the same moves much faster.
+
+    Move -C1 can always be applied in (2n + 1)·2·(n + 1) + 2(n + 1) ways, which makes the move graph infinite.
+
+    n is the number of chords in the clasp diagram.
+    Time complexity: O(n²) checks
+    """
+    matrix = clasp.matrix
+    n = len(matrix)
+
+    if 1 in move_nums:
+        for i in range(1, n + 1):
+            for j in range(i + 1, n + 1):
+                try:
+                    moves.valid_exchange_heights(matrix, i, j, n)
+                except ValueError:
+                    continue
+                yield 1, {'i': i, 'j': j}
+
+    if 2 in move_nums:
+        yield 2, {}
+    if -2 in move_nums:
+        yield -2, {}
+
+    if 3 in move_nums:
+        for i in range(1, n + 1):
+            try:
+                moves.valid_erase_isolated_chord(clasp, i)
+            except ValueError:
+                continue
+            yield 3, {'i': i}
+
+    if -3 in move_nums:
+        for after_point in range(-1, 2 * n):
+            for sign in ('+', '-'):
+                for height in range(1, n + 2):
+                    yield -3, {'after_point': after_point, 'new_sign': sign, 'new_height': height}
+        for sign in ('+', '-'):
+            for height in range(1, n + 2):
+                yield -3, {'after_point': -1, 'new_sign': sign, 'new_height': height, 'reverse_points': True}
+
+def apply_move(clasp: ClaspDiagram, move_num: int, kwargs: dict) -> ClaspDiagram:
+    """
+    Applies a move and returns only the new diagram (moves C1 and -C1 also return extra information).
+    """
+    result = clasp.move(move_num=move_num, **kwargs)
+    return result[0] if isinstance(result, tuple) else result
+
+# ==================== BFS / DFS exploration ====================
+def explore(start: ClaspDiagram, *, strategy: str = 'bfs', move_nums=ALL_MOVES,
+            max_depth: int | None = None, max_states: int | None = None,
+            key: Callable[[ClaspDiagram], bytes] = diagram_key,
+            isotopy_check_mode: str = 'off') -> Iterator[ExploredState]:
+    """
+    Explores the move graph from `start`, yielding every newly discovered state (the start included) as it is found.
+
+    Parameters
+    ----------
+    strategy : str
+        'bfs' (breadth-first) or 'dfs' (depth-first).
+    move_nums : tuple[int]
+        Moves to use. Including -3 makes the graph infinite, so bound it with max_depth or max_states.
+    max_depth : int | None
+        States at this depth are reported but not expanded.
+    max_states : int | None
+        Stop after this many states have been discovered.
+    key : callable
+        Maps a diagram to the bytes used in the visited set, e.g. canonical.canonical_key to dedup up to rotation.
+    isotopy_check_mode : str
+        Isotopy check policy of the moves during exploration (see moves.set_isotopy_check). 'off' by default,
+        so no determinant is computed per state.
+
+    Legal moves come from moves.legal_moves. The frontier stores PackedClaspDiagram instances
+    and the visited set only bytes keys.
+
+    Time complexity: O(S·(n² + M·n)) for S states with M legal moves each
+    Space complexity: O(S·n)
+    """
+    if strategy not in ('bfs', 'dfs'):
+        raise ValueError(f"Invalid strategy ({strategy}). Must be 'bfs' or 'dfs'.")
+
+    start_key = key(start)
+    visited = {start_key}
+    frontier = deque([(start.packed, 0, start_key)])
+    yield ExploredState(clasp=start, depth=0, key=start_key, parent_key=None, move=None)
+    if max_states is not None and len(visited) >= max_states:
+        return
+
+    pop = frontier.popleft if strategy == 'bfs' else frontier.pop
+    while frontier:
+        packed, depth, parent_key = pop()
+        if max_depth is not None and depth >= max_depth:
+            continue
+        clasp = ClaspDiagram._from_trusted(matrix=packed.matrix)
+
+        with moves.isotopy_check(isotopy_check_mode):
+            children = [(move, apply_move(clasp, *move)) for move in moves.legal_moves(clasp, move_nums=move_nums)]
+
+        for move, child in children:
+            child_key = key(child)
+            if child_key in visited:
+                continue
+            visited.add(child_key)
+            frontier.append((child.packed, depth + 1, child_key))
+            yield ExploredState(clasp=child, depth=depth + 1, key=child_key, parent_key=parent_key, move=move)
+            if max_states is not None and len(visited) >= max_states:
+                return
+
+def bfs(start: ClaspDiagram, **kwargs) -> Iterator[ExploredState]:
+    """
+    Breadth-first exploration of the move graph. See explore().
+    """
+    return explore(start, strategy='bfs', **kwargs)
+
+def dfs(start: ClaspDiagram, **kwargs) -> Iterator[ExploredState]:
+    """
+    Depth-first exploration of the move graph. See explore().
+    """
+    return explore(start, strategy='dfs', **kwargs)
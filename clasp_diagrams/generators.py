@@ -1,11 +1,14 @@
-from clasp_diagrams.objects import ChordForMatrix, ChordForArray
-from clasp_diagrams.validators import validate_clasp_array, validate_clasp_matrix
+from clasp_diagrams.objects import ChordForMatrix, ChordForArray, ClaspDiagram
+from clasp_diagrams.packed import PackedClaspDiagram, CHORD_DTYPE
+from clasp_diagrams.validators import validate_clasp_array, validate_clasp_matrix, validate_clasp_chord_batch
+from typing import Iterator
+import numpy as np
 import random
 
 def make_valid_chord_for_matrix(idx: int, start: int, end: int, height: int) -> ChordForMatrix:
     if end < start:
         start, end = end, start
-    return ChordForMatrix(
+    return ChordForMatrix._unsafe_make(
         start_point=start,
         end_point=end,
         sign='+' if idx % 2 == 0 else '-',
@@ -41,7 +44,7 @@ def random_valid_array(n: int) -> list[ChordForArray]:
     Generates a random but valid list of n ChordForArray instances.
     In total, there are m = 2*n of these instances.
 
-    Time complexity: O(m)? (check if remove affects the complexity)
+    Time complexity: O(m)
     Space complexity: O(m)
     """
     m = 2 * n
@@ -63,15 +66,93 @@ def random_valid_array(n: int) -> list[ChordForArray]:
                 idx = start_points_stack.pop()
                 end_points.append(idx)
             else:
-                idx = random.choice(end_points)
-                end_points.remove(idx)
+                # Swap-pop a random element, O(1) instead of list.remove
+                k = random.randrange(s2)
+                idx = end_points[k]
+                end_points[k] = end_points[-1]
+                end_points.pop()
 
         if idx not in already_created_chords:
-            already_created_chords[idx] = ChordForArray(chord_idx=idx, sign='+', height=idx)
+            already_created_chords[idx] = ChordForArray._unsafe_make(chord_idx=idx, sign=random.choice('+-'), height=idx)
             array[j] = already_created_chords[idx]
         else:
             array[j] = already_created_chords[idx]
 
     validate_clasp_array(array)
 
-    return array
\ No newline at end of file
+    return array
+
+# ==================== Streaming generation ====================
+GENERATOR_OUTPUTS = ('clasp', 'packed', 'batch')
+
+def random_chord_batch(batch_size: int, n: int, rng: np.random.Generator | int | None = None) -> np.ndarray:
+    """
+    Generates batch_size random diagrams with n chords at once, as a (batch_size, n) CHORD_DTYPE array
+    (rows sorted by start point, as in a clasp matrix).
+
+    The 2n points of each diagram are paired by a random permutation (consecutive entries form a chord),
+    heights are the argsort of uniforms and signs are uniform. Every perfect matching arises from
+    exactly n!·2ⁿ permutations, so diagrams are uniform over all clasp matrices with n chords.
+
+    Time complexity: O(B·n log n) (vectorized)
+    Space complexity: O(B·n)
+    """
+    rng = np.random.default_rng(rng)
+    points = np.argsort(rng.random((batch_size, 2 * n)), axis=1).reshape(batch_size, n, 2)
+    starts, ends = points.min(axis=2), points.max(axis=2)
+    order = np.argsort(starts, axis=1)
+
+    chords = np.empty((batch_size, n), dtype=CHORD_DTYPE)
+    chords['start_point'] = np.take_along_axis(starts, order, axis=1)
+    chords['end_point'] = np.take_along_axis(ends, order, axis=1)
+    chords['height'] = np.argsort(rng.random((batch_size, n)), axis=1) + 1
+    chords['sign'] = 2 * rng.integers(0, 2, size=(batch_size, n), dtype=np.int8) - 1
+    return chords
+
+def iter_random_diagrams(n: int, count: int | None = None, *, seed: int | None = None, batch_size: int = 1024,
+                         validate: bool = True, output: str = 'clasp') -> Iterator:
+    """
+    Lazily generates `count` random diagrams with n chords (endlessly if count is None), batch_size at a time.
+
+    Batch k is drawn from np.random.default_rng([seed, k]), so a stream is reproducible from its seed and
+    any batch can be regenerated on its own (e.g. by parallel workers). Without a seed, fresh entropy is used.
+
+    Parameters
+    ----------
+    validate : bool
+        If True, every diagram goes through the validators. Set to False for trusted generation.
+    output : str
+        'clasp' yields ClaspDiagram instances, 'packed' yields PackedClaspDiagram instances and
+        'batch' yields (batch_size, n) CHORD_DTYPE arrays (the last one may be shorter).
+
+    Diagrams are produced by random_chord_batch().
+
+    Time complexity: O(n log n) per diagram
+    Space complexity: O(batch_size·n)
+    """
+    if output not in GENERATOR_OUTPUTS:
+        raise ValueError(f"Invalid output ({output}). Must be one of {GENERATOR_OUTPUTS}.")
+    if batch_size < 1:
+        raise ValueError(f"Invalid batch_size={batch_size}. Must be at least 1.")
+    if seed is None:
+        seed = np.random.SeedSequence().entropy
+
+    batch_idx, produced = 0, 0
+    while count is None or produced < count:
+        size = batch_size if count is None else min(batch_size, count - produced)
+        batch = random_chord_batch(size, n, np.random.default_rng([seed, batch_idx]))
+        batch_idx += 1
+        produced += size
+
+        if validate:
+            validate_clasp_chord_batch(batch)
+        if output == 'batch':
+            yield batch
+        elif output == 'packed':
+            yield from (PackedClaspDiagram(chords) for chords in batch)
+        else:
+            for chords in batch:
+                packed = PackedClaspDiagram(chords)
+                clasp = ClaspDiagram._from_trusted(matrix=packed.matrix)
+                clasp._seed(packed=packed)
+                yield clasp
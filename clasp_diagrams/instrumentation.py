@@ -0,0 +1,114 @@
+from __future__ import annotations
+from contextlib import contextmanager, nullcontext
+import functools
+import json
+import time
+
+# ==================== Opt-in timing instrumentation ====================
+# Hot-path functions (construction, validation, transformations, symbolics, moves and the isotopy check)
+# are wrapped with @instrumented(phase), and sub-phases of a function are timed with `with phase(name):`.
+# While instrumentation is disabled (the default) a wrapped call only checks a flag,
+# and phase() returns a shared no-op context manager.
+# Times are inclusive: a phase includes the time of the phases it calls.
+#
+#     with profile() as registry:
+#         best_first_search(clasp)
+#     print(registry.table())
+
+class Registry:
+    """
+    Per-phase call counts and total wall times.
+    """
+    def __init__(self):
+        self.calls = {}
+        self.seconds = {}
+
+    def record(self, name: str, seconds: float):
+        self.calls[name] = self.calls.get(name, 0) + 1
+        self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+
+    def reset(self):
+        self.calls.clear()
+        self.seconds.clear()
+
+    def stats(self) -> dict[str, dict]:
+        """
+        {phase: {'calls', 'total', 'mean'}}, slowest phases first.
+        """
+        names = sorted(self.seconds, key=self.seconds.get, reverse=True)
+        return {name: {'calls': self.calls[name], 'total': self.seconds[name],
+                       'mean': self.seconds[name] / self.calls[name]} for name in names}
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.stats(), **kwargs)
+
+    def table(self) -> str:
+        """
+        The statistics as a text table.
+        """
+        lines = [f"{'phase':<36} {'calls':>10} {'total (s)':>12} {'mean (us)':>12}"]
+        for name, stat in self.stats().items():
+            lines.append(f"{name:<36} {stat['calls']:>10} {stat['total']:>12.4f} {stat['mean'] * 1e6:>12.2f}")
+        return '\n'.join(lines)
+
+registry = Registry()
+_enabled = False
+_NULL_CONTEXT = nullcontext()
+
+def enable():
+    global _enabled
+    _enabled = True
+
+def disable():
+    global _enabled
+    _enabled = False
+
+def is_enabled() -> bool:
+    return _enabled
+
+@contextmanager
+def _timed(name: str):
+    began = time.perf_counter()
+    try:
+        yield
+    finally:
+        registry.record(name, time.perf_counter() - began)
+
+def phase(name: str):
+    """
+    Context manager timing a block as the given phase (a no-op while instrumentation is disabled).
+    """
+    return _timed(name) if _enabled else _NULL_CONTEXT
+
+def instrumented(name: str):
+    """
+    Decorator timing every call of the function as the given phase.
+    """
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            began = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                registry.record(name, time.perf_counter() - began)
+        return wrapper
+    return decorate
+
+@contextmanager
+def profile(*, reset: bool = True):
+    """
+    Enables instrumentation inside the block (clearing the registry first, unless reset=False)
+    and yields the registry.
+    """
+    global _enabled
+    previous = _enabled
+    if reset:
+        registry.reset()
+    _enabled = True
+    try:
+        yield registry
+    finally:
+        _enabled = previous
@@ -0,0 +1,203 @@
+from __future__ import annotations
+from clasp_diagrams.objects import ClaspDiagram
+from clasp_diagrams.exploration import apply_move, diagram_key
+import clasp_diagrams.moves as moves
+from typing import Callable
+import math
+import random
+import time
+
+# ==================== Monte Carlo Tree Search over the move graph ====================
+# Nodes live in a transposition table keyed by the diagram key, so a diagram reached through
+# different move sequences is expanded once. Visit counts and values are kept per edge (node, move),
+# so selection at each node only counts the rollouts that went through it. Rewards are in [0, 1]: by default, the fraction
+# of chords erased at the end of a rollout (1 when the empty unknot diagram is reached), discounted
+# by the number of moves it took, so that shorter unknottings are preferred.
+#
+# Rollouts (and the whole search) run with the isotopy check of the moves off, and only read the chords
+# of the diagrams, so no Alexander polynomial is ever computed.
+
+def chord_reduction_reward(start: ClaspDiagram, end: ClaspDiagram) -> float:
+    """
+    Fraction of the chords of `start` that are gone in `end` (negative if chords were added).
+    """
+    n = len(start.matrix)
+    return 1.0 if n == 0 else (n - len(end.matrix)) / n
+
+def random_rollout_policy(clasp: ClaspDiagram, legal: list[tuple[int, dict]], rng: random.Random) -> tuple[int, dict]:
+    """
+    Picks a legal move uniformly at random, but always erases an isolated chord when possible.
+    """
+    erasures = [move for move in legal if move[0] == 3]
+    return rng.choice(erasures or legal)
+
+# A node of the search, shared through the transposition table.
+class MCTSNode:
+    __slots__ = ('packed', 'visits', 'moves', 'untried', 'children', 'edge_visits', 'edge_value')
+
+    def __init__(self, clasp: ClaspDiagram, legal: list[tuple[int, dict]]):
+        self.packed = clasp.packed
+        self.visits = 0
+        self.moves = legal
+        self.untried = list(range(len(legal)))
+        self.children = {} # move index -> child key
+        self.edge_visits = {} # move index -> number of rollouts through that move
+        self.edge_value = {} # move index -> total reward of those rollouts
+
+class MCTS:
+    """
+    Monte Carlo Tree Search with UCT selection, random rollouts and a transposition table.
+
+    Parameters
+    ----------
+    exploration : float
+        UCT exploration constant c in value/visits + c·sqrt(ln(parent visits)/visits).
+    rollout_depth : int
+        Maximum number of moves of a rollout.
+    move_nums : tuple[int]
+        Moves to use. -C1 (-3) is left out by default since it only adds chords.
+    reward : callable
+        (start, end) -> float, evaluated at the end of each rollout.
+    discount : float
+        The reward of a rollout ending k moves away from the root is multiplied by discount^k.
+    rollout_policy : callable
+        (clasp, legal moves, rng) -> move, used to step rollouts.
+    key : callable
+        Maps a diagram to the bytes key of the transposition table, e.g. canonical.canonical_key.
+    seed : int | None
+        Seed of the random number generator.
+    """
+    def __init__(self, *, exploration: float = math.sqrt(2), rollout_depth: int = 50,
+                 move_nums=(1, 2, -2, 3),
+                 reward: Callable[[ClaspDiagram, ClaspDiagram], float] = chord_reduction_reward,
+                 discount: float = 0.95,
+                 rollout_policy: Callable = random_rollout_policy,
+                 key: Callable[[ClaspDiagram], bytes] = diagram_key,
+                 seed: int | None = None):
+        self.exploration = exploration
+        self.rollout_depth = rollout_depth
+        self.move_nums = move_nums
+        self.reward = reward
+        self.discount = discount
+        self.rollout_policy = rollout_policy
+        self.key = key
+        self.rng = random.Random(seed)
+        self.table = {} # Transposition table: key -> MCTSNode
+        self.rollouts = 0
+        self.rollout_moves = 0
+        self.rollout_time = 0.0
+
+    @property
+    def rollout_moves_per_second(self) -> float:
+        return self.rollout_moves / self.rollout_time if self.rollout_time > 0 else 0.0
+
+    def _node(self, clasp: ClaspDiagram, clasp_key: bytes) -> MCTSNode:
+        node = self.table.get(clasp_key)
+        if node is None:
+            node = MCTSNode(clasp, moves.legal_moves(clasp, move_nums=self.move_nums))
+            self.table[clasp_key] = node
+        return node
+
+    def _select_move(self, node: MCTSNode) -> int:
+        log_visits = math.log(max(node.visits, 1))
+        def uct(move_idx):
+            visits = node.edge_visits[move_idx]
+            if visits == 0:
+                return math.inf
+            return node.edge_value[move_idx] / visits + self.exploration * math.sqrt(log_visits / visits)
+        return max(node.children, key=uct)
+
+    def rollout(self, clasp: ClaspDiagram) -> tuple[ClaspDiagram, int]:
+        """
+        Plays random moves from `clasp` until the unknot is reached or rollout_depth moves were made.
+        Returns the final diagram and the number of moves played.
+        """
+        began = time.perf_counter()
+        steps = 0
+        while steps < self.rollout_depth and len(clasp.matrix) > 0:
+            legal = moves.legal_moves(clasp, move_nums=self.move_nums)
+            clasp = apply_move(clasp, *self.rollout_policy(clasp, legal, self.rng))
+            steps += 1
+        self.rollouts += 1
+        self.rollout_moves += steps
+        self.rollout_time += time.perf_counter() - began
+        return clasp, steps
+
+    def _iterate(self, root: ClaspDiagram, root_key: bytes):
+        """
+        One selection / expansion / rollout / backpropagation pass.
+        """
+        node, clasp = self._node(root, root_key), root
+        edges = [] # (node, move index) pairs followed from the root
+        on_path = {root_key} # Cycles are possible in the move graph (e.g. B then -B)
+
+        # Selection: descend through fully expanded nodes
+        while not node.untried and node.children and len(clasp.matrix) > 0:
+            move_idx = self._select_move(node)
+            clasp_key = node.children[move_idx]
+            edges.append((node, move_idx))
+            node = self.table[clasp_key]
+            clasp = ClaspDiagram._from_trusted(matrix=node.packed.matrix)
+            if clasp_key in on_path:
+                break # Back on the path: the rollout starts from the node reached (fully expanded, so not expanded again)
+            on_path.add(clasp_key)
+
+        # Expansion: add one untried move
+        if node.untried and len(clasp.matrix) > 0:
+            move_idx = node.untried.pop(self.rng.randrange(len(node.untried)))
+            clasp = apply_move(clasp, *node.moves[move_idx])
+            clasp_key = self.key(clasp)
+            node.children[move_idx] = clasp_key
+            node.edge_visits[move_idx] = 0
+            node.edge_value[move_idx] = 0.0
+            edges.append((node, move_idx))
+            self._node(clasp, clasp_key)
+
+        # Simulation and backpropagation
+        end, steps = self.rollout(clasp)
+        value = self.reward(root, end) * self.discount ** (len(edges) + steps)
+        for visited, move_idx in edges:
+            visited.visits += 1
+            visited.edge_visits[move_idx] += 1
+            visited.edge_value[move_idx] += value
+
+    def search(self, root: ClaspDiagram, *, iterations: int | None = 1000,
+               time_budget: float | None = None) -> tuple[int, dict] | None:
+        """
+        Runs MCTS iterations from `root` and returns its most visited move (None if no move applies).
+        Statistics are kept in the transposition table across calls.
+        """
+        if iterations is None and time_budget is None:
+            raise ValueError("At least one of `iterations` or `time_budget` must be provided.")
+
+        began = time.perf_counter()
+        root_key = self.key(root)
+        with moves.isotopy_check('off'):
+            done = 0
+            while (iterations is None or done < iterations) and \
+                  (time_budget is None or time.perf_counter() - began < time_budget):
+                self._iterate(root, root_key)
+                done += 1
+
+        node = self.table[root_key]
+        if not node.children:
+            return None
+        best = max(node.children, key=lambda move_idx: node.edge_visits[move_idx])
+        return node.moves[best]
+
+    def plan(self, root: ClaspDiagram, *, max_steps: int = 100, iterations: int = 200) -> tuple[ClaspDiagram, list]:
+        """
+        Repeatedly searches and plays the best move, until the unknot is reached or max_steps moves were played.
+        Returns the final diagram and the list of moves played.
+        """
+        clasp, played = root, []
+        for _ in range(max_steps):
+            if len(clasp.matrix) == 0:
+                break
+            move = self.search(clasp, iterations=iterations)
+            if move is None:
+                break
+            with moves.isotopy_check('off'):
+                clasp = apply_move(clasp, *move)
+            played.append(move)
+        return clasp, played
@@ -0,0 +1,203 @@
+from __future__ import annotations
+import numpy as np
+
+# ==================== Modular integer linear algebra ====================
+# Arithmetic modulo primes p < 2³¹ on int64 arrays: residues are < 2³¹, so products of two residues
+# stay below 2⁶² and never overflow. Moduli can be a scalar or an array broadcasting against the values,
+# e.g. one prime per matrix of a batch.
+
+DEFAULT_PRIME = 2**31 - 1 # Mersenne prime
+MILLER_RABIN_BASES = (2, 3, 5, 7) # Deterministic for every number below 3,215,031,751 > 2³¹
+
+# Below this bound, products of two residues are < 2⁵², so sums of up to _DOT_CHUNK of them stay in int64
+# and matrix products can be reduced once per chunk of the inner dimension.
+DOT_PRIME_LIMIT = 2**26
+_DOT_CHUNK = 1 << 10
+
+def mod_pow(base: np.ndarray, exponent, p) -> np.ndarray:
+    """
+    Element-wise base^exponent mod p, by repeated squaring. exponent and p can be arrays.
+
+    Time complexity: O(log exponent) vectorized operations
+    """
+    base = np.asarray(base, dtype=np.int64) % p
+    exponent = np.broadcast_to(np.asarray(exponent, dtype=np.int64), base.shape).copy()
+    result = np.ones_like(base)
+    while np.any(exponent):
+        odd = (exponent & 1).astype(bool)
+        result = np.where(odd, result * base % p, result)
+        base = base * base % p
+        exponent >>= 1
+    return result
+
+def mod_inverse(values: np.ndarray, p) -> np.ndarray:
+    """
+    Element-wise inverses mod a prime p (Fermat). Zeros map to zero.
+    """
+    return mod_pow(values, np.asarray(p) - 2, p)
+
+def det_mod(matrices: np.ndarray, p=DEFAULT_PRIME) -> np.ndarray:
+    """
+    Determinants mod p of a (B, n, n) batch of integer matrices (or of a single (n, n) matrix),
+    by Gaussian elimination performed on the whole batch at once. p is a prime or a (B,) array of primes.
+
+    Time complexity: O(B·n³) (vectorized over the batch)
+    Space complexity: O(B·n²)
+    """
+    single = np.ndim(matrices) == 2
+    m = np.array(matrices, dtype=np.int64)
+    if single:
+        m = m[None]
+    batch, n, _ = m.shape
+    p = np.broadcast_to(np.asarray(p, dtype=np.int64), (batch,))
+    m %= p[:, None, None]
+    det = np.ones(batch, dtype=np.int64)
+
+    for k in range(n):
+        # Pivoting: swap in a row with a non-zero entry in column k. Matrices without one are singular,
+        # their zero pivot zeroes the determinant.
+        pivot_rows = k + (m[:, k:, k] != 0).argmax(axis=1)
+        swap = np.flatnonzero(pivot_rows != k)
+        if len(swap):
+            rows = m[swap, k].copy()
+            m[swap, k] = m[swap, pivot_rows[swap]]
+            m[swap, pivot_rows[swap]] = rows
+            det[swap] = (p[swap] - det[swap]) % p[swap]
+
+        pivots = m[:, k, k]
+        det = det * pivots % p
+        factors = m[:, k + 1:, k] * mod_inverse(pivots, p)[:, None] % p[:, None]
+        # Both operands are residues, so the difference stays within int64 before the single reduction
+        m[:, k + 1:, k:] = (m[:, k + 1:, k:] - factors[:, :, None] * m[:, None, k, k:]) % p[:, None, None]
+
+    return det[0] if single else det
+
+def matmul_mod(a: np.ndarray, b: np.ndarray, p) -> np.ndarray:
+    """
+    Batched matrix product a @ b mod p of residues modulo primes p < DOT_PRIME_LIMIT, p broadcasting against
+    the batch axis (e.g. a (B, 1, 1) array). The inner dimension is reduced in chunks so that sums never overflow.
+
+    Time complexity: O(B·r·c·k) for (B, r, k) @ (B, k, c)
+    """
+    inner = a.shape[-1]
+    result = a[..., :0] @ b[..., :0, :]
+    for begin in range(0, inner, _DOT_CHUNK):
+        result = (result + a[..., begin:begin + _DOT_CHUNK] @ b[..., begin:begin + _DOT_CHUNK, :]) % p
+    return result
+
+def hessenberg_mod(matrices: np.ndarray, p) -> np.ndarray:
+    """
+    Reduces a (B, m, m) batch of matrices mod primes p < DOT_PRIME_LIMIT (one per matrix) to upper Hessenberg
+    form by similarity transformations: row operations eliminate column j below the subdiagonal and the
+    inverse column operations keep the characteristic polynomial unchanged.
+
+    Time complexity: O(B·m³)
+    Space complexity: O(B·m²)
+    """
+    h = np.array(matrices, dtype=np.int64)
+    batch, m, _ = h.shape
+    p = np.broadcast_to(np.asarray(p, dtype=np.int64), (batch,))
+    h %= p[:, None, None]
+    everything = np.arange(batch)
+
+    for j in range(m - 2):
+        # Pivoting: swap rows and columns j + 1 and r, r the first row with a non-zero entry in column j
+        pivot_rows = j + 1 + (h[:, j + 1:, j] != 0).argmax(axis=1)
+        swap = np.flatnonzero(pivot_rows != j + 1)
+        if len(swap):
+            rows = h[swap, j + 1].copy()
+            h[swap, j + 1] = h[swap, pivot_rows[swap]]
+            h[swap, pivot_rows[swap]] = rows
+            columns = h[swap, :, j + 1].copy()
+            h[swap, :, j + 1] = h[everything[swap, None], :, pivot_rows[swap, None]][:, 0]
+            h[swap, :, pivot_rows[swap]] = columns
+
+        # A zero pivot means the column is already reduced: its zero inverse turns the updates into no-ops
+        factors = h[:, j + 2:, j] * mod_inverse(h[:, j + 1, j], p)[:, None] % p[:, None]
+        h[:, j + 2:, j:] = (h[:, j + 2:, j:] - factors[:, :, None] * h[:, None, j + 1, j:]) % p[:, None, None]
+        h[:, :, j + 1] = (h[:, :, j + 1] + matmul_mod(h[:, :, j + 2:], factors[:, :, None], p[:, None, None])[:, :, 0]) % p[:, None]
+    return h
+
+def charpoly_mod(matrices: np.ndarray, p) -> np.ndarray:
+    """
+    Coefficients (lowest degree first) of the characteristic polynomials det(y·I - A) mod p of a (B, m, m) batch
+    of matrices, one prime p < DOT_PRIME_LIMIT per matrix. Hessenberg reduction, then the recurrence on the
+    leading principal minors of y·I - H:
+        χ_k = (y - h_kk)·χ_(k-1) - Σ_(i<k) h_ik·(h_(i+1,i)···h_(k,k-1))·χ_(i-1)
+
+    Time complexity: O(B·m³)
+    Space complexity: O(B·m²)
+    """
+    h = hessenberg_mod(matrices, p)
+    batch, m, _ = h.shape
+    p = np.broadcast_to(np.asarray(p, dtype=np.int64), (batch,))[:, None]
+    minors = np.zeros((batch, m + 1, m + 1), dtype=np.int64) # minors[:, k] = χ_k
+    minors[:, 0, 0] = 1
+    subdiagonal_products = np.zeros((batch, m), dtype=np.int64) # [:, i] = h_(i+1,i)···h_(k,k-1), 0-based i < k - 1
+
+    for k in range(1, m + 1):
+        previous = minors[:, k - 1]
+        current = (np.roll(previous, 1, axis=1) - h[:, k - 1, k - 1, None] * previous) % p
+        if k > 1:
+            subdiagonal_products[:, :k - 2] = subdiagonal_products[:, :k - 2] * h[:, k - 1, k - 2, None] % p
+            subdiagonal_products[:, k - 2] = h[:, k - 1, k - 2]
+            weights = h[:, :k - 1, k - 1] * subdiagonal_products[:, :k - 1] % p
+            current = (current - matmul_mod(weights[:, None, :], minors[:, :k - 1], p[:, :, None])[:, 0]) % p
+        minors[:, k] = current
+    return minors[:, m]
+
+# ==================== Primes and Chinese remaindering ====================
+def is_prime(n: int) -> bool:
+    """
+    Deterministic Miller–Rabin primality test for n < 3,215,031,751 (bases 2, 3, 5, 7).
+    """
+    if n < 2:
+        return False
+    for base in MILLER_RABIN_BASES:
+        if n % base == 0:
+            return n == base
+    d, r = n - 1, 0
+    while d % 2 == 0:
+        d, r = d // 2, r + 1
+    for base in MILLER_RABIN_BASES:
+        x = pow(base, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(r - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+_PRIMES = {} # limit -> largest primes below it, in decreasing order, found so far
+
+def word_primes(count: int, limit: int = 2**31) -> list[int]:
+    """
+    The `count` largest primes below `limit` (at most 2³¹), in decreasing order.
+    """
+    primes = _PRIMES.setdefault(limit, [])
+    candidate = primes[-1] - 2 if primes else (limit - 1) | 1
+    while len(primes) < count:
+        if candidate < limit and is_prime(candidate):
+            primes.append(candidate)
+        candidate -= 2
+    return primes[:count]
+
+def crt(residues: list[list[int]], primes: list[int], *, symmetric: bool = True) -> list[int]:
+    """
+    Combines, for every position, residues modulo pairwise coprime primes into the unique value modulo
+    their product (in (-M/2, M/2] if symmetric, else in [0, M)). residues[i][k] is the k-th value mod primes[i].
+
+    Time complexity: O(K·P²) big integer operations for K positions and P primes
+    """
+    values = [int(r) for r in residues[0]]
+    modulus = primes[0]
+    for prime, row in zip(primes[1:], residues[1:]):
+        inverse = pow(modulus, -1, prime)
+        values = [v + modulus * ((int(r) - v) * inverse % prime) for v, r in zip(values, row)]
+        modulus *= prime
+    if symmetric:
+        values = [v - modulus if v > modulus // 2 else v for v in values]
+    return values
@@ -1,8 +1,122 @@
+from __future__ import annotations
 from clasp_diagrams.objects import ChordForMatrix, ChordForArray, ClaspDiagram
 from clasp_diagrams.utils import matrix_chords_intersect, consecutive_heights, ImplementationError
+from clasp_diagrams import symbolics
+from clasp_diagrams.instrumentation import instrumented
+from contextlib import contextmanager
 import numpy as np
+import random
 from dataclasses import astuple
 
+ALL_MOVES = (1, 2, -2, 3, -3)
+
+# ==================== isotopy check policy ====================
+# Every move can verify that the new diagram has the same Alexander polynomial (up to sign) as the old one.
+# The check recomputes the child's fingerprint (a few modular determinants, see symbolics.get_alexander_fingerprint)
+# from its LE-matrix and compares it with the parent's one, so the Alexander coefficients propagated to the child
+# are never recomputed. It still costs determinants, so it can be turned off or sampled for search workloads.
+#   - 'always': check every move (default).
+#   - 'sampled': check each move with probability `rate`, drawn from a private random generator (seedable through
+#     set_isotopy_check), so that sampling never shifts the caller's seeded `random` stream.
+#   - 'off': never check.
+ISOTOPY_CHECK_MODES = ('off', 'sampled', 'always')
+_isotopy_check = {'mode': 'always', 'rate': 1.0}
+_isotopy_rng = random.Random()
+
+def set_isotopy_check(mode: str, rate: float = 1.0, seed: int | None = None) -> None:
+    """
+    Sets the global isotopy check policy of the moves. If seed is given, it also reseeds the generator
+    deciding which moves are checked in 'sampled' mode.
+    """
+    if mode not in ISOTOPY_CHECK_MODES:
+        raise ValueError(f"Invalid isotopy check mode ({mode}). Must be one of {ISOTOPY_CHECK_MODES}.")
+    if not 0.0 <= rate <= 1.0:
+        raise ValueError(f"Invalid isotopy check rate ({rate}). Must be between 0 and 1.")
+    _isotopy_check['mode'] = mode
+    _isotopy_check['rate'] = rate
+    if seed is not None:
+        _isotopy_rng.seed(seed)
+
+def get_isotopy_check() -> tuple[str, float]:
+    """
+    Returns the current (mode, rate) isotopy check policy.
+    """
+    return _isotopy_check['mode'], _isotopy_check['rate']
+
+@contextmanager
+def isotopy_check(mode: str, rate: float = 1.0, seed: int | None = None):
+    """
+    Context manager that temporarily sets the isotopy check policy, e.g.
+
+        with isotopy_check('off'):
+            new_clasp = clasp.move(move_num=2)
+    """
+    previous = get_isotopy_check()
+    set_isotopy_check(mode, rate, seed)
+    try:
+        yield
+    finally:
+        set_isotopy_check(*previous)
+
+def _should_check_isotopy() -> bool:
+    mode = _isotopy_check['mode']
+    if mode == 'always':
+        return True
+    if mode == 'sampled':
+        return _isotopy_rng.random() < _isotopy_check['rate']
+    return False
+
+# ==================== invariant propagation and isotopy check ====================
+# Moves change a diagram locally, so the child's L-matrix is derived from the parent's one
+# instead of being rebuilt, and the child's Alexander polynomial is inherited from the parent's
+# (it is an isotopy invariant). Only what the parent has already computed is propagated.
+def _propagate_invariants(clasp: ClaspDiagram, new_clasp: ClaspDiagram, *, update_l_matrix, sign=1):
+    """
+    Seeds new_clasp with the invariants derived from clasp.
+    
+    update_l_matrix : callable
+        Maps the parent's L-matrix to the child's one.
+    sign : int
+        det(S_D(1)) = (-1)ⁿ·Πe_ii fixes the sign of the polynomial; this is the ratio between the child's and the
+        parent's values. Moves A and B keep it, C1 and -C1 multiply it by minus the sign of the affected chord.
+    """
+    invariants = vars(clasp)
+    if 'l_matrix' in invariants:
+        new_clasp._seed(l_matrix=update_l_matrix(invariants['l_matrix']))
+    if 'alexander_coefficients' in invariants:
+        new_clasp._seed(alexander_coefficients=tuple(sign * c for c in invariants['alexander_coefficients']))
+    if 'fingerprint' in invariants: # Normalised by the sign at t = 1, so it is unchanged
+        new_clasp._seed(fingerprint=invariants['fingerprint'])
+
+def _refresh_rows(new_clasp: ClaspDiagram, rows: list[int]):
+    """
+    Returns an L-matrix updater that copies the parent's L-matrix and recomputes the given (0-indexed) rows.
+    """
+    def update(l_matrix):
+        l_matrix = l_matrix.copy()
+        if rows:
+            packed = new_clasp.packed
+            symbolics.update_l_matrix_rows(l_matrix, packed.starts, packed.ends, packed.heights, rows)
+        return l_matrix
+    return update
+
+@instrumented('moves.isotopy_check')
+def _check_isotopy(clasp: ClaspDiagram, new_clasp: ClaspDiagram, move_name: str):
+    """
+    Recomputes the fingerprint of new_clasp from scratch and compares it with the one of clasp
+    (normalised by the sign at t = 1, so equal for isotopic diagrams). Much cheaper than recomputing
+    the Alexander coefficients, which the child inherits. Whether the check runs depends on the isotopy check policy.
+    """
+    if not _should_check_isotopy():
+        return
+
+    expected = clasp.fingerprint
+    actual = symbolics.get_alexander_fingerprint(le_matrix=new_clasp.le_matrix)
+    if actual != expected:
+        raise ImplementationError(f"Move {move_name} failed to produce an isotopic clasp.")
+    if 'fingerprint' not in vars(new_clasp):
+        new_clasp._seed(fingerprint=actual)
+
 # ==================== move A: exchange_heights ====================
 def valid_exchange_heights(matrix: tuple[ChordForMatrix], i, j, n):
     """
@@ -33,6 +147,7 @@ def valid_exchange_heights(matrix: tuple[ChordForMatrix], i, j, n):
     
     return chord1, chord2
 
+@instrumented('moves.A')
 def exchange_heights(clasp: ClaspDiagram, *, i, j) -> ClaspDiagram:
     """
     Move A: Exchange the heights of two non-intersecting chords with consecutive heights.
@@ -72,28 +187,32 @@ def exchange_heights(clasp: ClaspDiagram, *, i, j) -> ClaspDiagram:
 
     for k in range(n):
         if k == i-1:
-            new_matrix.append(ChordForMatrix(start_point=chord1.start_point,
-                                             end_point=chord1.end_point,
-                                             sign=chord1.sign,
-                                             height=chord2.height)) 
+            new_matrix.append(ChordForMatrix._unsafe_make(start_point=chord1.start_point,
+                                                          end_point=chord1.end_point,
+                                                          sign=chord1.sign,
+                                                          height=chord2.height))
         elif k == j-1:
-            new_matrix.append(ChordForMatrix(start_point=chord2.start_point,
-                                             end_point=chord2.end_point,
-                                             sign=chord2.sign,
-                                             height=chord1.height))
+            new_matrix.append(ChordForMatrix._unsafe_make(start_point=chord2.start_point,
+                                                          end_point=chord2.end_point,
+                                                          sign=chord2.sign,
+                                                          height=chord1.height))
         else:
             new_matrix.append(matrix[k])
 
     new_matrix = tuple(new_matrix)
 
-    new_clasp = ClaspDiagram.from_matrix(matrix=new_matrix)
+    new_clasp = ClaspDiagram._from_trusted(matrix=new_matrix)
 
-    if clasp.alexander.equals(new_clasp.alexander) or clasp.alexander.equals(-new_clasp.alexander):
-        return new_clasp
-    else:
-        raise ImplementationError("Move A failed to produce an isotopic clasp.")
+    # Swapping consecutive heights keeps every other height comparison, so L only changes
+    # when the heights wrap around (1 and n).
+    rows = [i-1, j-1] if abs(chord1.height - chord2.height) != 1 else []
+    _propagate_invariants(clasp, new_clasp, update_l_matrix=_refresh_rows(new_clasp, rows))
+    _check_isotopy(clasp, new_clasp, "A")
+
+    return new_clasp
 
 # ==================== move B and -B: cyclic_height_shift ====================
+@instrumented('moves.B')
 def cyclic_height_shift(clasp: ClaspDiagram) -> ClaspDiagram:
     """
     Move B: Cyclic height shift (+1 to each chord's height).
@@ -119,20 +238,22 @@ def cyclic_height_shift(clasp: ClaspDiagram) -> ClaspDiagram:
 
     new_matrix = []
     for chord in clasp.matrix:
-        new_matrix.append(ChordForMatrix(start_point=chord.start_point,
-                                         end_point=chord.end_point,
-                                         sign=chord.sign,
-                                         height=(chord.height % n) + 1)
-                                        )
+        new_matrix.append(ChordForMatrix._unsafe_make(start_point=chord.start_point,
+                                                      end_point=chord.end_point,
+                                                      sign=chord.sign,
+                                                      height=(chord.height % n) + 1))
 
     new_matrix = tuple(new_matrix)
-    new_clasp = ClaspDiagram.from_matrix(matrix=new_matrix)
+    new_clasp = ClaspDiagram._from_trusted(matrix=new_matrix)
 
-    if clasp.alexander.equals(new_clasp.alexander) or clasp.alexander.equals(-new_clasp.alexander):
-        return new_clasp
-    else:
-        raise ImplementationError("Move B failed to produce an isotopic clasp.")
+    # Only the chord that went from height n to height 1 changes its order with respect to the others
+    rows = [k for k, chord in enumerate(new_matrix) if chord.height == 1] if n > 1 else []
+    _propagate_invariants(clasp, new_clasp, update_l_matrix=_refresh_rows(new_clasp, rows))
+    _check_isotopy(clasp, new_clasp, "B")
+
+    return new_clasp
     
+@instrumented('moves.-B')
 def inverse_cyclic_height_shift(clasp: ClaspDiagram) -> ClaspDiagram:
     """
     Move -B: Inverse cyclic height shift (-1 to each chord's height).
@@ -157,19 +278,20 @@ def inverse_cyclic_height_shift(clasp: ClaspDiagram) -> ClaspDiagram:
 
     new_matrix = []
     for chord in clasp.matrix:
-        new_matrix.append(ChordForMatrix(start_point=chord.start_point,
-                                         end_point=chord.end_point,
-                                         sign=chord.sign,
-                                         height=((chord.height - 2) % n) + 1)
-                                        )
+        new_matrix.append(ChordForMatrix._unsafe_make(start_point=chord.start_point,
+                                                      end_point=chord.end_point,
+                                                      sign=chord.sign,
+                                                      height=((chord.height - 2) % n) + 1))
 
     new_matrix = tuple(new_matrix)
-    new_clasp = ClaspDiagram.from_matrix(matrix=new_matrix)
+    new_clasp = ClaspDiagram._from_trusted(matrix=new_matrix)
 
-    if clasp.alexander.equals(new_clasp.alexander) or clasp.alexander.equals(-new_clasp.alexander):
-        return new_clasp
-    else:
-        raise ImplementationError("Move -B failed to produce an isotopic clasp.")
+    # Only the chord that went from height 1 to height n changes its order with respect to the others
+    rows = [k for k, chord in enumerate(new_matrix) if chord.height == n] if n > 1 else []
+    _propagate_invariants(clasp, new_clasp, update_l_matrix=_refresh_rows(new_clasp, rows))
+    _check_isotopy(clasp, new_clasp, "-B")
+
+    return new_clasp
 
 # ==================== move C1: erase isolated chord ====================
 def valid_erase_isolated_chord(clasp: ClaspDiagram, i):
@@ -202,6 +324,7 @@ def valid_erase_isolated_chord(clasp: ClaspDiagram, i):
     
     return matrix[i - 1]
 
+@instrumented('moves.C1')
 def erase_isolated_chord(clasp: ClaspDiagram, *, i) -> tuple[ClaspDiagram, ChordForMatrix]:
     """
     Move C1: Erase an isolated chord.
@@ -243,7 +366,7 @@ def erase_isolated_chord(clasp: ClaspDiagram, *, i) -> tuple[ClaspDiagram, Chord
             new_idx = curr_idx - 1 if curr_idx > i else curr_idx
             # Decrease the height if greater than the erased chord's height
             new_height = curr_height - 1 if curr_height > height_to_erase else curr_height
-            new_chord = ChordForArray(chord_idx=new_idx, sign=chord.sign, height=new_height)
+            new_chord = ChordForArray._unsafe_make(chord_idx=new_idx, sign=chord.sign, height=new_height)
             # Object interning: let's reuse created chords:
             if new_chord not in chord_cache:
                 new_array.append(new_chord)
@@ -251,12 +374,15 @@ def erase_isolated_chord(clasp: ClaspDiagram, *, i) -> tuple[ClaspDiagram, Chord
             else:
                 new_array.append(chord_cache[new_chord])
 
-    new_clasp = ClaspDiagram.from_array(array=new_array)
+    new_clasp = ClaspDiagram._from_trusted(array=new_array)
 
-    if clasp.alexander.equals(new_clasp.alexander) or clasp.alexander.equals(-new_clasp.alexander):
-        return new_clasp, chord_to_erase
-    else:
-        raise ImplementationError(f"Move C1 failed to produce an isotopic clasp: {type(clasp.alexander)} vs {type(new_clasp.alexander)}.")
+    # The erased chord is isolated: its row and column of L are zero and det(S_D) loses a -e_ii factor
+    _propagate_invariants(clasp, new_clasp,
+                          update_l_matrix=lambda l_matrix: np.delete(np.delete(l_matrix, i-1, axis=0), i-1, axis=1),
+                          sign=-1 if chord_to_erase.sign == '+' else 1)
+    _check_isotopy(clasp, new_clasp, "C1")
+
+    return new_clasp, chord_to_erase
 
 # ==================== move -C1: add isolated chord (after a starting point) ====================
 def valid_add_isolated_chord(n, after_point, sign, height):
@@ -274,6 +400,7 @@ def valid_add_isolated_chord(n, after_point, sign, height):
     if height not in valid_heights:
         raise ValueError(f"Invalid height chosen ({height}). Must be in {valid_heights}")
     
+@instrumented('moves.-C1')
 def add_isolated_chord(clasp: ClaspDiagram, *, after_point, new_sign, new_height, reverse_points=False) -> ClaspDiagram:
     """
     Move -C1: Add an isolated chord after the specified starting/ending point. Can be optimized! (Remove sorting)
@@ -317,7 +444,7 @@ def add_isolated_chord(clasp: ClaspDiagram, *, after_point, new_sign, new_height
     else:
         new_sp = after_point + 1
         new_ep = after_point + 2
-    new_chord = ChordForMatrix(new_sp, new_ep, new_sign, new_height)
+    new_chord = ChordForMatrix(new_sp, new_ep, new_sign, new_height) # User input: keep pydantic validation
  
     # Add the new chord:
     new_matrix.append(new_chord)
@@ -336,19 +463,70 @@ def add_isolated_chord(clasp: ClaspDiagram, *, after_point, new_sign, new_height
         if reverse_points:
             sp -= 1
             ep -= 1
-        new_matrix.append(ChordForMatrix(sp, ep, sign, height)) # Adding the modified chord
+        new_matrix.append(ChordForMatrix._unsafe_make(sp, ep, sign, height)) # Adding the modified chord
 
     new_matrix = sorted(new_matrix, key=lambda x: x.start_point)
     chord_idx = new_matrix.index(new_chord) + 1 # Get the chord index of the newly added chord
     new_matrix = tuple(new_matrix)
-    new_clasp = ClaspDiagram.from_matrix(matrix=new_matrix)
-
-    if clasp.alexander.equals(new_clasp.alexander) or clasp.alexander.equals(-new_clasp.alexander):
-        return new_clasp, chord_idx
-    else:
-        raise ImplementationError("Move -C1 failed to produce an isotopic clasp.")
+    new_clasp = ClaspDiagram._from_trusted(matrix=new_matrix)
 
+    # The added chord is isolated and every other chord keeps its relative order (of rows and heights):
+    # L gains a zero row and column, and det(S_D) gains a -e_ii factor
+    def insert_isolated(l_matrix):
+        return np.insert(np.insert(l_matrix, chord_idx - 1, 0, axis=0), chord_idx - 1, 0, axis=1)
+    _propagate_invariants(clasp, new_clasp, update_l_matrix=insert_isolated, sign=-1 if new_sign == '+' else 1)
+    _check_isotopy(clasp, new_clasp, "-C1")
 
+    return new_clasp, chord_idx
 
-        
+# ==================== legal move enumeration ====================
+@instrumented('moves.legal_moves')
+def legal_moves(clasp: ClaspDiagram, *, move_nums=ALL_MOVES) -> list[tuple[int, dict]]:
+    """
+    Returns every legal (move_num, kwargs) application of the given moves, as accepted by ClaspDiagram.move.
+    Same moves as exploration.enumerate_moves, but computed on the packed arrays, without the valid_* checkers
+    and without exceptions:
+        - Move A: only the n pairs of chords with consecutive heights (mod n) are candidates. They are found with a
+          height -> chord index, and kept when they don't intersect.
+        - Move C1: a chord that closes immediately (end = start + 1, or start = 0 and end = 2n - 1) has no point
+          on one of its sides, so it is isolated. No L-matrix needed.
+        - Moves B and -B always apply, and -C1 applies at every point, sign and height.
 
+    n is the number of chords in the clasp diagram.
+    Time complexity: O(n) (O(n²) with move -C1, which has that many applications)
+    Space complexity: O(n)
+    """
+    packed = clasp.packed
+    n = len(packed)
+    starts, ends, heights = packed.starts, packed.ends, packed.heights
+    legal = []
+
+    if 1 in move_nums and n >= 2:
+        chord_of_height = np.empty(n + 1, dtype=np.int64)
+        chord_of_height[heights] = np.arange(n)
+        lower = chord_of_height[1:] # chord at height h, for h = 1..n
+        upper = np.concatenate((lower[1:], lower[:1])) # chord at height h + 1 (mod n)
+        if n == 2:
+            lower, upper = lower[:1], upper[:1] # heights 1 and 2 are a single pair
+        s_a, e_a, s_b, e_b = starts[lower], ends[lower], starts[upper], ends[upper]
+        intersect = ((s_a < s_b) & (s_b < e_a) & (e_a < e_b)) | ((s_b < s_a) & (s_a < e_b) & (e_b < e_a))
+        first = np.minimum(lower, upper)[~intersect] + 1
+        second = np.maximum(lower, upper)[~intersect] + 1
+        legal.extend((1, {'i': i, 'j': j}) for i, j in sorted(zip(first.tolist(), second.tolist())))
+
+    if 2 in move_nums:
+        legal.append((2, {}))
+    if -2 in move_nums:
+        legal.append((-2, {}))
+
+    if 3 in move_nums and n >= 1:
+        closes = (ends - starts == 1) | ((starts == 0) & (ends == 2 * n - 1))
+        legal.extend((3, {'i': int(i) + 1}) for i in np.flatnonzero(closes))
+
+    if -3 in move_nums:
+        legal.extend((-3, {'after_point': after_point, 'new_sign': sign, 'new_height': height})
+                     for after_point in range(-1, 2 * n) for sign in ('+', '-') for height in range(1, n + 2))
+        legal.extend((-3, {'after_point': -1, 'new_sign': sign, 'new_height': height, 'reverse_points': True})
+                     for sign in ('+', '-') for height in range(1, n + 2))
+
+    return legal
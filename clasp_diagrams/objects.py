@@ -1,5 +1,7 @@
 from __future__ import annotations
+from functools import cached_property
 from pydantic.dataclasses import dataclass
+from clasp_diagrams.instrumentation import instrumented
 
 # TODO: (Eventually) add mirrors!
 
@@ -11,6 +13,16 @@ class ChordForMatrix:
     sign: str
     height: int
 
+    @classmethod
+    def _unsafe_make(cls, start_point: int, end_point: int, sign: str, height: int) -> ChordForMatrix:
+        """
+        Trusted constructor that skips pydantic validation (about twice as fast).
+        Only for internal code whose inputs are already guaranteed to be valid ints and signs.
+        """
+        chord = object.__new__(cls)
+        chord.__dict__.update(start_point=start_point, end_point=end_point, sign=sign, height=height)
+        return chord
+
 # Represents a chord by index with associated properties for array computations.
 @dataclass(frozen=True)
 class ChordForArray:
@@ -18,6 +30,16 @@ class ChordForArray:
     sign: str
     height: int
 
+    @classmethod
+    def _unsafe_make(cls, chord_idx: int, sign: str, height: int) -> ChordForArray:
+        """
+        Trusted constructor that skips pydantic validation (about twice as fast).
+        Only for internal code whose inputs are already guaranteed to be valid ints and signs.
+        """
+        chord = object.__new__(cls)
+        chord.__dict__.update(chord_idx=chord_idx, sign=sign, height=height)
+        return chord
+
 # Represents a clasp diagram, our main object.
 class ClaspDiagram:
     """
@@ -33,23 +55,34 @@ class ClaspDiagram:
         clasp_word (list[int] | None): 
             A grammatical representation of the clasp diagram.
 
-        e_matrix (sp.Matrix | None): 
+        e_matrix (np.ndarray): 
             The E-matrix used in symbolic computations.
         
-        l_matrix (sp.Matrix | None): 
+        l_matrix (np.ndarray): 
             The L-matrix used in symbolic computations.
         
-        le_matrix (sp.Matrix): 
+        le_matrix (np.ndarray): 
             The sum of L and E matrices.
         
         sd_matrix (sp.Matrix): 
             A symbolic matrix used for obtaining the alexander polynomial.
         
+        alexander_coefficients (tuple[int, ...]):
+            The integer coefficients of the Alexander polynomial, lowest degree first.
+
         alexander (sp.Expr): 
             The Alexander polynomial of the associated knot.
+
+        fingerprint (tuple[int, ...]):
+            The Alexander polynomial evaluated at a few points mod a large prime (fast isotopy filter).
+
+    The symbolic attributes (e_matrix, l_matrix, le_matrix, sd_matrix, alexander_coefficients, alexander) are computed lazily:
+    each one is materialized (and cached) the first time it is read, so building a diagram costs O(n).
+    Passing `calculate_symbolics=True` materializes all of them eagerly.
     """
 
-    def __init__(self, *, matrix=None, array=None, calculate_symbolics=True, calculate_word=False):
+    @instrumented('ClaspDiagram.__init__')
+    def __init__(self, *, matrix=None, array=None, calculate_symbolics=False, calculate_word=False):
         if (matrix is None) == (array is None):
             raise ValueError("Exactly one of `matrix` or `array` must be provided.")
     
@@ -62,19 +95,79 @@ class ClaspDiagram:
             self.matrix = self.derive_matrix_from_array()
 
         if calculate_symbolics:
-            from . import symbolics
-            self.e_matrix = symbolics.get_e_matrix(clasp_matrix=self.matrix)
-            self.l_matrix = symbolics.get_l_matrix(clasp_matrix=self.matrix)
-            self.le_matrix = symbolics.get_le_matrix(e_matrix=self.e_matrix,
-                                                    l_matrix=self.l_matrix)
-            self.sd_matrix = symbolics.get_sd_matrix(le_matrix=self.le_matrix)
-            self.alexander = symbolics.get_alexander_polynomial(sd_matrix=self.sd_matrix)
+            # Reading the last attributes of the chain materializes every matrix they depend on
+            self.sd_matrix
+            self.alexander
 
         if calculate_word:
             self.clasp_word = self.generate_clasp_word()
         else:
             self.clasp_word = None
 
+    @cached_property
+    def e_matrix(self):
+        """
+        Lazily computed E-matrix. O(n) time.
+        """
+        from clasp_diagrams import symbolics
+        return symbolics.get_e_matrix(clasp_matrix=self.matrix)
+
+    @cached_property
+    def l_matrix(self):
+        """
+        Lazily computed L-matrix. O(n²) time.
+        """
+        from clasp_diagrams import symbolics
+        return symbolics.get_l_matrix(clasp_matrix=self.matrix)
+
+    @cached_property
+    def le_matrix(self):
+        """
+        Lazily computed L + E matrix.
+        """
+        from clasp_diagrams import symbolics
+        return symbolics.get_le_matrix(e_matrix=self.e_matrix, l_matrix=self.l_matrix)
+
+    @cached_property
+    def sd_matrix(self):
+        """
+        Lazily computed S_D matrix (sympy). O(n²) time.
+        """
+        from clasp_diagrams import symbolics
+        return symbolics.get_sd_matrix(le_matrix=self.le_matrix)
+
+    @cached_property
+    def alexander_coefficients(self):
+        """
+        Lazily computed integer coefficients of the Alexander polynomial (lowest degree first).
+        Computed without sympy, see symbolics.get_alexander_coefficients.
+        """
+        from clasp_diagrams import symbolics
+        return symbolics.get_alexander_coefficients(le_matrix=self.le_matrix)
+
+    @cached_property
+    def alexander(self):
+        """
+        Lazily computed Alexander polynomial, built from alexander_coefficients on first access.
+        """
+        from clasp_diagrams import symbolics
+        return symbolics.coefficients_to_polynomial(self.alexander_coefficients)
+
+    @cached_property
+    def fingerprint(self):
+        """
+        Lazily computed numeric fingerprint: the Alexander polynomial evaluated at a few points mod a large prime.
+        Isotopic diagrams have equal fingerprints. See symbolics.get_alexander_fingerprint.
+        """
+        from clasp_diagrams import symbolics
+        return symbolics.get_alexander_fingerprint(le_matrix=self.le_matrix)
+
+    def may_be_isotopic(self, other: ClaspDiagram) -> bool:
+        """
+        Fast filter: False if the diagrams are certainly not isotopic (different fingerprints).
+        """
+        return self.fingerprint == other.fingerprint
+
     @classmethod
     def from_matrix(cls, *, matrix):
         """
@@ -101,6 +194,60 @@ class ClaspDiagram:
         validate_clasp_array(array) # O(m) time, O(m) space
         return cls(array=array)
     
+    @classmethod
+    def _from_trusted(cls, *, matrix=None, array=None):
+        """
+        Trusted factory for internal code (moves, generators) whose output is valid by construction.
+        Skips the validators; the missing representation is still derived.
+
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        from clasp_diagrams.transformations import transform_matrix_to_array, transform_array_to_matrix
+        if (matrix is None) == (array is None):
+            raise ValueError("Exactly one of `matrix` or `array` must be provided.")
+
+        clasp = cls.__new__(cls)
+        clasp.matrix = matrix if matrix is not None else transform_array_to_matrix(array)
+        clasp.array = array if array is not None else transform_matrix_to_array(matrix)
+        clasp.clasp_word = None
+        return clasp
+
+    def _seed(self, **invariants):
+        """
+        Pre-populates lazily computed attributes (e.g. l_matrix, alexander_coefficients) with values
+        derived elsewhere, typically by a move from the parent diagram's invariants.
+        """
+        lazy = {'e_matrix', 'l_matrix', 'le_matrix', 'sd_matrix', 'alexander_coefficients', 'alexander', 'packed',
+                'fingerprint'}
+        unknown = invariants.keys() - lazy
+        if unknown:
+            raise ValueError(f"Cannot seed unknown attributes: {sorted(unknown)}")
+        self.__dict__.update(invariants)
+
+    @classmethod
+    def from_packed(cls, packed):
+        """
+        Factory method to create a Clasp from a PackedClaspDiagram.
+        The packed chords are validated with a vectorized validator and kept as the `packed` attribute.
+
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        from clasp_diagrams.validators import validate_clasp_chords
+        validate_clasp_chords(packed.chords)
+        clasp = cls(matrix=packed.matrix)
+        clasp.packed = packed
+        return clasp
+
+    @cached_property
+    def packed(self):
+        """
+        Lazily computed array-backed representation of the diagram (a PackedClaspDiagram).
+        """
+        from clasp_diagrams.packed import PackedClaspDiagram
+        return PackedClaspDiagram.from_matrix(self.matrix)
+
     def derive_array_from_matrix(self):
         from clasp_diagrams.transformations import transform_matrix_to_array
         from clasp_diagrams.validators import validate_clasp_array
@@ -119,6 +266,21 @@ class ClaspDiagram:
 
         return matrix
     
+    def canonical(self, *, b_shifts=False, reflection=False) -> ClaspDiagram:
+        """
+        Returns the canonical representative of the diagram under rotation of its 2n points
+        (and optionally B-shifts and reflection). See canonical.canonical_matrix.
+        """
+        from clasp_diagrams.canonical import canonical_matrix
+        return ClaspDiagram._from_trusted(matrix=canonical_matrix(self, b_shifts=b_shifts, reflection=reflection))
+
+    def canonical_key(self, *, b_shifts=False, reflection=False) -> bytes:
+        """
+        Returns a compact bytes key, equal for diagrams with the same canonical form. See canonical.canonical_key.
+        """
+        from clasp_diagrams.canonical import canonical_key
+        return canonical_key(self, b_shifts=b_shifts, reflection=reflection)
+
     def generate_clasp_word(self):
         # TODO: (Postpone) Generate clasp word (algorithm is almost already done)
         raise NotImplementedError("Implement generation of clasp word.")
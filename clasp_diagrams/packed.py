@@ -0,0 +1,135 @@
+from __future__ import annotations
+from clasp_diagrams.objects import ChordForMatrix, ChordForArray, ClaspDiagram
+import numpy as np
+
+# One chord of a clasp matrix, packed in 13 bytes. Field names mirror ChordForMatrix; signs are stored as +1/-1.
+CHORD_DTYPE = np.dtype([('start_point', '<i4'),
+                        ('end_point', '<i4'),
+                        ('height', '<i4'),
+                        ('sign', 'i1')])
+
+SIGN_TO_INT = {'+': 1, '-': -1}
+INT_TO_SIGN = {1: '+', -1: '-'}
+
+# Compact, array-backed counterpart of a ClaspDiagram (struct-of-arrays).
+class PackedClaspDiagram:
+    """
+    Represents a clasp diagram as fixed-width NumPy arrays instead of pydantic chord objects.
+
+    Attributes:
+        chords (np.ndarray):
+            Structured array of dtype CHORD_DTYPE, one row per chord (the rows of the clasp matrix).
+
+        point_to_chord (np.ndarray):
+            int32 array of length 2n; entry p is the (0-indexed) row of the chord with an endpoint at p.
+
+    starts, ends, heights and signs are zero-copy views on `chords`. The `matrix` and `array`
+    representations used by ClaspDiagram are built on demand and are not stored.
+    No validation is done here; see validators.validate_clasp_chords.
+    """
+    __slots__ = ('chords', 'point_to_chord')
+
+    def __init__(self, chords: np.ndarray, point_to_chord: np.ndarray | None = None):
+        self.chords = chords
+        if point_to_chord is None:
+            n = len(chords)
+            point_to_chord = np.empty(2 * n, dtype=np.int32)
+            point_to_chord[chords['start_point']] = np.arange(n, dtype=np.int32)
+            point_to_chord[chords['end_point']] = np.arange(n, dtype=np.int32)
+        self.point_to_chord = point_to_chord
+
+    @classmethod
+    def from_arrays(cls, starts, ends, heights, signs) -> PackedClaspDiagram:
+        """
+        Packs start/end/height arrays and a sign array (+1/-1) into a PackedClaspDiagram.
+
+        Time complexity: O(n)
+        Space complexity: O(n)
+        """
+        chords = np.empty(len(starts), dtype=CHORD_DTYPE)
+        chords['start_point'] = starts
+        chords['end_point'] = ends
+        chords['height'] = heights
+        chords['sign'] = signs
+        return cls(chords)
+
+    @classmethod
+    def from_matrix(cls, matrix: tuple[ChordForMatrix]) -> PackedClaspDiagram:
+        """
+        Packs a tuple of ChordForMatrix instances.
+
+        Time complexity: O(n)
+        Space complexity: O(n)
+        """
+        chords = np.array([(chord.start_point, chord.end_point, chord.height, SIGN_TO_INT[chord.sign])
+                           for chord in matrix], dtype=CHORD_DTYPE)
+        return cls(chords)
+
+    @classmethod
+    def from_clasp(cls, clasp: ClaspDiagram) -> PackedClaspDiagram:
+        return cls.from_matrix(clasp.matrix)
+
+    @property
+    def starts(self) -> np.ndarray:
+        return self.chords['start_point']
+
+    @property
+    def ends(self) -> np.ndarray:
+        return self.chords['end_point']
+
+    @property
+    def heights(self) -> np.ndarray:
+        return self.chords['height']
+
+    @property
+    def signs(self) -> np.ndarray:
+        return self.chords['sign']
+
+    @property
+    def matrix(self) -> tuple[ChordForMatrix]:
+        """
+        The clasp matrix (tuple of ChordForMatrix), built on demand.
+
+        Time complexity: O(n)
+        """
+        return tuple(ChordForMatrix._unsafe_make(start_point=sp, end_point=ep,
+                                                 sign=INT_TO_SIGN[sign], height=height)
+                     for sp, ep, height, sign in self.chords.tolist())
+
+    @property
+    def array(self) -> list[ChordForArray]:
+        """
+        The clasp array (list of ChordForArray, each chord referenced twice), built on demand.
+
+        Time complexity: O(n)
+        """
+        chords = [ChordForArray._unsafe_make(chord_idx=idx + 1, sign=INT_TO_SIGN[sign], height=height)
+                  for idx, (sign, height) in enumerate(zip(self.signs.tolist(), self.heights.tolist()))]
+        return [chords[idx] for idx in self.point_to_chord.tolist()]
+
+    def to_clasp(self) -> ClaspDiagram:
+        """
+        Unpacks into a (validated) ClaspDiagram.
+        """
+        return ClaspDiagram.from_matrix(matrix=self.matrix)
+
+    def tobytes(self) -> bytes:
+        return self.chords.tobytes()
+
+    @property
+    def nbytes(self) -> int:
+        return self.chords.nbytes + self.point_to_chord.nbytes
+
+    def __len__(self):
+        return len(self.chords)
+
+    def __eq__(self, other):
+        if not isinstance(other, PackedClaspDiagram):
+            return NotImplemented
+        return np.array_equal(self.chords, other.chords)
+
+    def __hash__(self):
+        return hash(self.chords.tobytes())
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.chords.tolist()})"
@@ -0,0 +1,166 @@
+from __future__ import annotations
+from clasp_diagrams.objects import ClaspDiagram
+from clasp_diagrams.exploration import apply_move, diagram_key
+import clasp_diagrams.moves as moves
+from dataclasses import dataclass, field
+from typing import Callable
+import numpy as np
+import heapq
+import time
+
+# ==================== Heuristics ====================
+# A heuristic maps a diagram to an estimate of how far it is from the goal (lower is better).
+def chord_count(clasp: ClaspDiagram) -> float:
+    """
+    Number of chords. Each C1 move erases one chord, so this never overestimates the moves left to the unknot.
+    """
+    return len(clasp.matrix)
+
+def crossing_count(clasp: ClaspDiagram) -> float:
+    """
+    Number of intersecting pairs of chords (non-zero entries of the L-matrix).
+    A chord can only be erased once nothing crosses it.
+    """
+    return int(np.count_nonzero(clasp.l_matrix))
+
+HEURISTICS = {
+    'chords': chord_count,
+    'crossings': crossing_count,
+}
+
+# The outcome of a search.
+@dataclass
+class SearchResult:
+    found: bool
+    clasp: ClaspDiagram
+    path: list[tuple[int, dict]] = field(default_factory=list)
+    nodes_expanded: int = 0
+    nodes_generated: int = 0
+    elapsed: float = 0.0
+    stop_reason: str = ''
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes_expanded / self.elapsed if self.elapsed > 0 else 0.0
+
+def _reconstruct_path(came_from: dict, key: bytes) -> list[tuple[int, dict]]:
+    path = []
+    while came_from[key] is not None:
+        key, move = came_from[key]
+        path.append(move)
+    return path[::-1]
+
+def best_first_search(start: ClaspDiagram, *, heuristic: str | Callable[[ClaspDiagram], float] = 'chords',
+                      weight: float = 1.0, greedy: bool = False,
+                      goal: Callable[[ClaspDiagram], bool] | None = None,
+                      move_nums=(1, 2, -2, 3),
+                      key: Callable[[ClaspDiagram], bytes] = diagram_key,
+                      max_nodes: int | None = None, max_states: int | None = None,
+                      time_budget: float | None = None,
+                      isotopy_check_mode: str = 'off') -> SearchResult:
+    """
+    A* / best-first search over the move graph, trying to reduce a diagram to fewer chords.
+
+    Parameters
+    ----------
+    heuristic : str or callable
+        One of HEURISTICS ('chords', 'crossings') or a callable diagram -> float.
+    weight : float
+        States are ordered by f = g + weight·h, with g the number of moves from the start.
+    greedy : bool
+        If True, states are ordered by h alone (greedy best-first search).
+    goal : callable | None
+        Goal test. Defaults to reaching the empty (unknot) diagram.
+    move_nums : tuple[int]
+        Moves to use. -C1 (-3) is left out by default since it only adds chords.
+    key : callable
+        Maps a diagram to the bytes stored in the closed set, e.g. canonical.canonical_key.
+    max_nodes : int | None
+        Budget of expanded nodes.
+    max_states : int | None
+        Memory budget: maximum number of discovered states kept (frontier and closed set).
+    time_budget : float | None
+        Budget of wall time, in seconds.
+    isotopy_check_mode : str
+        Isotopy check policy of the moves during the search. 'off' by default.
+
+    States are closed when they are expanded, and re-opened when a path with fewer moves reaches them, so that
+    A* (weight 1, not greedy) with an admissible heuristic such as 'chords' returns a shortest path. The goal test
+    is done when a state is expanded, except in greedy mode which stops as soon as a goal is generated and never
+    re-opens states.
+
+    With the default goal, a start whose Alexander polynomial has a positive degree is not a diagram of the unknot
+    (the polynomial is invariant under the moves), and the search stops right away with stop_reason 'not_unknot'.
+
+    Returns
+    -------
+    SearchResult
+        If the goal is not reached, `clasp` and `path` describe the discovered state with the fewest chords.
+        nodes_per_second reports the expansion rate.
+    """
+    if isinstance(heuristic, str):
+        try:
+            heuristic = HEURISTICS[heuristic]
+        except KeyError:
+            raise ValueError(f"Invalid heuristic ({heuristic}). Must be one of {list(HEURISTICS)} or a callable.")
+    began = time.perf_counter()
+    if goal is None:
+        if len(start.alexander_coefficients) > 1:
+            return SearchResult(found=False, clasp=start, elapsed=time.perf_counter() - began, stop_reason='not_unknot')
+        goal = lambda clasp: len(clasp.matrix) == 0
+
+    start_key = key(start)
+    came_from = {start_key: None} # Parent links of the best known paths: key -> (parent key, move)
+    g_score = {start_key: 0} # Discovered states: key -> fewest moves known to reach them from the start
+    closed = set() # Expanded states
+    counter = 0 # Tie-breaker, so that the heap never compares diagrams
+    h = heuristic(start)
+    frontier = [(h if greedy else weight * h, h, counter, 0, start.packed, start_key)]
+    best = (len(start.matrix), start, start_key)
+    result = SearchResult(found=False, clasp=start)
+
+    def finish(clasp, clasp_key, found, reason):
+        result.found, result.clasp, result.stop_reason = found, clasp, reason
+        result.path = _reconstruct_path(came_from, clasp_key)
+        result.elapsed = time.perf_counter() - began
+        return result
+
+    while frontier:
+        if max_nodes is not None and result.nodes_expanded >= max_nodes:
+            return finish(best[1], best[2], False, 'nodes')
+        if time_budget is not None and time.perf_counter() - began >= time_budget:
+            return finish(best[1], best[2], False, 'time')
+
+        _, _, _, g, packed, clasp_key = heapq.heappop(frontier)
+        if clasp_key in closed or g > g_score[clasp_key]:
+            continue # Stale entry: the state was reached again with fewer moves
+        clasp = ClaspDiagram._from_trusted(matrix=packed.matrix)
+        if goal(clasp):
+            return finish(clasp, clasp_key, True, 'goal')
+        closed.add(clasp_key)
+        result.nodes_expanded += 1
+
+        with moves.isotopy_check(isotopy_check_mode):
+            for move in moves.legal_moves(clasp, move_nums=move_nums):
+                child = apply_move(clasp, *move)
+                child_key = key(child)
+                known = g_score.get(child_key)
+                if known is not None and (greedy or known <= g + 1):
+                    continue # Greedy ordering ignores g, so a shorter path to a known state changes nothing
+                closed.discard(child_key) # Re-opened if a shorter path was found
+                came_from[child_key] = (clasp_key, move)
+                g_score[child_key] = g + 1
+                result.nodes_generated += 1
+
+                if greedy and goal(child):
+                    return finish(child, child_key, True, 'goal')
+                if len(child.matrix) < best[0]:
+                    best = (len(child.matrix), child, child_key)
+                if max_states is not None and len(g_score) >= max_states:
+                    return finish(best[1], best[2], False, 'memory')
+
+                h = heuristic(child)
+                counter += 1
+                heapq.heappush(frontier, (h if greedy else g + 1 + weight * h, h, counter, g + 1, child.packed, child_key))
+
+    return finish(best[1], best[2], False, 'exhausted')
@@ -0,0 +1,241 @@
+from __future__ import annotations
+from clasp_diagrams.packed import PackedClaspDiagram
+from clasp_diagrams.canonical import _as_packed
+from array import array
+from typing import Iterable, Iterator
+import numpy as np
+import struct
+import mmap
+import os
+
+# ==================== Binary codec for clasp diagrams ====================
+# A diagram with n chords (rows of the clasp matrix, sorted by start point) is encoded as:
+#   varint n
+#   n varints: start point deltas (s_0, s_1 - s_0, ...)
+#   n varints: chord lengths (e_i - s_i)
+#   n varints: heights
+#   ceil(n/8) bytes: signs, one bit per chord (1 for '+'), least significant bit first
+# Varints are unsigned LEB128: 7 bits per byte, high bit set on every byte but the last.
+# Diagrams with up to 63 chords take at most 3n + ceil(n/8) + 1 bytes (vs 13n for CHORD_DTYPE).
+
+def encode_varints(values) -> bytes:
+    """
+    Encodes non-negative integers as unsigned LEB128 varints.
+
+    Time complexity: O(n) (vectorized)
+    """
+    values = np.asarray(values, dtype=np.uint64).ravel()
+    if values.size == 0:
+        return b''
+    if values.max() < 0x80: # Fast path: every varint is a single byte
+        return values.astype(np.uint8).tobytes()
+    widths = np.ones(len(values), dtype=np.int64)
+    for k in range(1, 10):
+        widths += values >= np.uint64(1 << 7 * k)
+    positions = np.arange(widths.max())
+    groups = (values[:, None] >> (7 * positions[None, :]).astype(np.uint64)) & np.uint64(0x7F)
+    groups |= (positions[None, :] < widths[:, None] - 1).astype(np.uint64) << np.uint64(7)
+    return groups[positions[None, :] < widths[:, None]].astype(np.uint8).tobytes()
+
+def decode_varints(buffer: np.ndarray, count: int, offset: int = 0) -> tuple[np.ndarray, int]:
+    """
+    Decodes `count` varints from a uint8 buffer, starting at `offset`.
+    Returns the values (int64) and the offset right after the last one.
+
+    Time complexity: O(n) (vectorized)
+    """
+    if count == 0:
+        return np.empty(0, dtype=np.int64), offset
+    window = buffer[offset:offset + 10 * count]
+    if len(window) >= count and window[:count].max() < 0x80: # Fast path: single-byte varints
+        return window[:count].astype(np.int64), offset + count
+    terminators = np.flatnonzero(window < 0x80)[:count]
+    if len(terminators) < count:
+        raise ValueError("Truncated varint data.")
+    end = int(terminators[-1]) + 1
+    starts = np.concatenate(([0], terminators[:-1] + 1))
+    group = np.repeat(np.arange(count), np.diff(np.concatenate((starts, [end]))))
+    shifts = (7 * (np.arange(end) - starts[group])).astype(np.uint64)
+    parts = (window[:end].astype(np.uint64) & np.uint64(0x7F)) << shifts
+    return np.bitwise_or.reduceat(parts, starts).astype(np.int64), offset + end
+
+def encode_diagram(diagram) -> bytes:
+    """
+    Encodes a ClaspDiagram, PackedClaspDiagram or clasp matrix.
+
+    Time complexity: O(n)
+    """
+    packed = _as_packed(diagram)
+    starts = packed.starts.astype(np.int64)
+    deltas = np.diff(starts, prepend=0)
+    return (encode_varints([len(packed)])
+            + encode_varints(np.concatenate((deltas, packed.ends - starts, packed.heights)))
+            + np.packbits(packed.signs > 0, bitorder='little').tobytes())
+
+def decode_diagram_from(buffer: np.ndarray, offset: int = 0) -> tuple[PackedClaspDiagram, int]:
+    """
+    Decodes the diagram encoded at `offset` of a uint8 buffer. Returns it and the offset of the next record.
+    No validation is done; see validators.validate_clasp_chords or PackedClaspDiagram.to_clasp.
+
+    Time complexity: O(n)
+    """
+    (n,), offset = decode_varints(buffer, 1, offset)
+    n = int(n)
+    fields, offset = decode_varints(buffer, 3 * n, offset)
+    deltas, lengths, heights = fields.reshape(3, n)
+    sign_bytes = (n + 7) // 8
+    if offset + sign_bytes > len(buffer):
+        raise ValueError("Truncated diagram record.")
+    positive = np.unpackbits(buffer[offset:offset + sign_bytes], count=n, bitorder='little')
+    starts = np.cumsum(deltas)
+    packed = PackedClaspDiagram.from_arrays(starts, starts + lengths, heights, np.where(positive, 1, -1))
+    return packed, offset + sign_bytes
+
+def decode_diagram(data: bytes) -> PackedClaspDiagram:
+    """
+    Decodes a single diagram encoded with encode_diagram().
+    """
+    packed, _ = decode_diagram_from(np.frombuffer(data, dtype=np.uint8))
+    return packed
+
+# ==================== Corpus files ====================
+# A corpus file is:
+#   header: MAGIC (8 bytes) + version (uint32)
+#   the diagram records, one after the other
+#   index: uint64 offset of every record, plus the offset where the records end
+#   footer: index offset (uint64), number of diagrams (uint64), INDEX_MAGIC (8 bytes)
+# Records are self-delimiting, so a corpus whose writer was not closed (no index) can still be read:
+# the index is then rebuilt by scanning the records.
+
+MAGIC = b'CLASPCRP'
+INDEX_MAGIC = b'CLASPIDX'
+VERSION = 1
+_HEADER = struct.Struct('<8sI')
+_FOOTER = struct.Struct('<QQ8s')
+
+class CorpusWriter:
+    """
+    Streams diagrams into a corpus file. Use as a context manager (or call close()) so the index gets written.
+    """
+    def __init__(self, path: str | os.PathLike, *, buffer_size: int = 1 << 20):
+        self._file = open(path, 'wb', buffering=buffer_size)
+        self._file.write(_HEADER.pack(MAGIC, VERSION))
+        self._offsets = array('Q')
+        self._position = _HEADER.size
+
+    def write(self, diagram) -> int:
+        """
+        Appends a diagram and returns its index in the corpus.
+        """
+        record = encode_diagram(diagram)
+        self._offsets.append(self._position)
+        self._file.write(record)
+        self._position += len(record)
+        return len(self._offsets) - 1
+
+    def write_many(self, diagrams: Iterable) -> int:
+        for diagram in diagrams:
+            self.write(diagram)
+        return len(self._offsets)
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def close(self):
+        if self._file.closed:
+            return
+        self._offsets.append(self._position)
+        self._file.write(np.frombuffer(self._offsets, dtype=np.uint64).astype('<u8').tobytes())
+        self._file.write(_FOOTER.pack(self._position, len(self._offsets) - 1, INDEX_MAGIC))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class CorpusReader:
+    """
+    Random access and streaming over a corpus file. The file is memory-mapped, so only the records
+    that are read are loaded. reader[i] and iteration return PackedClaspDiagram instances.
+    """
+    def __init__(self, path: str | os.PathLike):
+        self._file = open(path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        self._buffer = np.frombuffer(self._mmap, dtype=np.uint8)
+
+        if size < _HEADER.size or _HEADER.unpack_from(self._buffer)[0] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a clasp diagram corpus.")
+        self.version = _HEADER.unpack_from(self._buffer)[1]
+
+        try:
+            footer = _FOOTER.unpack_from(self._buffer, size - _FOOTER.size) if size >= _HEADER.size + _FOOTER.size else None
+            if footer is not None and footer[2] == INDEX_MAGIC:
+                index_offset, count, _ = footer
+                self.offsets = self._buffer[index_offset:index_offset + 8 * (count + 1)].view('<u8')
+            else:
+                self.offsets = self._scan(size)
+        except Exception:
+            self.close()
+            raise
+
+    def _scan(self, size: int) -> np.ndarray:
+        """
+        Rebuilds the record offsets of a corpus whose writer was never closed. A partial last record
+        (the writer crashed mid-write) is ignored: the index ends at the last complete record.
+        """
+        offsets, position = [], _HEADER.size
+        while position < size:
+            try:
+                _, end = decode_diagram_from(self._buffer, position)
+            except ValueError: # Truncated record
+                break
+            offsets.append(position)
+            position = end
+        return np.array(offsets + [position], dtype=np.uint64)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, idx: int) -> PackedClaspDiagram:
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError(f"Corpus index {idx} out of range.")
+        packed, _ = decode_diagram_from(self._buffer, int(self.offsets[idx]))
+        return packed
+
+    def __iter__(self) -> Iterator[PackedClaspDiagram]:
+        position, end = _HEADER.size, int(self.offsets[-1])
+        while position < end:
+            packed, position = decode_diagram_from(self._buffer, position)
+            yield packed
+
+    def close(self):
+        self.offsets = self._buffer = None
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def write_corpus(path: str | os.PathLike, diagrams: Iterable) -> int:
+    """
+    Writes the diagrams to a corpus file and returns how many were written.
+    """
+    with CorpusWriter(path) as writer:
+        return writer.write_many(diagrams)
+
+def read_corpus(path: str | os.PathLike) -> Iterator[PackedClaspDiagram]:
+    """
+    Streams the diagrams of a corpus file.
+    """
+    with CorpusReader(path) as reader:
+        yield from reader
@@ -1,8 +1,11 @@
 from clasp_diagrams.objects import ChordForMatrix, ChordForArray
-from clasp_diagrams.utils import matrix_chords_intersect
+from clasp_diagrams.instrumentation import instrumented, phase
+from clasp_diagrams.modular import DEFAULT_PRIME, det_mod, mod_inverse
+from fractions import Fraction
 import sympy as sp
 import numpy as np
 
+@instrumented('symbolics.e_matrix')
 def get_e_matrix(clasp_matrix: tuple[ChordForMatrix]) -> np.ndarray:
     """
     'E is the diagonal matrix encoding the signs of all chords, 
@@ -16,29 +19,83 @@ def get_e_matrix(clasp_matrix: tuple[ChordForMatrix]) -> np.ndarray:
     signs = np.array([1 if chord.sign == '+' else -1 for chord in clasp_matrix])
     return np.diag(signs)
 
+@instrumented('symbolics.l_matrix')
 def get_l_matrix(clasp_matrix: tuple[ChordForMatrix]) -> np.ndarray:
     """
     'For a pair i, j of intersecting chords with i passing over j 
     define lij = 1 if i<j and lij=−1 if i>j. 
     Set all remaining elements of L to be 0'.
 
+    Delegates to the vectorized get_l_matrix_from_arrays().
+
     Time complexity: O(n²)
-    TODO: (Eventually) consider switch to an interval tree.
     Space complexity: O(n²)
     """
-    n = len(clasp_matrix)
-    L = np.zeros(shape=(n,n))
+    starts = np.array([chord.start_point for chord in clasp_matrix], dtype=np.int32)
+    ends = np.array([chord.end_point for chord in clasp_matrix], dtype=np.int32)
+    heights = np.array([chord.height for chord in clasp_matrix], dtype=np.int32)
+    return get_l_matrix_from_arrays(starts, ends, heights)
 
-    for i in range(n):
-        for j in range(i+1, n):
-            if matrix_chords_intersect(clasp_matrix[i], clasp_matrix[j]):
-                if clasp_matrix[i].height > clasp_matrix[j].height:
-                    L[i][j] = 1
-                else:
-                    L[j][i] = -1
+def get_intersection_mask(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """
+    Boolean (n, n) matrix whose (i, j) entry tells whether chords i and j intersect.
+    Vectorized version of utils.matrix_chords_intersect: since start < end for every chord,
+    chords i and j intersect iff s_i < s_j < e_i < e_j or s_j < s_i < e_j < e_i.
+    (B, n) arrays of B diagrams give a (B, n, n) stack.
+
+    Time complexity: O(n²) (vectorized)
+    Space complexity: O(n²)
+    """
+    starts, ends = np.asarray(starts), np.asarray(ends)
+    s_i, e_i = starts[..., :, None], ends[..., :, None]
+    s_j, e_j = starts[..., None, :], ends[..., None, :]
+    crosses = (s_i < s_j) & (s_j < e_i) & (e_i < e_j) # i starts first and j ends last
+    return crosses | np.swapaxes(crosses, -1, -2)
+
+def get_l_matrix_from_arrays(starts: np.ndarray, ends: np.ndarray, heights: np.ndarray) -> np.ndarray:
+    """
+    Builds the L-matrix from the start/end/height arrays of a clasp matrix with broadcasting.
+    Entry (i, j) is set when chord i passes over an intersecting chord j: 1 if i<j and -1 if i>j.
+    (B, n) arrays of B diagrams give a (B, n, n) stack.
 
-    return L
+    Time complexity: O(n²) (vectorized)
+    Space complexity: O(n²)
+    """
+    heights = np.asarray(heights)
+    over = get_intersection_mask(starts, ends) & (heights[..., :, None] > heights[..., None, :])
+    return np.triu(over, 1).astype(np.int64) - np.tril(over, -1)
+
+def get_le_matrix_from_arrays(starts: np.ndarray, ends: np.ndarray, heights: np.ndarray, signs: np.ndarray) -> np.ndarray:
+    """
+    Returns L + E built from the start/end/height/sign (+1/-1) arrays of a clasp matrix,
+    e.g. the fields of a PackedClaspDiagram. (B, n) arrays of B diagrams give a (B, n, n) stack.
 
+    Time complexity: O(n²) (vectorized)
+    Space complexity: O(n²)
+    """
+    signs = np.asarray(signs, dtype=np.int64)
+    return get_l_matrix_from_arrays(starts, ends, heights) + signs[..., :, None] * np.eye(signs.shape[-1], dtype=np.int64)
+
+def update_l_matrix_rows(l_matrix: np.ndarray, starts: np.ndarray, ends: np.ndarray, heights: np.ndarray,
+                         rows: list[int]) -> np.ndarray:
+    """
+    Recomputes, in place, the rows and columns of the L-matrix belonging to the chords in `rows` (0-indexed).
+    Used by the moves to update the parent's L-matrix locally when only a few heights change their order.
+
+    Time complexity: O(kn) for k rows
+    Space complexity: O(n)
+    """
+    starts, ends, heights = np.asarray(starts), np.asarray(ends), np.asarray(heights)
+    idx = np.arange(len(starts))
+    for k in rows:
+        s_k, e_k, h_k = starts[k], ends[k], heights[k]
+        intersects = ((s_k < starts) & (starts < e_k) & (e_k < ends)) | ((starts < s_k) & (s_k < ends) & (ends < e_k))
+        direction = np.where(k < idx, 1, -1)
+        l_matrix[k, :] = np.where(intersects & (h_k > heights), direction, 0)
+        l_matrix[:, k] = np.where(intersects & (heights > h_k), -direction, 0)
+    return l_matrix
+
+@instrumented('symbolics.le_matrix')
 def get_le_matrix(e_matrix: np.ndarray, l_matrix: np.ndarray) -> np.ndarray:
     """
     Returns L + E.
@@ -47,6 +104,7 @@ def get_le_matrix(e_matrix: np.ndarray, l_matrix: np.ndarray) -> np.ndarray:
     """
     return l_matrix + e_matrix
 
+@instrumented('symbolics.sd_matrix')
 def get_sd_matrix(le_matrix: np.ndarray) -> sp.Matrix:
     """
     'For each pair i, j of intersecting chords with i passing over j define 
@@ -75,6 +133,7 @@ def get_sd_matrix(le_matrix: np.ndarray) -> sp.Matrix:
 
     return SD
 
+@instrumented('symbolics.alexander_polynomial')
 def get_alexander_polynomial(sd_matrix: sp.Matrix) -> sp.Expr:
     """
     Returns the alexander polynomial associated to the clasps's S_D matrix.
@@ -87,14 +146,447 @@ def get_alexander_polynomial(sd_matrix: sp.Matrix) -> sp.Expr:
 
     TODO: revisit the determinant computation and t-scaling. Maybe complexity can be improved.
     """
-    alpo = sd_matrix.det()
+    with phase('symbolics.determinant'):
+        alpo = sd_matrix.det()
     t = sp.symbols('t')
 
-    # Find minimal exponent of t
-    powers = [monom.as_powers_dict().get(t, 0) for monom in alpo.expand().as_ordered_terms()]
-    min_power = min(powers)
+    with phase('symbolics.t_rescale'):
+        # Find minimal exponent of t
+        powers = [monom.as_powers_dict().get(t, 0) for monom in alpo.expand().as_ordered_terms()]
+        min_power = min(powers)
 
-    if min_power < 0:
-        alpo = alpo * t**(-min_power)
+        if min_power < 0:
+            alpo = alpo * t**(-min_power)
     
-    return sp.collect(alpo.expand(), t)
\ No newline at end of file
+        return sp.collect(alpo.expand(), t)
+
+# ==================== Integer-coefficient Alexander polynomial engine ====================
+# S_D has Laurent entries, but t·S_D(t) = (t² - t)·U + (1 - t)·Uᵀ - t·E has polynomial ones,
+# where U is the off-diagonal part of L + E. Its determinant P(t) = tⁿ·det(S_D(t)) has degree at most 2n,
+# so it is fully determined by its values at 2n + 1 integer points, each of which is an integer determinant
+# (Bareiss engine), or modulo several primes (modular engines, see below).
+
+ALEXANDER_METHODS = ('auto', 'modular', 'interpolation', 'bareiss')
+MODULAR_MIN_CHORDS = 14 # 'auto' uses the modular engine from this many chords on, Bareiss below
+
+@instrumented('symbolics.alexander_coefficients')
+def get_alexander_coefficients(le_matrix: np.ndarray, *, method: str = 'auto') -> tuple[int, ...]:
+    """
+    Returns the coefficients (lowest degree first) of the alexander polynomial associated to the LE-matrix,
+    with the same t-scaling as get_alexander_polynomial() (no negative powers of t, lowest power is t^0).
+    Exact integer arithmetic, no sympy involved. Use coefficients_to_polynomial() to get a sympy expression.
+
+    method : str
+        'auto' (default): 'bareiss' below MODULAR_MIN_CHORDS chords, 'modular' from there on.
+        'modular': characteristic polynomials modulo word-sized primes, see _alexander_coefficients_modular().
+        'interpolation': determinants modulo word-sized primes, see _alexander_coefficients_interpolation().
+        'bareiss': exact integer determinants, see _alexander_coefficients_bareiss().
+    """
+    if method not in ALEXANDER_METHODS:
+        raise ValueError(f"Invalid method ({method}). Must be one of {ALEXANDER_METHODS}.")
+    n = le_matrix.shape[0]
+    if n == 0:
+        return (1,)
+
+    le = np.asarray(le_matrix).astype(np.int64)
+    e = np.diag(np.diag(le))
+    u = le - e
+    if method == 'auto':
+        method = 'modular' if n >= MODULAR_MIN_CHORDS else 'bareiss'
+    if method == 'modular':
+        coefficients = _alexander_coefficients_modular(u, e)
+    elif method == 'interpolation':
+        coefficients = _alexander_coefficients_interpolation(u, e)
+    else:
+        coefficients = _alexander_coefficients_bareiss(u, e)
+
+    return _strip_zeros(coefficients)
+
+def _strip_zeros(coefficients: list[int]) -> tuple[int, ...]:
+    """
+    Strips the leading zeros produced by the tⁿ factor (and the trailing ones, if any).
+    """
+    low = next(k for k, c in enumerate(coefficients) if c != 0)
+    high = max(k for k, c in enumerate(coefficients) if c != 0)
+    return tuple(coefficients[low:high + 1])
+
+def _alexander_coefficients_bareiss(u: np.ndarray, e: np.ndarray) -> list[int]:
+    """
+    P(t) = tⁿ·det(S_D(t)) is evaluated at the 2n + 1 points 0, ±1, ..., ±n with fraction-free (Bareiss)
+    elimination and recovered with Newton interpolation.
+
+    Time complexity: O(n⁴) integer operations
+    Space complexity: O(n²)
+    """
+    n = u.shape[0]
+    points = [0] + [sign * k for k in range(1, n + 1) for sign in (1, -1)]
+    with phase('symbolics.determinant'):
+        values = [bareiss_det(((a*a - a) * u + (1 - a) * u.T - a * e).tolist()) for a in points]
+    with phase('symbolics.interpolation'):
+        return _newton_to_monomial(points, _divided_differences(points, values))
+
+# ==================== Modular engines ====================
+# Both compute P(t) = tⁿ·det(S_D(t)) modulo primes p < 2²⁶, using enough primes for their product to exceed
+# twice the coefficient bound, and reconstruct the coefficients by the Chinese remainder theorem.
+#
+# Bound: for |t| = 1, |c_k| <= max|P(t)| (Cauchy) <= Π ‖row_i of t·S_D(t)‖₂ (Hadamard) <= Π sqrt(1 + 4k_i),
+# where k_i is the number of chords intersecting chord i (|t² - t| = |1 - t| <= 2 and |t| = 1 on the circle).
+#
+# Interpolation engine: S_D(1/t) = S_D(t)ᵀ makes P(t) palindromic (c_k = c_{2n-k}), so P(t) = tⁿ·Q(t + 1/t)
+# with deg Q = n: n + 1 evaluations of P determine it. P is evaluated at x = 2, ..., n + 2 (whose values
+# s = x + 1/x are distinct mod p) with batched modular elimination, then Q is interpolated and expanded back.
+#
+# Characteristic polynomial engine (the default): P(t) = det(M(t)) with M(t) = t²·U - t·(U + Uᵀ + E) + Uᵀ.
+# Substituting t = (y + 1)/y gives y²·M(t) = N(y) = -E·y² + (U - Uᵀ - E)·y + U, whose leading coefficient
+# -E is invertible (E² = I), so det(N(y)) = det(-E)·det(y·I - C) with the 2n × 2n companion matrix
+# C = [[0, I], [E·U, E·(U - Uᵀ) - I]]. One characteristic polynomial per prime, O(n³) instead of O(n⁴),
+# then P(t) = (t - 1)²ⁿ·det(N(1/(t - 1))) by a Taylor shift.
+
+_MAX_BATCH_ENTRIES = 1 << 22 # Bounds the memory of a batched elimination (int64 entries)
+_CHARPOLY_WORKSPACE = 5 # Matrices held per batch row at the peak of modular.charpoly_mod
+_DET_WORKSPACE = 4 # Matrices held per batch row at the peak of building S_D and modular.det_mod
+
+def alexander_coefficient_bound(u: np.ndarray) -> int:
+    """
+    Returns the square of a bound on the absolute value of the coefficients of P(t) = tⁿ·det(S_D(t)).
+    """
+    crossings = np.count_nonzero((u != 0) | (u.T != 0), axis=1)
+    bound_squared = 1
+    for k in crossings.tolist():
+        bound_squared *= 1 + 4 * k
+    return bound_squared
+
+def _primes_for_bound(bound_squared: int) -> list[int]:
+    from clasp_diagrams.modular import word_primes, DOT_PRIME_LIMIT
+    count, modulus = 0, 1
+    while modulus * modulus <= 4 * bound_squared: # modulus > 2·bound
+        count += 1
+        modulus *= word_primes(count, DOT_PRIME_LIMIT)[-1]
+    return word_primes(count, DOT_PRIME_LIMIT)
+
+def _palindromic_expansion(n: int, q: np.ndarray, p: int) -> np.ndarray:
+    """
+    Coefficients mod p (degree 0 to 2n) of tⁿ·Q(t + 1/t) = Σ_j q_j·t^(n-j)·(1 + t²)^j.
+    """
+    expansion = np.zeros((2 * n + 1, n + 1), dtype=np.int64)
+    binomials = np.ones(1, dtype=np.int64)
+    for j in range(n + 1):
+        expansion[n - j + 2 * np.arange(j + 1), j] = binomials
+        binomials = np.concatenate(([1], (binomials[1:] + binomials[:-1]) % p, [1]))
+    return (expansion * q[None, :] % p).sum(axis=1) % p
+
+def _interpolate_mod(points: np.ndarray, values: np.ndarray, p: int) -> np.ndarray:
+    """
+    Coefficients mod p (lowest degree first) of the polynomial of degree < len(points) through the given values.
+    Newton divided differences, then expansion of the Newton form.
+
+    Time complexity: O(m²) (vectorized per level)
+    """
+    from clasp_diagrams.modular import mod_inverse
+    m = len(points)
+    differences = values % p
+    for level in range(1, m):
+        denominators = (points[level:] - points[:-level]) % p
+        differences[level:] = (differences[level:] - differences[level - 1:-1]) % p * mod_inverse(denominators, p) % p
+
+    polynomial = np.zeros(m, dtype=np.int64)
+    polynomial[0] = differences[-1]
+    for i in range(m - 2, -1, -1):
+        # polynomial = polynomial·(t - points[i]) + differences[i]
+        shifted = np.concatenate(([0], polynomial[:-1]))
+        polynomial = (shifted - points[i] * polynomial % p) % p
+        polynomial[0] = (polynomial[0] + differences[i]) % p
+    return polynomial
+
+def _alexander_coefficients_modular(u: np.ndarray, e: np.ndarray) -> list[int]:
+    """
+    Multi-modular characteristic polynomial of the companion matrix, see the section comment.
+
+    Time complexity: O(P·n³) word operations for P primes, vectorized over the primes
+    Space complexity: O(P·n²)
+    """
+    return _alexander_coefficients_modular_batch(u[None], np.diag(e)[None])[0]
+
+def _companion_matrices(u: np.ndarray, signs: np.ndarray) -> np.ndarray:
+    """
+    The (B, 2n, 2n) companion matrices C = [[0, I], [E·U, E·(U - Uᵀ) - I]] of the section comment.
+    """
+    batch, n, _ = u.shape
+    companions = np.zeros((batch, 2 * n, 2 * n), dtype=np.int64)
+    companions[:, :n, n:] = np.eye(n, dtype=np.int64)
+    companions[:, n:, :n] = signs[:, :, None] * u
+    companions[:, n:, n:] = signs[:, :, None] * (u - np.swapaxes(u, 1, 2)) - np.eye(n, dtype=np.int64)
+    return companions
+
+def _alexander_coefficients_modular_batch(u: np.ndarray, signs: np.ndarray) -> list[list[int]]:
+    """
+    _alexander_coefficients_modular() for a (B, n, n) stack of off-diagonal parts U and the (B, n) signs,
+    with every (diagram, prime) characteristic polynomial computed in the same batched elimination.
+    The primes are chosen for the largest coefficient bound of the batch.
+
+    Time complexity: O(B·P·n³) word operations, vectorized over diagrams and primes
+    Space complexity: O(B·n² + B·P·n) (eliminations bounded by batching)
+    """
+    from clasp_diagrams.modular import charpoly_mod, crt
+    batch, n, _ = u.shape
+    primes = _primes_for_bound(max(alexander_coefficient_bound(matrix) for matrix in u))
+    moduli = np.tile(np.array(primes, dtype=np.int64), batch) # Diagram-major: row b·P + i is diagram b mod prime i
+
+    with phase('symbolics.determinant'):
+        # Companion matrices are built chunk by chunk, one copy per (diagram, prime) row. A chunk holds
+        # _CHARPOLY_WORKSPACE matrices per row at the peak of charpoly_mod (Hessenberg form, its update
+        # temporaries and the minors), which keeps memory within _MAX_BATCH_ENTRIES whatever the batch size.
+        charpoly = np.empty((len(moduli), 2 * n + 1), dtype=np.int64)
+        chunk = max(1, _MAX_BATCH_ENTRIES // (_CHARPOLY_WORKSPACE * 4 * n * n))
+        for begin in range(0, len(moduli), chunk):
+            rows = np.arange(begin, min(begin + chunk, len(moduli)))
+            diagrams = rows // len(primes)
+            charpoly[rows] = charpoly_mod(_companion_matrices(u[diagrams], signs[diagrams]), moduli[rows])
+
+    with phase('symbolics.interpolation'):
+        # Horner's scheme in (t - 1): Σ_k χ_k·(t - 1)^(2n - k), highest power of (t - 1) first
+        shifted = np.zeros_like(charpoly)
+        for k in range(2 * n + 1):
+            shifted = (np.roll(shifted, 1, axis=1) - shifted) % moduli[:, None]
+            shifted[:, 0] = (shifted[:, 0] + charpoly[:, k]) % moduli
+        det_minus_e = (-1) ** n * np.prod(signs, axis=1)
+        shifted = (shifted * np.repeat(det_minus_e, len(primes))[:, None] % moduli[:, None]).reshape(batch, len(primes), -1)
+        return [crt(residues.tolist(), primes) for residues in shifted]
+
+def _alexander_coefficients_interpolation(u: np.ndarray, e: np.ndarray) -> list[int]:
+    """
+    Multi-modular evaluation/interpolation of P(t) = tⁿ·det(S_D(t)), see the section comment.
+
+    Time complexity: O(P·n⁴) word operations for P primes, vectorized to O(P·n²) NumPy operations
+    Space complexity: O(P·n³) (bounded by batching)
+    """
+    from clasp_diagrams.modular import det_mod, mod_inverse, mod_pow, crt
+    n = u.shape[0]
+    primes = _primes_for_bound(alexander_coefficient_bound(u))
+    x = np.arange(2, n + 3, dtype=np.int64)
+
+    with phase('symbolics.determinant'):
+        moduli = np.repeat(np.array(primes, dtype=np.int64), n + 1)
+        a = np.tile(x, len(primes))
+        values = np.empty(len(a), dtype=np.int64)
+        chunk = max(1, _MAX_BATCH_ENTRIES // (n * n))
+        for begin in range(0, len(a), chunk):
+            aa = a[begin:begin + chunk][:, None, None]
+            values[begin:begin + chunk] = det_mod((aa * aa - aa) * u + (1 - aa) * u.T - aa * e, moduli[begin:begin + chunk])
+        values = values.reshape(len(primes), n + 1)
+
+    with phase('symbolics.interpolation'):
+        residues = []
+        for p, evaluations in zip(primes, values):
+            x_inv = mod_inverse(x, p)
+            q = _interpolate_mod((x + x_inv) % p, evaluations * mod_pow(x_inv, n, p) % p, p)
+            residues.append(_palindromic_expansion(n, q, p))
+        return crt(residues, primes)
+
+def coefficients_to_polynomial(coefficients: tuple[int, ...]) -> sp.Expr:
+    """
+    Turns a coefficient vector (lowest degree first) into a sympy expression in t.
+    """
+    t = sp.symbols('t')
+    return sp.Add(*(sp.Integer(c) * t**k for k, c in enumerate(coefficients) if c != 0))
+
+def bareiss_det(matrix: list[list[int]]) -> int:
+    """
+    Exact determinant of a square integer matrix via fraction-free (Bareiss) elimination.
+    Every division performed is exact, so intermediate values stay integers.
+
+    Time complexity: O(n³)
+    Space complexity: O(n²)
+    """
+    m = [row[:] for row in matrix]
+    n = len(m)
+    sign = 1
+    prev = 1
+
+    for k in range(n - 1):
+        # Pivoting: swap in a row with a non-zero entry in column k
+        if m[k][k] == 0:
+            swap = next((i for i in range(k + 1, n) if m[i][k] != 0), None)
+            if swap is None:
+                return 0
+            m[k], m[swap] = m[swap], m[k]
+            sign = -sign
+
+        pivot = m[k][k]
+        row_k = m[k]
+        for i in range(k + 1, n):
+            row_i = m[i]
+            factor = row_i[k]
+            for j in range(k + 1, n):
+                row_i[j] = (pivot * row_i[j] - factor * row_k[j]) // prev
+        prev = pivot
+
+    return sign * m[n - 1][n - 1] if n > 0 else 1
+
+def _divided_differences(points: list[int], values: list[int]) -> list[Fraction]:
+    """
+    Newton divided differences of the (points, values) pairs.
+    """
+    coefficients = [Fraction(v) for v in values]
+    for level in range(1, len(points)):
+        for i in range(len(points) - 1, level - 1, -1):
+            coefficients[i] = (coefficients[i] - coefficients[i - 1]) / (points[i] - points[i - level])
+    return coefficients
+
+def _newton_to_monomial(points: list[int], newton: list[Fraction]) -> list[int]:
+    """
+    Expands a polynomial in Newton form into monomial coefficients (lowest degree first).
+    The interpolated polynomial has integer coefficients, so the result is exact.
+    """
+    monomial = [Fraction(0)] * len(newton)
+    # Horner's rule: p = newton[k] + (t - points[k])·p, from the innermost term outwards
+    for k in range(len(newton) - 1, -1, -1):
+        shifted = [Fraction(0)] + monomial[:-1]
+        monomial = [s - points[k] * c for s, c in zip(shifted, monomial)]
+        monomial[0] += newton[k]
+
+    if any(c.denominator != 1 for c in monomial):
+        raise ArithmeticError("Interpolated determinant has non-integer coefficients.")
+    return [int(c) for c in monomial]
+
+# ==================== Numeric Alexander fingerprints ====================
+# S_D(1/t) = S_D(t)ᵀ, so det(S_D(t)) is a symmetric Laurent polynomial: unlike the normalised polynomial,
+# it has no t-shift ambiguity, and its value at t = 1 is det(-E) = ±1. Hence det(S_D(a)) / det(S_D(1)) is
+# an isotopy invariant for every point a, and a vector of such values is a cheap fingerprint: diagrams with
+# different fingerprints are not isotopic. S_D(a) = (a - 1)·U + (a⁻¹ - 1)·Uᵀ - E is built straight from
+# the LE-matrix (U its off-diagonal part, E its diagonal), without sympy.
+
+FINGERPRINT_POINTS = (-1, 2, 3, 5, 7)
+
+def _sd_sign(le_matrix: np.ndarray) -> int:
+    """
+    det(S_D(1)) = det(-E) = (-1)ⁿ·Πe_ii.
+    """
+    diagonal = np.diag(le_matrix)
+    return (-1) ** len(diagonal) * int(np.prod(diagonal))
+
+@instrumented('symbolics.alexander_fingerprint')
+def get_alexander_fingerprint(le_matrix: np.ndarray, *, points: tuple[int, ...] = FINGERPRINT_POINTS,
+                              prime: int = DEFAULT_PRIME) -> tuple[int, ...]:
+    """
+    Returns det(S_D(a)) / det(S_D(1)) mod prime at every point a, an isotopy invariant fingerprint.
+    Equals the Alexander polynomial (centered so that it is symmetric, signed so that its value at 1 is 1)
+    evaluated at the points, mod prime. The determinants are computed in one batched modular elimination.
+
+    Time complexity: O(k·n³) for k points (vectorized)
+    Space complexity: O(k·n²)
+    """
+    return tuple(int(v) for v in get_alexander_fingerprints(np.asarray(le_matrix)[None], points=points, prime=prime)[0])
+
+def get_alexander_fingerprint_complex(le_matrix: np.ndarray, *, num_points: int = 6) -> np.ndarray:
+    """
+    Returns det(S_D(ω)) / det(S_D(1)) at the roots of unity ω = exp(2πik/(2·num_points + 1)), k = 1..num_points.
+    The values are real, since the polynomial is symmetric with real coefficients and |ω| = 1.
+    Floating point: compare with a tolerance (e.g. np.allclose).
+
+    Time complexity: O(k·n³) (vectorized)
+    Space complexity: O(k·n²)
+    """
+    le = np.asarray(le_matrix, dtype=np.float64)
+    e = np.diag(np.diag(le))
+    u = le - e
+    omega = np.exp(2j * np.pi * np.arange(1, num_points + 1) / (2 * num_points + 1))
+    sd = (omega - 1)[:, None, None] * u + (np.conj(omega) - 1)[:, None, None] * u.T - e
+    return np.linalg.det(sd).real * _sd_sign(le)
+
+# ==================== Batched evaluation ====================
+# Diagrams with the same number of chords n are handled as (B, n, n) stacks of LE-matrices, e.g. built by
+# get_le_matrix_from_arrays() from the (B, n) fields of a batch of chords, so that scoring a whole search
+# frontier costs a few vectorized passes instead of B Python-level calls.
+
+def get_sd_matrices_at(le_matrices: np.ndarray, t0: complex) -> np.ndarray:
+    """
+    Numeric S_D(t0) = (t0 - 1)·U + (1/t0 - 1)·Uᵀ - E for a (B, n, n) stack of LE-matrices.
+    Real t0 gives float64 matrices, complex t0 complex128 ones.
+
+    Time complexity: O(B·n²) (vectorized)
+    Space complexity: O(B·n²)
+    """
+    le = np.asarray(le_matrices, dtype=np.complex128 if np.iscomplexobj(t0) else np.float64)
+    e = le * np.eye(le.shape[-1])
+    u = le - e
+    return (t0 - 1) * u + (1 / t0 - 1) * np.swapaxes(u, -1, -2) - e
+
+def _sd_signs(le_matrices: np.ndarray) -> np.ndarray:
+    """
+    det(S_D(1)) = (-1)ⁿ·Πe_ii for every matrix of the stack.
+    """
+    diagonals = np.diagonal(le_matrices, axis1=-2, axis2=-1).astype(np.int64)
+    return (-1) ** diagonals.shape[-1] * np.prod(diagonals, axis=-1)
+
+@instrumented('symbolics.alexander_values')
+def get_alexander_values(le_matrices: np.ndarray, t0: complex, *, log: bool = False):
+    """
+    Returns det(S_D(t0)) / det(S_D(1)) for every diagram of a (B, n, n) stack of LE-matrices: the Alexander
+    polynomials (centered so that they are symmetric, signed so that their value at 1 is 1) evaluated at t0,
+    with one batched numpy.linalg.det. Floating point: compare with a tolerance.
+
+    log : bool
+        If True, returns (sign, logabsdet) arrays from numpy.linalg.slogdet instead, which neither overflow
+        nor underflow for large n (sign is a unit complex number for complex t0).
+
+    Time complexity: O(B·n³) (LAPACK, batched)
+    Space complexity: O(B·n²)
+    """
+    sd = get_sd_matrices_at(le_matrices, t0)
+    signs = _sd_signs(le_matrices)
+    if log:
+        sign, logabsdet = np.linalg.slogdet(sd)
+        return sign * signs, logabsdet
+    return np.linalg.det(sd) * signs
+
+def get_alexander_fingerprints(le_matrices: np.ndarray, *, points: tuple[int, ...] = FINGERPRINT_POINTS,
+                               prime: int = DEFAULT_PRIME) -> np.ndarray:
+    """
+    get_alexander_fingerprint() for a (B, n, n) stack of LE-matrices, as a (B, k) array for k points.
+    The B·k determinants are computed in batched modular eliminations of at most _MAX_BATCH_ENTRIES entries.
+
+    Time complexity: O(B·k·n³) (vectorized)
+    Space complexity: O(B·n²) (plus the bounded batches)
+    """
+    le = np.asarray(le_matrices, dtype=np.int64)
+    n, k = le.shape[-1], len(points)
+    a = np.array(points, dtype=np.int64) % prime
+    if np.any(a == 0):
+        raise ValueError(f"Invalid fingerprint points {points}: they must be invertible mod {prime}.")
+
+    a_inv = mod_inverse(a, prime)
+    a, a_inv = a[:, None, None], a_inv[:, None, None]
+    diagonal = np.eye(n, dtype=bool)
+    values = np.empty((len(le), k), dtype=np.int64)
+    chunk = max(1, _MAX_BATCH_ENTRIES // max(1, _DET_WORKSPACE * k * n * n)) # Diagrams per batched elimination
+    for begin in range(0, len(le), chunk):
+        u = np.where(diagonal, 0, le[begin:begin + chunk])[:, None]
+        sd = (a - 1) * u
+        sd += (a_inv - 1) * np.swapaxes(u, -1, -2)
+        sd[..., diagonal] = -le[begin:begin + chunk, None][..., diagonal]
+        sd %= prime
+        values[begin:begin + chunk] = det_mod(sd.reshape((len(sd) * k, n, n)), prime).reshape(len(sd), k)
+    return values * (_sd_signs(le)[:, None] % prime) % prime
+
+@instrumented('symbolics.alexander_coefficients_batch')
+def get_alexander_coefficients_batch(le_matrices: np.ndarray, *, method: str = 'modular') -> list[tuple[int, ...]]:
+    """
+    get_alexander_coefficients() for a (B, n, n) stack of LE-matrices. The default 'modular' engine computes
+    the characteristic polynomials of every (diagram, prime) pair in one batched elimination, which amortizes
+    its per-step overhead across the batch. Other methods run diagram by diagram.
+
+    Time complexity: O(B·P·n³) word operations for P primes (vectorized)
+    Space complexity: O(B·n² + B·P·n) (eliminations bounded by batching)
+    """
+    if method not in ALEXANDER_METHODS:
+        raise ValueError(f"Invalid method ({method}). Must be one of {ALEXANDER_METHODS}.")
+    le = np.asarray(le_matrices, dtype=np.int64)
+    if method != 'modular' or len(le) == 0:
+        return [get_alexander_coefficients(matrix, method=method) for matrix in le]
+    if le.shape[-1] == 0:
+        return [(1,)] * len(le)
+
+    signs = np.diagonal(le, axis1=1, axis2=2)
+    u = le - signs[:, :, None] * np.eye(le.shape[-1], dtype=np.int64)
+    return [_strip_zeros(coefficients) for coefficients in _alexander_coefficients_modular_batch(u, signs)]
@@ -1,6 +1,8 @@
 from clasp_diagrams.objects import ChordForMatrix, ChordForArray
+from clasp_diagrams.instrumentation import instrumented
 from collections import defaultdict
 
+@instrumented('transform.matrix_to_array')
 def transform_matrix_to_array(matrix: tuple[ChordForMatrix]) -> list[ChordForArray]:
     """
     Transforms a clasp matrix into a clasp array (list).
@@ -20,14 +22,15 @@ def transform_matrix_to_array(matrix: tuple[ChordForMatrix]) -> list[ChordForArr
 
     # Create the chords for the array and fill it.
     for i, chord_for_matrix in enumerate(matrix):
-        chord_for_array = ChordForArray(chord_idx=i+1, 
-                                        sign=chord_for_matrix.sign,
-                                        height=chord_for_matrix.height)
+        chord_for_array = ChordForArray._unsafe_make(chord_idx=i+1,
+                                                     sign=chord_for_matrix.sign,
+                                                     height=chord_for_matrix.height)
         sp, ep = chord_for_matrix.start_point, chord_for_matrix.end_point
         array[sp], array[ep] = chord_for_array, chord_for_array
 
     return array
 
+@instrumented('transform.array_to_matrix')
 def transform_array_to_matrix(array: list[ChordForArray]) -> tuple[ChordForMatrix]:
     """
     Transforms a clasp array into a clasp matrix (tuple).
@@ -64,7 +67,7 @@ def transform_array_to_matrix(array: list[ChordForArray]) -> tuple[ChordForMatri
     matrix = [None] * n
     for idx, chord_data in chords_dict.items():
         sp, sign, height, ep = chord_data
-        matrix[idx - 1] = ChordForMatrix(start_point=sp, end_point=ep, sign=sign, height=height)
+        matrix[idx - 1] = ChordForMatrix._unsafe_make(start_point=sp, end_point=ep, sign=sign, height=height)
 
     return tuple(matrix)
 
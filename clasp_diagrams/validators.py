@@ -1,10 +1,13 @@
 from clasp_diagrams.objects import ChordForMatrix, ChordForArray
+from clasp_diagrams.instrumentation import instrumented
 from collections import Counter
+import numpy as np
 
 class ClaspDiagramCreationError(Exception):
     """Raised when a ClaspDiagram cannot be created from the given input."""
     pass
 
+@instrumented('validation.matrix')
 def validate_clasp_matrix(matrix: tuple[ChordForMatrix]) -> None:
     """
     Validates the proposed tuple of ChordForMatrix instances.
@@ -57,6 +60,7 @@ def validate_clasp_matrix(matrix: tuple[ChordForMatrix]) -> None:
     if actual_points != expected_points:
         raise ClaspDiagramCreationError(f"Invalid start/end points: {actual_points - expected_points} (expected: 0 to {2 * n - 1})")
 
+@instrumented('validation.array')
 def validate_clasp_array(array: list[ChordForArray]) -> None:
     """
     Validates the proposed list of ChordForArray instances.
@@ -126,4 +130,68 @@ def validate_clasp_array(array: list[ChordForArray]) -> None:
 
     
 
-    
\ No newline at end of file
+    
+
+@instrumented('validation.chords')
+def validate_clasp_chords(chords: np.ndarray) -> None:
+    """
+    Validates a packed structured array of chords (see packed.CHORD_DTYPE).
+    Applies the same rules as validate_clasp_matrix(), vectorized.
+    Raises errors if something's off, else just returns.
+
+    n is the number of chords.
+    Time complexity: O(n)
+    Space complexity: O(n)
+    """
+    if chords is None:
+        raise ClaspDiagramCreationError("chords argument is None")
+    if not isinstance(chords, np.ndarray) or chords.ndim != 1 or chords.dtype.names is None:
+        raise TypeError("chords argument must be a one-dimensional structured array of CHORD_DTYPE")
+    
+    n = len(chords)
+    starts, ends, heights, signs = chords['start_point'], chords['end_point'], chords['height'], chords['sign']
+
+    # heights are a permutation of 1..n
+    if not np.array_equal(np.sort(heights), np.arange(1, n + 1)):
+        raise ClaspDiagramCreationError(f"The heights are invalid: {heights.tolist()}")
+
+    # signs are +1 or -1
+    if not np.all(np.abs(signs) == 1):
+        raise ClaspDiagramCreationError(f"Invalid signs encountered: {signs.tolist()}")
+
+    # end points greater than start points, start points strictly increasing
+    if np.any(ends <= starts):
+        raise ClaspDiagramCreationError(f"Invalid start and endpoint in chord {int(np.argmax(ends <= starts))}")
+    if np.any(np.diff(starts) <= 0):
+        raise ClaspDiagramCreationError(f"Invalid order of the start points: {starts.tolist()}")
+
+    # all points go from 0 to 2n-1 uniquely
+    if not np.array_equal(np.sort(np.concatenate([starts, ends])), np.arange(2 * n)):
+        raise ClaspDiagramCreationError(f"Invalid start/end points (expected: 0 to {2 * n - 1})")
+
+@instrumented('validation.chord_batch')
+def validate_clasp_chord_batch(batch: np.ndarray) -> None:
+    """
+    Validates a (B, n) structured array of chords (see packed.CHORD_DTYPE), one diagram per row,
+    applying validate_clasp_chords() to every row at once.
+    Raises errors (naming the first invalid row) if something's off, else just returns.
+
+    Time complexity: O(B·n log n) (vectorized)
+    Space complexity: O(B·n)
+    """
+    if not isinstance(batch, np.ndarray) or batch.ndim != 2 or batch.dtype.names is None:
+        raise TypeError("batch argument must be a two-dimensional structured array of CHORD_DTYPE")
+
+    n = batch.shape[1]
+    starts, ends, heights, signs = batch['start_point'], batch['end_point'], batch['height'], batch['sign']
+    checks = [
+        (np.all(np.sort(heights, axis=1) == np.arange(1, n + 1), axis=1), "The heights are invalid"),
+        (np.all(np.abs(signs) == 1, axis=1), "Invalid signs encountered"),
+        (np.all(ends > starts, axis=1), "Invalid start and endpoint"),
+        (np.all(np.diff(starts, axis=1) > 0, axis=1), "Invalid order of the start points"),
+        (np.all(np.sort(np.concatenate([starts, ends], axis=1), axis=1) == np.arange(2 * n), axis=1),
+         f"Invalid start/end points (expected: 0 to {2 * n - 1})"),
+    ]
+    for valid, message in checks:
+        if not np.all(valid):
+            raise ClaspDiagramCreationError(f"{message} in diagram {int(np.argmin(valid))} of the batch")
@@ -0,0 +1,51 @@
+from clasp_diagrams.batch import compute_invariants, iter_invariants, stack_le_matrices, alexander_values, alexander_fingerprints
+from clasp_diagrams.objects import ClaspDiagram
+from clasp_diagrams.packed import PackedClaspDiagram
+from clasp_diagrams.generators import random_valid_matrix, random_chord_batch
+import numpy as np
+import clasp_diagrams.symbolics as symbolics
+import pytest
+
+@pytest.fixture(scope='module')
+def diagrams():
+    return [random_valid_matrix(n) for n in [0, 1, 2, 3, 4, 5, 6, 7] * 5]
+
+def test_matches_serial_computation(diagrams):
+    expected = [ClaspDiagram.from_matrix(matrix=matrix).alexander_coefficients for matrix in diagrams]
+    assert compute_invariants(diagrams, workers=0, chunksize=7) == expected
+    assert compute_invariants(diagrams, workers=2, chunksize=3) == expected
+
+def test_streaming_unordered(diagrams):
+    expected = compute_invariants(diagrams, workers=0)
+    streamed = dict(iter_invariants(iter(diagrams), workers=2, chunksize=4, ordered=False))
+    assert [streamed[k] for k in range(len(diagrams))] == expected
+
+def test_accepts_packed_and_seeds_clasps(diagrams, monkeypatch):
+    clasps = [ClaspDiagram.from_matrix(matrix=matrix) for matrix in diagrams[:10]]
+    packed = [PackedClaspDiagram.from_matrix(matrix) for matrix in diagrams[:10]]
+    assert compute_invariants(packed, workers=0) == compute_invariants(clasps, workers=0)
+
+    def fail(le_matrix):
+        raise AssertionError("Coefficients should have been seeded.")
+    monkeypatch.setattr(symbolics, 'get_alexander_coefficients', fail)
+    [clasp.alexander_coefficients for clasp in clasps]
+
+def test_invalid_chunksize():
+    with pytest.raises(ValueError):
+        compute_invariants([], chunksize=0)
+
+def test_same_size_batches():
+    chords = random_chord_batch(6, 4, np.random.default_rng(0))
+    clasps = [ClaspDiagram._from_trusted(matrix=PackedClaspDiagram(row.copy()).matrix) for row in chords]
+    le_matrices = stack_le_matrices(chords)
+    assert np.array_equal(le_matrices, stack_le_matrices(clasps))
+    assert all(np.array_equal(le, clasp.le_matrix) for le, clasp in zip(le_matrices, clasps))
+
+    assert np.allclose(alexander_values(chords, -1.0), alexander_values(clasps, -1.0))
+    fingerprints = alexander_fingerprints(clasps)
+    assert fingerprints == alexander_fingerprints(chords)
+    assert all('fingerprint' in clasp.__dict__ for clasp in clasps)
+    assert fingerprints == [clasp.fingerprint for clasp in clasps]
+
+    with pytest.raises(ValueError):
+        stack_le_matrices([random_valid_matrix(2), random_valid_matrix(3)])
@@ -0,0 +1,52 @@
+from clasp_diagrams.caching import InvariantCache
+from clasp_diagrams.objects import ClaspDiagram
+from clasp_diagrams.packed import PackedClaspDiagram
+from clasp_diagrams.generators import random_valid_matrix
+import clasp_diagrams.symbolics as symbolics
+import pytest
+
+def test_hits_and_misses():
+    cache = InvariantCache()
+    clasp = ClaspDiagram.from_matrix(matrix=random_valid_matrix(6))
+    coefficients = cache.alexander_coefficients(clasp)
+    assert coefficients == ClaspDiagram.from_matrix(matrix=clasp.matrix).alexander_coefficients
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    # A B-shift of the diagram is isotopic and shares the entry
+    shifted = clasp.move(move_num=2)
+    assert cache.alexander_coefficients(shifted) == coefficients
+    assert cache.alexander_coefficients(clasp.packed) == coefficients
+    assert (cache.hits, cache.misses) == (2, 1) and len(cache) == 1
+
+def test_hits_seed_the_diagram(monkeypatch):
+    cache = InvariantCache()
+    matrix = random_valid_matrix(5)
+    cache.alexander_coefficients(PackedClaspDiagram.from_matrix(matrix))
+
+    def fail(le_matrix):
+        raise AssertionError("The cached coefficients should have been used.")
+    monkeypatch.setattr(symbolics, 'get_alexander_coefficients', fail)
+    clasp = ClaspDiagram.from_matrix(matrix=matrix)
+    cache.alexander_coefficients(clasp)
+    assert clasp.alexander == cache.alexander(clasp)
+
+def test_lru_eviction():
+    cache = InvariantCache(max_entries=2, b_shifts=False)
+    matrices = [random_valid_matrix(n) for n in (1, 2, 3)]
+    for matrix in matrices:
+        cache.alexander_coefficients(matrix)
+    assert len(cache) == 2 and cache.evictions == 1
+    assert matrices[0] not in cache and matrices[2] in cache
+
+    with pytest.raises(ValueError):
+        InvariantCache(max_entries=0)
+
+def test_sqlite_tier_starts_warm(tmp_path):
+    path = str(tmp_path / 'invariants.sqlite')
+    matrices = [random_valid_matrix(n) for n in range(1, 8)]
+    with InvariantCache(path=path) as cache:
+        expected = [cache.alexander_coefficients(matrix) for matrix in matrices]
+
+    with InvariantCache(path=path) as cache:
+        assert [cache.alexander_coefficients(matrix) for matrix in matrices] == expected
+        assert cache.disk_hits == len(set(cache.key(matrix) for matrix in matrices))
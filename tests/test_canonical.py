@@ -0,0 +1,79 @@
+from hypothesis import given, settings, strategies as st
+from clasp_diagrams.canonical import canonical_matrix, canonical_key, is_canonical
+from clasp_diagrams.objects import ClaspDiagram, ChordForMatrix
+from clasp_diagrams.moves import cyclic_height_shift
+from clasp_diagrams.generators import random_valid_matrix
+from clasp_diagrams.validators import validate_clasp_matrix
+import random
+
+def rotate(matrix, r):
+    """
+    Moves every point p to p + r (mod 2n).
+    """
+    m = 2 * len(matrix)
+    chords = []
+    for chord in matrix:
+        sp, ep = sorted(((chord.start_point + r) % m, (chord.end_point + r) % m))
+        chords.append(ChordForMatrix(sp, ep, chord.sign, chord.height))
+    return tuple(sorted(chords, key=lambda chord: chord.start_point))
+
+def reflect(matrix):
+    """
+    Moves every point p to 2n - 1 - p and flips the sign of every chord.
+    """
+    m = 2 * len(matrix)
+    flipped = {'+': '-', '-': '+'}
+    chords = [ChordForMatrix(m - 1 - chord.end_point, m - 1 - chord.start_point, flipped[chord.sign], chord.height)
+              for chord in matrix]
+    return tuple(sorted(chords, key=lambda chord: chord.start_point))
+
+@given(st.integers(min_value=0, max_value=12))
+@settings(deadline=None)
+def test_canonical_key_invariant_under_rotation(n):
+    matrix = random_valid_matrix(n)
+    key = canonical_key(matrix)
+    for r in range(2 * n):
+        assert canonical_key(rotate(matrix, r)) == key
+
+@given(st.integers(min_value=0, max_value=12))
+@settings(deadline=None)
+def test_canonical_matrix_is_a_valid_rotation(n):
+    matrix = random_valid_matrix(n)
+    canonical = canonical_matrix(matrix)
+    validate_clasp_matrix(canonical)
+    assert any(rotate(matrix, r) == canonical for r in range(max(2 * n, 1)))
+    assert is_canonical(canonical)
+    assert canonical_matrix(canonical) == canonical
+
+@given(st.integers(min_value=2, max_value=10))
+@settings(deadline=None)
+def test_canonical_key_with_b_shifts(n):
+    clasp = ClaspDiagram.from_matrix(matrix=random_valid_matrix(n))
+    shifted = cyclic_height_shift(clasp)
+    rotated = ClaspDiagram.from_matrix(matrix=rotate(shifted.matrix, random.randrange(2 * n)))
+    assert clasp.canonical_key(b_shifts=True) == rotated.canonical_key(b_shifts=True)
+    assert clasp.canonical(b_shifts=True) == rotated.canonical(b_shifts=True)
+
+@given(st.integers(min_value=1, max_value=10))
+@settings(deadline=None)
+def test_canonical_key_with_reflection(n):
+    matrix = random_valid_matrix(n)
+    assert canonical_key(matrix, reflection=True) == canonical_key(reflect(matrix), reflection=True)
+    clasp = ClaspDiagram.from_matrix(matrix=matrix)
+    for b_shifts in (False, True):
+        canonical = ClaspDiagram.from_matrix(matrix=canonical_matrix(matrix, b_shifts=b_shifts, reflection=True))
+        coefficients = clasp.alexander_coefficients # The polynomial is defined up to sign
+        assert canonical.alexander_coefficients in (coefficients, tuple(-c for c in coefficients))
+        assert canonical.fingerprint == clasp.fingerprint
+
+def test_reflection_keeps_the_knot():
+    matrix = (ChordForMatrix(0, 3, '+', 1), ChordForMatrix(1, 5, '-', 2),
+              ChordForMatrix(2, 7, '-', 4), ChordForMatrix(4, 6, '+', 3))
+    for candidate in (reflect(matrix), canonical_matrix(matrix, reflection=True)):
+        assert ClaspDiagram.from_matrix(matrix=candidate).alexander_coefficients in ((-2, 5, -2), (2, -5, 2))
+
+def test_canonical_key_distinguishes_diagrams():
+    trefoil = (ChordForMatrix(0, 2, '+', 2), ChordForMatrix(1, 3, '+', 1))
+    figure_eight = (ChordForMatrix(0, 2, '-', 2), ChordForMatrix(1, 3, '+', 1))
+    assert canonical_key(trefoil) != canonical_key(figure_eight)
+    assert canonical_key(()) != canonical_key(((ChordForMatrix(0, 1, '+', 1)),))
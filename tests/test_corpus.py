@@ -0,0 +1,78 @@
+from clasp_diagrams.corpus import MemmapCorpus
+from clasp_diagrams.objects import ClaspDiagram
+from clasp_diagrams.packed import PackedClaspDiagram
+from clasp_diagrams.generators import random_valid_matrix
+import numpy as np
+import pickle
+import pytest
+
+@pytest.fixture
+def matrices():
+    return [random_valid_matrix(n) for n in list(range(9)) * 2]
+
+def test_create_and_index(tmp_path, matrices):
+    corpus = MemmapCorpus.create(tmp_path / 'corpus', (m for m in matrices))
+    assert len(corpus) == len(matrices)
+    assert corpus.num_chords.tolist() == [len(m) for m in matrices]
+    assert [corpus[k] for k in range(len(corpus))] == [PackedClaspDiagram.from_matrix(m) for m in matrices]
+    assert corpus[-1].to_clasp() == ClaspDiagram.from_matrix(matrix=matrices[-1])
+    with pytest.raises(IndexError):
+        corpus[len(matrices)]
+
+def test_views_are_zero_copy(tmp_path, matrices):
+    corpus = MemmapCorpus.create(tmp_path / 'corpus', matrices)
+    view = corpus[5]
+    assert np.shares_memory(view.chords, corpus.chords)
+    assert isinstance(corpus.chords, np.memmap)
+
+def test_pickles_by_path(tmp_path, matrices):
+    corpus = MemmapCorpus.create(tmp_path / 'corpus', matrices)
+    data = pickle.dumps(corpus)
+    assert len(data) < 200
+    assert list(pickle.loads(data)) == list(corpus)
+
+def test_invariant_columns(tmp_path, matrices):
+    corpus = MemmapCorpus.create(tmp_path / 'corpus', matrices)
+    corpus.compute_alexander(workers=0)
+    assert corpus.columns() == ['alexander', 'alexander_degree']
+    for k, matrix in enumerate(matrices):
+        coefficients = ClaspDiagram.from_matrix(matrix=matrix).alexander_coefficients
+        assert corpus.alexander_coefficients(k) == coefficients
+        assert corpus.column('alexander_degree')[k] == len(coefficients) - 1
+
+    with pytest.raises(ValueError):
+        corpus.add_column('too_short', np.zeros(3))
+
+def test_ragged_columns_are_mapped_once(tmp_path, matrices, monkeypatch):
+    corpus = MemmapCorpus.create(tmp_path / 'corpus', matrices)
+    corpus.add_ragged_column('lengths', ([len(m)] * 2 for m in matrices))
+    loads = []
+    load = np.load
+    monkeypatch.setattr(np, 'load', lambda *args, **kwargs: loads.append(args[0]) or load(*args, **kwargs))
+    assert [corpus.ragged_row('lengths', k).tolist() for k in range(len(corpus))] == [[len(m)] * 2 for m in matrices]
+    assert len(loads) == 2
+
+    corpus.add_ragged_column('lengths', ([len(m)] for m in matrices)) # Rewritten: mapped again
+    assert corpus.ragged_row('lengths', 3).tolist() == [len(matrices[3])]
+    assert len(loads) == 4
+
+@pytest.mark.parametrize('name', ['chords', 'offsets', 'alexander.values', 'alexander.offsets'])
+def test_reserved_column_names(tmp_path, matrices, name):
+    corpus = MemmapCorpus.create(tmp_path / 'corpus', matrices)
+    with pytest.raises(ValueError, match="Invalid column name"):
+        corpus.add_column(name, np.zeros(len(corpus)))
+    with pytest.raises(ValueError, match="Invalid column name"):
+        corpus.add_ragged_column(name, ([] for _ in matrices))
+    assert list(MemmapCorpus(corpus.path)) == list(corpus)
+
+def test_rewriting_columns_keeps_earlier_maps(tmp_path, matrices):
+    corpus = MemmapCorpus.create(tmp_path / 'corpus', matrices)
+    old = corpus.add_column('size', np.arange(len(corpus)))
+    corpus.add_ragged_column('lengths', ([k] for k in range(len(corpus))))
+    old_row = corpus.ragged_row('lengths', 4)
+
+    assert corpus.add_column('size', -np.arange(len(corpus)))[4] == -4
+    corpus.add_ragged_column('lengths', ([k, k] for k in range(len(corpus))))
+    assert old[4] == 4 and old_row.tolist() == [4]
+    assert corpus.ragged_row('lengths', 4).tolist() == [4, 4]
+    assert corpus.columns() == ['lengths', 'size']
@@ -0,0 +1,55 @@
+from clasp_diagrams.enumeration import count_diagrams, enumerate_diagrams, unrank_diagram, unrank_permutation, shard_range
+from itertools import permutations
+from clasp_diagrams.canonical import canonical_key
+from clasp_diagrams.validators import validate_clasp_chords
+import pytest
+
+@pytest.mark.parametrize('n', [0, 1, 2, 3])
+def test_enumerates_every_diagram_once(n):
+    diagrams = list(enumerate_diagrams(n))
+    assert len(diagrams) == count_diagrams(n) == [1, 2, 24, 720][n]
+    assert len({d.tobytes() for d in diagrams}) == len(diagrams)
+    for diagram in diagrams:
+        validate_clasp_chords(diagram.chords)
+
+def test_indices_match_unranking():
+    for index, diagram in enumerate_diagrams(3, start=100, stop=400, with_index=True):
+        assert unrank_diagram(3, index) == diagram
+
+def test_unrank_permutation_is_lexicographic():
+    assert [tuple(unrank_permutation(4, rank)) for rank in range(24)] == list(permutations(range(1, 5)))
+    assert unrank_permutation(0, 0) == []
+
+def test_unranking_large_indices():
+    n = 12 # 4·10¹⁸ diagrams: unranking must not step through the permutations
+    last = unrank_diagram(n, count_diagrams(n) - 1)
+    assert last.heights.tolist() == list(range(n, 0, -1)) and set(last.signs.tolist()) == {-1}
+    assert len(next(enumerate_diagrams(n, start=count_diagrams(n) // 3))) == n
+
+def test_resume_and_shards():
+    everything = list(enumerate_diagrams(3))
+    # 96 starts a height permutation block (2ⁿ = 8 diagrams each) of the third matching (n!·2ⁿ = 48 each),
+    # 123 falls partway through the signs of one
+    for start in (96, 123, 719):
+        assert list(enumerate_diagrams(3, start=start)) == everything[start:]
+    assert list(enumerate_diagrams(3, start=123, stop=200)) == everything[123:200]
+
+    sharded = []
+    for shard in range(7):
+        sharded += list(enumerate_diagrams(3, shard=shard, num_shards=7))
+    assert sharded == everything
+    assert shard_range(3, 6, 7)[1] == count_diagrams(3)
+    with pytest.raises(ValueError):
+        shard_range(3, 7, 7)
+
+@pytest.mark.parametrize('shard, num_shards', [(0, None), (None, 4), (4, 4), (-1, 4)])
+def test_invalid_shards(shard, num_shards):
+    with pytest.raises(ValueError):
+        next(enumerate_diagrams(3, shard=shard, num_shards=num_shards))
+
+@pytest.mark.parametrize('symmetry, b_shifts', [('rotation', False), ('rotation+b_shift', True)])
+def test_symmetry_keeps_one_per_class(symmetry, b_shifts):
+    classes = {canonical_key(d, b_shifts=b_shifts) for d in enumerate_diagrams(3)}
+    representatives = list(enumerate_diagrams(3, symmetry=symmetry))
+    assert len(representatives) == len(classes)
+    assert {canonical_key(d, b_shifts=b_shifts) for d in representatives} == classes
@@ -0,0 +1,80 @@
+from clasp_diagrams.environments import ClaspActions, ClaspEnv, VectorClaspEnv, MOVE_INVERSE_C1
+from clasp_diagrams.objects import ClaspDiagram, ChordForMatrix
+from clasp_diagrams.packed import PackedClaspDiagram
+from clasp_diagrams.generators import random_valid_matrix
+from clasp_diagrams.moves import legal_moves
+import numpy as np
+import pytest
+
+def test_action_encoding_round_trips():
+    actions = ClaspActions(4)
+    assert len(actions) == 6 + 2 + 4 + 7 * 2 * 4 + 2 * 4
+    for k, move in enumerate(actions.actions):
+        assert actions.index(*move) == k
+
+def test_mask_matches_legal_moves():
+    actions = ClaspActions(6)
+    for _ in range(10):
+        clasp = ClaspDiagram.from_matrix(matrix=random_valid_matrix(5))
+        mask = actions.mask(clasp)
+        assert set(np.flatnonzero(mask)) == {actions.index(*move) for move in legal_moves(clasp)}
+
+def test_full_diagram_cannot_grow():
+    env = ClaspEnv(max_chords=3, seed=0)
+    env.reset(clasp=ClaspDiagram.from_matrix(matrix=random_valid_matrix(3)))
+    mask = env.action_mask()
+    assert not mask[env.actions.kind == MOVE_INVERSE_C1].any()
+
+def test_env_unknots_and_terminates():
+    clasp = ClaspDiagram.from_matrix(matrix=(ChordForMatrix(0, 1, '+', 1),))
+    env = ClaspEnv(max_chords=3)
+    observation, info = env.reset(clasp=clasp)
+    assert observation['num_chords'] == 1 and observation['l_matrix'].shape == (3, 3)
+    _, reward, terminated, truncated, _ = env.step(env.actions.index(3, {'i': 1}))
+    assert terminated and not truncated and reward == pytest.approx(0.99)
+    with pytest.raises(ValueError):
+        env.step(env.actions.index(3, {'i': 1}))
+
+def test_env_truncates():
+    env = ClaspEnv(max_chords=4, max_steps=2, seed=1)
+    env.reset()
+    b = env.actions.index(2, {})
+    assert not env.step(b)[3]
+    assert env.step(b)[3]
+
+def test_vector_env_matches_single_env():
+    num_envs, max_chords = 8, 5
+    vector = VectorClaspEnv(num_envs, max_chords, seed=0, max_steps=10**6)
+    vector.reset()
+    singles = [ClaspEnv(max_chords) for _ in range(num_envs)]
+    for env, single in enumerate(singles):
+        single.reset(clasp=vector.get_diagram(env).to_clasp())
+
+    rng = np.random.default_rng(0)
+    for _ in range(60):
+        masks = vector.action_mask()
+        for env, single in enumerate(singles):
+            assert np.array_equal(masks[env], single.action_mask())
+        actions = np.array([rng.choice(np.flatnonzero(mask)) for mask in masks])
+        observation, rewards, terminated, _, _ = vector.step(actions)
+        for env, single in enumerate(singles):
+            if terminated[env]:
+                single.reset(clasp=vector.get_diagram(env).to_clasp())
+                continue
+            expected, reward, _, _, _ = single.step(actions[env])
+            assert vector.get_diagram(env) == single.clasp.packed
+            assert reward == pytest.approx(rewards[env])
+            for name in ('l_matrix', 'signs', 'heights', 'num_chords'):
+                assert np.array_equal(observation[name][env], expected[name])
+
+def test_vector_env_autoresets():
+    vector = VectorClaspEnv(2, 3, seed=0)
+    vector.reset()
+    vector.set_diagram(0, PackedClaspDiagram.from_matrix((ChordForMatrix(0, 1, '-', 1),)))
+    actions = np.array([vector.actions.index(3, {'i': 1}), vector.actions.index(2, {})])
+    observation, _, terminated, _, info = vector.step(actions)
+    assert terminated.tolist() == [True, False]
+    assert info['final_observation']['num_chords'][0] == 0
+    assert observation['num_chords'][0] >= 1
+    with pytest.raises(ValueError):
+        vector.step(np.zeros(3, dtype=int))
@@ -0,0 +1,55 @@
+from hypothesis import given, settings, strategies as st
+from clasp_diagrams.exploration import enumerate_moves, apply_move, explore, bfs, dfs
+from clasp_diagrams.objects import ClaspDiagram, ChordForMatrix
+from clasp_diagrams.generators import random_valid_matrix
+from clasp_diagrams.canonical import canonical_key
+from clasp_diagrams.moves import get_isotopy_check
+import pytest
+
+# =============== move enumeration ===============
+@given(st.integers(min_value=0, max_value=5))
+@settings(deadline=None)
+def test_enumerated_moves_are_legal(n):
+    clasp = ClaspDiagram.from_matrix(matrix=random_valid_matrix(n))
+    for move_num, kwargs in enumerate_moves(clasp):
+        new_clasp = apply_move(clasp, move_num, kwargs)
+        assert isinstance(new_clasp, ClaspDiagram)
+
+def test_enumerate_moves_on_trefoil():
+    trefoil = ClaspDiagram.from_matrix(matrix=(ChordForMatrix(0, 2, '+', 2),
+                                               ChordForMatrix(1, 3, '+', 1)))
+    # The chords intersect and none is isolated: only B and -B apply
+    assert list(enumerate_moves(trefoil, move_nums=(1, 2, -2, 3))) == [(2, {}), (-2, {})]
+    assert sum(1 for _ in enumerate_moves(trefoil, move_nums=(-3,))) == 5 * 2 * 3 + 2 * 3
+
+# =============== exploration ===============
+@given(st.integers(min_value=1, max_value=5))
+@settings(deadline=None)
+def test_bfs_and_dfs_discover_the_same_component(n):
+    clasp = ClaspDiagram.from_matrix(matrix=random_valid_matrix(n))
+    bfs_states = list(bfs(clasp, move_nums=(1, 2, -2, 3)))
+    dfs_states = list(dfs(clasp, move_nums=(1, 2, -2, 3)))
+
+    assert len({state.key for state in bfs_states}) == len(bfs_states) # No state is reported twice
+    assert {state.key for state in bfs_states} == {state.key for state in dfs_states}
+    assert [state.depth for state in bfs_states] == sorted(state.depth for state in bfs_states)
+
+def test_explore_budgets():
+    clasp = ClaspDiagram.from_matrix(matrix=random_valid_matrix(3))
+    assert len(list(bfs(clasp, max_states=50))) == 50
+    assert max(state.depth for state in bfs(clasp, max_depth=2)) == 2
+    assert get_isotopy_check() == ('always', 1.0) # The policy is restored after exploring
+
+def test_explore_parent_links_and_isotopy():
+    clasp = ClaspDiagram.from_matrix(matrix=random_valid_matrix(4))
+    states = list(bfs(clasp, max_states=200, key=canonical_key))
+    by_key = {state.key: state for state in states}
+    for state in states[1:]:
+        parent = by_key[state.parent_key]
+        assert canonical_key(apply_move(parent.clasp, *state.move)) == state.key
+        coefficients = state.clasp.alexander_coefficients
+        assert coefficients in (clasp.alexander_coefficients, tuple(-c for c in clasp.alexander_coefficients))
+
+def test_explore_invalid_strategy():
+    with pytest.raises(ValueError, match="Invalid strategy"):
+        list(explore(ClaspDiagram.from_matrix(matrix=()), strategy='random'))
@@ -0,0 +1,59 @@
+from clasp_diagrams.generators import iter_random_diagrams, random_chord_batch, random_valid_array
+from clasp_diagrams.objects import ClaspDiagram
+from clasp_diagrams.packed import PackedClaspDiagram, CHORD_DTYPE
+from clasp_diagrams.validators import validate_clasp_chords, validate_clasp_chord_batch, ClaspDiagramCreationError
+import numpy as np
+import pytest
+
+def test_yields_count_diagrams_in_batches():
+    batches = list(iter_random_diagrams(6, 25, seed=0, batch_size=10, output='batch'))
+    assert [b.shape for b in batches] == [(10, 6), (10, 6), (5, 6)]
+    assert batches[0].dtype == CHORD_DTYPE
+    for chords in np.concatenate(batches):
+        validate_clasp_chords(chords)
+
+def test_reproducible_per_batch():
+    first = list(iter_random_diagrams(5, 40, seed=7, batch_size=8, output='packed'))
+    again = list(iter_random_diagrams(5, 40, seed=7, batch_size=8, output='packed', validate=False))
+    assert first == again
+    # Batch k only depends on (seed, k)
+    assert list(iter_random_diagrams(5, 16, seed=7, batch_size=8, output='packed'))[8:] == first[8:16]
+
+def test_clasp_output():
+    clasps = list(iter_random_diagrams(4, 5, seed=1))
+    assert all(isinstance(clasp, ClaspDiagram) for clasp in clasps)
+    for clasp in clasps:
+        assert clasp == ClaspDiagram.from_matrix(matrix=clasp.matrix)
+        assert isinstance(clasp.packed, PackedClaspDiagram)
+
+def test_endless_stream():
+    stream = iter_random_diagrams(3, None, seed=2, batch_size=4, output='packed')
+    assert len([next(stream) for _ in range(10)]) == 10
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        next(iter_random_diagrams(3, 1, output='matrix'))
+    with pytest.raises(ValueError):
+        next(iter_random_diagrams(3, 1, batch_size=0))
+
+def test_batch_generator_is_valid_and_uniform():
+    batch = random_chord_batch(3000, 2, rng=0)
+    for chords in batch[:200]:
+        validate_clasp_chords(chords)
+
+    # 3 matchings × 2 height orders × 4 sign patterns = 24 clasp matrices with 2 chords, all equally likely
+    _, counts = np.unique(batch.view(np.void(batch.dtype.itemsize * 2)), return_counts=True)
+    assert len(counts) == 24
+    assert counts.min() > 80
+
+def test_random_valid_array_signs_are_random():
+    array = random_valid_array(30)
+    assert len(array) == 60
+    assert {chord.sign for chord in array} == {'+', '-'}
+
+def test_batch_validation():
+    batch = random_chord_batch(10, 5, rng=3)
+    validate_clasp_chord_batch(batch)
+    batch[4]['height'][0] = batch[4]['height'][1]
+    with pytest.raises(ClaspDiagramCreationError, match='diagram 4'):
+        validate_clasp_chord_batch(batch)
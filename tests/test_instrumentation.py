@@ -0,0 +1,45 @@
+from clasp_diagrams import instrumentation
+from clasp_diagrams.instrumentation import profile, phase, instrumented, registry
+from clasp_diagrams.objects import ClaspDiagram
+from clasp_diagrams.generators import random_valid_matrix
+import clasp_diagrams.symbolics as symbolics
+import json
+
+def test_disabled_by_default_records_nothing():
+    registry.reset()
+    clasp = ClaspDiagram.from_matrix(matrix=random_valid_matrix(5))
+    clasp.move(move_num=2)
+    assert not instrumentation.is_enabled()
+    assert registry.stats() == {}
+
+def test_profile_records_phases():
+    matrix = random_valid_matrix(6)
+    with profile() as stats:
+        clasp = ClaspDiagram.from_matrix(matrix=matrix)
+        clasp.alexander
+        clasp.move(move_num=2)
+        symbolics.get_alexander_polynomial(clasp.sd_matrix)
+    assert not instrumentation.is_enabled()
+
+    recorded = stats.stats()
+    for name in ('ClaspDiagram.__init__', 'validation.matrix', 'transform.matrix_to_array', 'symbolics.l_matrix',
+                 'symbolics.alexander_coefficients', 'symbolics.determinant', 'symbolics.interpolation',
+                 'symbolics.sd_matrix', 'symbolics.t_rescale', 'moves.B', 'moves.isotopy_check'):
+        assert recorded[name]['calls'] >= 1, name
+    assert recorded['moves.B']['calls'] == 1
+    assert json.loads(stats.to_json()).keys() == recorded.keys()
+    assert 'moves.isotopy_check' in stats.table()
+
+def test_custom_phases_and_wrapped_metadata():
+    @instrumented('custom.function')
+    def documented():
+        """Docstring."""
+        with phase('custom.block'):
+            return 42
+
+    assert documented.__name__ == 'documented' and documented.__doc__ == 'Docstring.'
+    with profile() as stats:
+        assert documented() == 42
+        documented()
+    assert stats.calls == {'custom.function': 2, 'custom.block': 2}
+    assert stats.seconds['custom.function'] >= stats.seconds['custom.block']
@@ -0,0 +1,65 @@
+from clasp_diagrams.mcts import MCTS, chord_reduction_reward
+from clasp_diagrams.objects import ClaspDiagram, ChordForMatrix
+from clasp_diagrams.moves import legal_moves, get_isotopy_check
+from clasp_diagrams.generators import random_valid_matrix
+from clasp_diagrams.exploration import apply_move
+import clasp_diagrams.symbolics as symbolics
+import pytest
+
+def test_search_returns_a_legal_move():
+    clasp = ClaspDiagram.from_matrix(matrix=random_valid_matrix(8))
+    mcts = MCTS(seed=0)
+    move = mcts.search(clasp, iterations=50)
+    assert move in legal_moves(clasp, move_nums=(1, 2, -2, 3))
+    assert mcts.rollouts == 50 and mcts.rollout_moves_per_second > 0
+    assert get_isotopy_check() == ('always', 1.0)
+
+def test_rollouts_skip_the_alexander_polynomial(monkeypatch):
+    def fail(**kwargs):
+        raise AssertionError("No determinant should be computed during MCTS.")
+    monkeypatch.setattr(symbolics, 'get_alexander_coefficients', fail)
+    MCTS(seed=1, rollout_depth=20).search(ClaspDiagram.from_matrix(matrix=random_valid_matrix(12)), iterations=30)
+
+def test_plan_unknots():
+    # Two nested isolated chords and a third one closing immediately: an unknot
+    clasp = ClaspDiagram.from_matrix(matrix=(ChordForMatrix(0, 3, '+', 3),
+                                             ChordForMatrix(1, 2, '-', 1),
+                                             ChordForMatrix(4, 5, '+', 2)))
+    final, played = MCTS(seed=2).plan(clasp, max_steps=10, iterations=30)
+    assert final.matrix == ()
+
+    replayed = clasp
+    for move in played:
+        replayed = apply_move(replayed, *move)
+    assert replayed == final
+
+def test_transposition_table_is_shared():
+    clasp = ClaspDiagram.from_matrix(matrix=random_valid_matrix(5))
+    mcts = MCTS(seed=3)
+    mcts.search(clasp, iterations=40)
+    size = len(mcts.table)
+    mcts.search(clasp, iterations=40)
+    assert len(mcts.table) >= size
+    assert mcts.table[mcts.key(clasp)].visits == 80
+
+def test_rollouts_start_where_selection_stops():
+    # With moves B and -B only, the two diagrams of the trefoil below form a cycle R -> S -> R.
+    # Iterations 1-4 expand R -> S twice and S -> R twice, later ones select R -> S -> R and stop on the cycle.
+    trefoil = ClaspDiagram.from_matrix(matrix=(ChordForMatrix(0, 2, '+', 2), ChordForMatrix(1, 3, '+', 1)))
+    mcts = MCTS(seed=0, rollout_depth=0, move_nums=(2, -2))
+    starts = []
+    rollout = mcts.rollout
+    mcts.rollout = lambda clasp: starts.append(mcts.key(clasp)) or rollout(clasp)
+    mcts.search(trefoil, iterations=6)
+    root = mcts.key(trefoil)
+    assert [key == root for key in starts] == [False, False, True, True, True, True]
+
+def test_chord_reduction_reward():
+    unknot = ClaspDiagram.from_matrix(matrix=())
+    one = ClaspDiagram.from_matrix(matrix=(ChordForMatrix(0, 1, '+', 1),))
+    assert chord_reduction_reward(one, unknot) == 1.0
+    assert chord_reduction_reward(unknot, unknot) == 1.0
+
+def test_search_requires_a_budget():
+    with pytest.raises(ValueError, match="At least one of"):
+        MCTS().search(ClaspDiagram.from_matrix(matrix=()), iterations=None)
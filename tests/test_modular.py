@@ -0,0 +1,49 @@
+from clasp_diagrams.modular import det_mod, mod_inverse, mod_pow, DEFAULT_PRIME
+from clasp_diagrams.modular import charpoly_mod, crt, is_prime, word_primes, DOT_PRIME_LIMIT
+from clasp_diagrams.symbolics import bareiss_det
+import numpy as np
+import sympy as sp
+
+def test_mod_inverse():
+    values = np.array([1, 2, 3, 12345, DEFAULT_PRIME - 1])
+    assert np.all(values * mod_inverse(values, DEFAULT_PRIME) % DEFAULT_PRIME == 1)
+    assert mod_pow(np.array([3]), 4, 7)[0] == 81 % 7
+
+def test_batched_det_mod_matches_exact_determinants():
+    rng = np.random.default_rng(0)
+    matrices = rng.integers(-3, 4, size=(50, 7, 7))
+    matrices[3] = 0 # Singular
+    matrices[4][:, 0] = 0 # Needs pivoting and is singular
+    matrices[5] = np.eye(7, dtype=int)[::-1] # Permutation: pivoting only
+    for p in (DEFAULT_PRIME, 101):
+        dets = det_mod(matrices, p)
+        assert [int(d) for d in dets] == [bareiss_det(m.tolist()) % p for m in matrices]
+    assert det_mod(matrices[7], 101) == bareiss_det(matrices[7].tolist()) % 101
+    assert det_mod(np.zeros((2, 0, 0), dtype=int)).tolist() == [1, 1]
+
+def test_is_prime_and_word_primes():
+    assert [n for n in range(50) if is_prime(n)] == list(sp.primerange(50))
+    assert all(is_prime(n) == sp.isprime(n) for n in range(DEFAULT_PRIME - 2000, DEFAULT_PRIME + 1))
+    primes = word_primes(5, DOT_PRIME_LIMIT)
+    assert primes == sorted(primes, reverse=True) and all(sp.isprime(p) and p < DOT_PRIME_LIMIT for p in primes)
+    assert primes[0] == sp.prevprime(DOT_PRIME_LIMIT) and primes[1:] == [sp.prevprime(p) for p in primes[:-1]]
+    assert word_primes(2)[0] == DEFAULT_PRIME
+
+def test_crt_reconstructs_signed_values():
+    primes = word_primes(3)
+    values = [0, 1, -1, 2**80, -(2**80) + 12345]
+    assert crt([[v % p for v in values] for p in primes], primes) == values
+    assert crt([[v % p for v in values[:2]] for p in primes], primes, symmetric=False) == values[:2]
+
+def test_batched_charpoly_mod_matches_sympy():
+    rng = np.random.default_rng(1)
+    primes = word_primes(2, DOT_PRIME_LIMIT)
+    for m in (1, 2, 5, 9):
+        matrices = rng.integers(-4, 5, size=(4, m, m))
+        matrices[1][1:, 0] = 0 # Already reduced column: zero pivot
+        matrices[2] = np.diag(np.arange(m)) # Diagonal: nothing to eliminate
+        for p in primes:
+            charpolys = charpoly_mod(matrices, p)
+            for matrix, charpoly in zip(matrices, charpolys):
+                expected = sp.Matrix(matrix).charpoly().all_coeffs()[::-1]
+                assert charpoly.tolist() == [int(c) % p for c in expected]
@@ -0,0 +1,125 @@
+from clasp_diagrams.objects import ClaspDiagram
+from clasp_diagrams.moves import (exchange_heights, cyclic_height_shift, inverse_cyclic_height_shift,
+                                  erase_isolated_chord, add_isolated_chord)
+from clasp_diagrams.moves import set_isotopy_check, get_isotopy_check, isotopy_check
+from clasp_diagrams.generators import random_valid_matrix
+from clasp_diagrams.symbolics import get_l_matrix, get_e_matrix, get_le_matrix, get_alexander_coefficients, get_alexander_fingerprint
+from clasp_diagrams.utils import matrix_chords_intersect, consecutive_heights, ImplementationError
+import clasp_diagrams.moves as moves
+from hypothesis import given, settings, strategies as st
+import numpy as np
+import pytest
+import random
+
+# Moves derive the child's L-matrix, Alexander coefficients and fingerprint from the parent's ones.
+# These must be exactly what a fresh computation on the child would give.
+def assert_invariants_match_fresh(clasp):
+    assert 'l_matrix' in vars(clasp) and 'alexander_coefficients' in vars(clasp)
+    l_matrix = get_l_matrix(clasp_matrix=clasp.matrix)
+    assert np.array_equal(clasp.l_matrix, l_matrix)
+    le_matrix = get_le_matrix(e_matrix=get_e_matrix(clasp_matrix=clasp.matrix), l_matrix=l_matrix)
+    assert clasp.alexander_coefficients == get_alexander_coefficients(le_matrix=le_matrix)
+    assert 'fingerprint' in vars(clasp) and clasp.fingerprint == get_alexander_fingerprint(le_matrix=le_matrix)
+
+def fresh_clasp(n):
+    clasp = ClaspDiagram.from_matrix(matrix=random_valid_matrix(n))
+    clasp.alexander_coefficients # The parent has its invariants computed
+    clasp.fingerprint
+    return clasp
+
+@given(st.integers(min_value=2, max_value=7))
+@settings(deadline=None)
+def test_A_propagates_invariants(n):
+    clasp = fresh_clasp(n)
+    for i in range(1, n + 1):
+        for j in range(i + 1, n + 1):
+            c1, c2 = clasp.matrix[i-1], clasp.matrix[j-1]
+            if not matrix_chords_intersect(c1, c2) and consecutive_heights(c1, c2, n):
+                assert_invariants_match_fresh(exchange_heights(clasp, i=i, j=j))
+
+@given(st.integers(min_value=0, max_value=7))
+@settings(deadline=None)
+def test_B_and_inverse_propagate_invariants(n):
+    clasp = fresh_clasp(n)
+    assert_invariants_match_fresh(cyclic_height_shift(clasp))
+    assert_invariants_match_fresh(inverse_cyclic_height_shift(clasp))
+
+@given(st.integers(min_value=0, max_value=6))
+@settings(deadline=None)
+def test_C1_and_inverse_propagate_invariants(n):
+    clasp = fresh_clasp(n)
+    for after_point in range(-1, 2*n):
+        sign = random.choice('+-')
+        new_clasp, chord_idx = add_isolated_chord(clasp, after_point=after_point, new_sign=sign,
+                                                  new_height=random.randint(1, n + 1))
+        assert_invariants_match_fresh(new_clasp)
+        assert_invariants_match_fresh(erase_isolated_chord(new_clasp, i=chord_idx)[0])
+
+    new_clasp, _ = add_isolated_chord(clasp, after_point=-1, new_sign='-', new_height=1, reverse_points=True)
+    assert_invariants_match_fresh(new_clasp)
+    assert_invariants_match_fresh(erase_isolated_chord(new_clasp, i=1)[0])
+
+# ==================== Isotopy check policy ====================
+def test_isotopy_check_policy():
+    assert get_isotopy_check() == ('always', 1.0)
+    with isotopy_check('sampled', rate=0.25):
+        assert get_isotopy_check() == ('sampled', 0.25)
+    assert get_isotopy_check() == ('always', 1.0)
+
+    with pytest.raises(ValueError, match="Invalid isotopy check mode"):
+        set_isotopy_check('sometimes')
+    with pytest.raises(ValueError, match="Invalid isotopy check rate"):
+        set_isotopy_check('sampled', rate=2)
+
+def test_sampled_isotopy_check_leaves_the_global_random_stream_alone(monkeypatch):
+    matrix = random_valid_matrix(4)
+    random.seed(7)
+    expected = [random.random() for _ in range(3)]
+
+    def sampled_run(seed):
+        clasp = ClaspDiagram.from_matrix(matrix=matrix)
+        clasp.fingerprint
+        checked = []
+        original = moves.symbolics.get_alexander_fingerprint
+        monkeypatch.setattr(moves.symbolics, 'get_alexander_fingerprint', lambda **kw: checked.append(1) or original(**kw))
+        random.seed(7)
+        with isotopy_check('sampled', rate=0.5, seed=seed):
+            values = []
+            for _ in range(3):
+                cyclic_height_shift(clasp)
+                values.append(random.random())
+        return values, len(checked)
+
+    values, checks = sampled_run(seed=1)
+    assert values == expected
+    assert sampled_run(seed=1)[1] == checks # Reproducible given the seed
+
+def test_isotopy_check_off_skips_determinant(monkeypatch):
+    clasp = ClaspDiagram.from_matrix(matrix=random_valid_matrix(5))
+    calls = []
+    original = moves.symbolics.get_alexander_fingerprint
+    monkeypatch.setattr(moves.symbolics, 'get_alexander_fingerprint', lambda **kw: calls.append(1) or original(**kw))
+
+    with isotopy_check('off'):
+        new_clasp = cyclic_height_shift(clasp)
+    assert calls == [] and 'fingerprint' not in vars(new_clasp)
+
+    cyclic_height_shift(clasp)
+    assert len(calls) == 2 # The parent's and the child's fingerprints
+
+def test_isotopy_check_does_not_recompute_propagated_coefficients(monkeypatch):
+    clasp = fresh_clasp(5)
+    def fail(**kwargs):
+        raise AssertionError("The propagated coefficients should not be recomputed.")
+    monkeypatch.setattr(moves.symbolics, 'get_alexander_coefficients', fail)
+
+    assert get_isotopy_check() == ('always', 1.0)
+    new_clasp = inverse_cyclic_height_shift(cyclic_height_shift(clasp))
+    assert new_clasp.alexander_coefficients == clasp.alexander_coefficients
+
+def test_isotopy_check_raises_on_non_isotopic_result():
+    clasp = fresh_clasp(3)
+    new_clasp = cyclic_height_shift(clasp)
+    new_clasp._seed(fingerprint=(0, 0, 0, 0, 0)) # Corrupt the child's inherited invariant (1s would be the unknot's)
+    with pytest.raises(ImplementationError, match="Move B failed"):
+        cyclic_height_shift(new_clasp)
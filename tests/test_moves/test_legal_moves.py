@@ -0,0 +1,28 @@
+from clasp_diagrams.objects import ClaspDiagram, ChordForMatrix
+from clasp_diagrams.moves import legal_moves
+from clasp_diagrams.exploration import enumerate_moves
+from clasp_diagrams.generators import random_valid_matrix
+from hypothesis import given, settings, strategies as st
+
+# ==================== legal_moves vs the valid_* checkers ====================
+@given(st.integers(min_value=0, max_value=12))
+@settings(deadline=None)
+def test_legal_moves_match_checkers(n):
+    for _ in range(5):
+        clasp = ClaspDiagram.from_matrix(matrix=random_valid_matrix(n))
+        assert legal_moves(clasp) == list(enumerate_moves(clasp))
+
+def test_legal_moves_expected():
+    clasp = ClaspDiagram.from_matrix(matrix=(ChordForMatrix(0, 1, '+', 1),
+                                             ChordForMatrix(2, 3, '-', 2),
+                                             ChordForMatrix(4, 5, '-', 3),
+                                             ChordForMatrix(6, 7, '-', 4)))
+    assert legal_moves(clasp, move_nums=(1, 3)) == [(1, {'i': 1, 'j': 2}), (1, {'i': 1, 'j': 4}),
+                                                    (1, {'i': 2, 'j': 3}), (1, {'i': 3, 'j': 4}),
+                                                    (3, {'i': 1}), (3, {'i': 2}), (3, {'i': 3}), (3, {'i': 4})]
+
+def test_legal_moves_wrapped_isolated_chord():
+    clasp = ClaspDiagram.from_matrix(matrix=(ChordForMatrix(0, 5, '+', 1),
+                                             ChordForMatrix(1, 3, '+', 2),
+                                             ChordForMatrix(2, 4, '+', 3)))
+    assert legal_moves(clasp, move_nums=(3,)) == [(3, {'i': 1})]
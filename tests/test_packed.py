@@ -0,0 +1,49 @@
+from hypothesis import given, settings, strategies as st
+from clasp_diagrams.packed import PackedClaspDiagram, CHORD_DTYPE
+from clasp_diagrams.objects import ClaspDiagram, ChordForMatrix
+from clasp_diagrams.generators import random_valid_matrix
+from clasp_diagrams.validators import validate_clasp_chords, validate_clasp_array, ClaspDiagramCreationError
+import numpy as np
+import pytest
+
+# =============== round trips ===============
+@given(st.integers(min_value=0, max_value=50))
+@settings(deadline=None)
+def test_packed_round_trip(n):
+    matrix = random_valid_matrix(n)
+    clasp = ClaspDiagram.from_matrix(matrix=matrix)
+    packed = PackedClaspDiagram.from_matrix(matrix)
+
+    assert packed.matrix == matrix
+    assert packed.array == clasp.array
+    validate_clasp_array(packed.array)
+    validate_clasp_chords(packed.chords)
+    assert packed.to_clasp() == clasp
+    assert ClaspDiagram.from_packed(packed) == clasp
+
+def test_packed_views_are_zero_copy():
+    packed = PackedClaspDiagram.from_matrix((ChordForMatrix(0, 2, '+', 2),
+                                             ChordForMatrix(1, 3, '-', 1)))
+    assert packed.chords.dtype == CHORD_DTYPE
+    assert np.shares_memory(packed.heights, packed.chords)
+    assert packed.signs.tolist() == [1, -1]
+    assert packed.point_to_chord.tolist() == [0, 1, 0, 1]
+
+def test_packed_equality_and_hash():
+    matrix = random_valid_matrix(6)
+    assert PackedClaspDiagram.from_matrix(matrix) == PackedClaspDiagram.from_matrix(matrix)
+    assert len({PackedClaspDiagram.from_matrix(matrix), PackedClaspDiagram.from_matrix(matrix)}) == 1
+
+# =============== validation ===============
+def make_chords(*rows):
+    return np.array(list(rows), dtype=CHORD_DTYPE)
+
+def test_validate_clasp_chords_raises():
+    with pytest.raises(ClaspDiagramCreationError, match="The heights are invalid"):
+        validate_clasp_chords(make_chords((0, 1, 1, 1), (2, 3, 1, 1)))
+    with pytest.raises(ClaspDiagramCreationError, match="Invalid signs"):
+        validate_clasp_chords(make_chords((0, 1, 1, 1), (2, 3, 2, 0)))
+    with pytest.raises(ClaspDiagramCreationError, match="Invalid order of the start points"):
+        validate_clasp_chords(make_chords((2, 3, 1, 1), (0, 1, 2, 1)))
+    with pytest.raises(ClaspDiagramCreationError, match="Invalid start/end points"):
+        validate_clasp_chords(make_chords((0, 1, 1, 1), (2, 5, 2, 1)))
@@ -0,0 +1,82 @@
+from clasp_diagrams.search import best_first_search, HEURISTICS
+from clasp_diagrams.exploration import apply_move, diagram_key
+from clasp_diagrams.objects import ClaspDiagram, ChordForMatrix
+import pytest
+import random
+
+def random_unknot(n, seed):
+    """
+    Builds a diagram of the unknot by adding n isolated chords to the empty diagram, and shuffles it with moves A and B.
+    """
+    rng = random.Random(seed)
+    clasp = ClaspDiagram.from_matrix(matrix=())
+    for k in range(n):
+        clasp, _ = clasp.move(move_num=-3, after_point=rng.randint(-1, 2*k - 1), new_sign=rng.choice('+-'),
+                              new_height=rng.randint(1, k + 1))
+    for _ in range(5):
+        clasp = clasp.move(move_num=2)
+    return clasp
+
+def replay(start, path):
+    clasp = start
+    for move in path:
+        clasp = apply_move(clasp, *move)
+    return clasp
+
+@pytest.mark.parametrize("heuristic", list(HEURISTICS))
+def test_search_unknots(heuristic):
+    start = random_unknot(4, seed=1)
+    result = best_first_search(start, heuristic=heuristic)
+    assert result.found and result.stop_reason == 'goal'
+    assert len(result.clasp.matrix) == 0
+    assert replay(start, result.path) == result.clasp
+    assert result.nodes_expanded > 0 and result.nodes_per_second > 0
+
+@pytest.mark.parametrize("seed", [1, 3])
+def test_a_star_finds_shortest_paths(seed):
+    start = random_unknot(4, seed=seed)
+    shortest = best_first_search(start, weight=0) # Uniform-cost search
+    result = best_first_search(start, heuristic='chords')
+    assert result.found and shortest.found
+    assert len(result.path) == len(shortest.path)
+    assert result.nodes_expanded <= shortest.nodes_expanded
+
+def test_greedy_search_with_custom_heuristic():
+    start = random_unknot(5, seed=2)
+    result = best_first_search(start, heuristic=lambda clasp: len(clasp.matrix) ** 2, greedy=True)
+    assert result.found and replay(start, result.path).matrix == ()
+
+def test_search_exhausts_on_trefoil():
+    trefoil = ClaspDiagram.from_matrix(matrix=(ChordForMatrix(0, 2, '+', 2),
+                                               ChordForMatrix(1, 3, '+', 1)))
+    result = best_first_search(trefoil, goal=lambda clasp: len(clasp.matrix) == 0)
+    assert not result.found and result.stop_reason == 'exhausted'
+    assert result.clasp == trefoil and result.path == []
+
+def test_search_rejects_knotted_starts():
+    trefoil = ClaspDiagram.from_matrix(matrix=(ChordForMatrix(0, 2, '+', 2),
+                                               ChordForMatrix(1, 3, '+', 1)))
+    result = best_first_search(trefoil) # Alexander polynomial t² - t + 1: not the unknot
+    assert not result.found and result.stop_reason == 'not_unknot'
+    assert result.clasp == trefoil and result.nodes_expanded == 0
+
+def test_greedy_search_does_not_reopen_states():
+    start = random_unknot(4, seed=3) # A shorter path reaches an already generated state
+    generated = []
+    def heuristic(clasp):
+        generated.append(diagram_key(clasp))
+        return len(clasp.matrix) ** 2
+    result = best_first_search(start, heuristic=heuristic, greedy=True, goal=lambda clasp: False)
+    assert result.stop_reason == 'exhausted'
+    assert len(generated) == len(set(generated)) == result.nodes_generated + 1
+    assert result.nodes_expanded == len(generated)
+
+def test_search_budgets():
+    start = random_unknot(4, seed=1)
+    assert best_first_search(start, max_nodes=1).stop_reason == 'nodes'
+    assert best_first_search(start, max_states=2).stop_reason == 'memory'
+    assert best_first_search(start, time_budget=0).stop_reason == 'time'
+
+def test_search_invalid_heuristic():
+    with pytest.raises(ValueError, match="Invalid heuristic"):
+        best_first_search(ClaspDiagram.from_matrix(matrix=()), heuristic='magic')
@@ -0,0 +1,70 @@
+from clasp_diagrams.serialization import (encode_varints, decode_varints, encode_diagram, decode_diagram,
+                                          CorpusWriter, CorpusReader, write_corpus, read_corpus)
+from clasp_diagrams.objects import ClaspDiagram
+from clasp_diagrams.packed import PackedClaspDiagram
+from clasp_diagrams.generators import random_valid_matrix
+import numpy as np
+import pytest
+
+def test_varints_round_trip():
+    values = [0, 1, 127, 128, 300, 16383, 16384, 2**31 - 1, 2**40]
+    data = encode_varints(values)
+    assert encode_varints([300]) == b'\xac\x02'
+    decoded, offset = decode_varints(np.frombuffer(data, dtype=np.uint8), len(values))
+    assert decoded.tolist() == values and offset == len(data)
+    with pytest.raises(ValueError):
+        decode_varints(np.frombuffer(data[:-1], dtype=np.uint8), len(values))
+
+@pytest.mark.parametrize('n', [0, 1, 5, 8, 9, 70, 200])
+def test_diagram_round_trip(n):
+    matrix = random_valid_matrix(n)
+    data = encode_diagram(matrix)
+    assert decode_diagram(data) == PackedClaspDiagram.from_matrix(matrix)
+    assert decode_diagram(data).to_clasp() == ClaspDiagram.from_matrix(matrix=matrix)
+    if n < 64:
+        assert len(data) <= 3 * n + (n + 7) // 8 + 1
+
+def test_corpus_random_access_and_streaming(tmp_path):
+    path = tmp_path / 'corpus.clasp'
+    matrices = [random_valid_matrix(n) for n in list(range(12)) * 3]
+    assert write_corpus(path, matrices) == len(matrices)
+
+    expected = [PackedClaspDiagram.from_matrix(matrix) for matrix in matrices]
+    with CorpusReader(path) as reader:
+        assert len(reader) == len(matrices)
+        assert reader[7] == expected[7] and reader[-1] == expected[-1]
+        with pytest.raises(IndexError):
+            reader[len(matrices)]
+    assert list(read_corpus(path)) == expected
+
+def test_unclosed_corpus_is_rescanned(tmp_path):
+    path = tmp_path / 'partial.clasp'
+    matrices = [random_valid_matrix(n) for n in range(1, 6)]
+    writer = CorpusWriter(path)
+    writer.write_many(matrices)
+    writer._file.close() # Simulates a crash before the index is written
+    with CorpusReader(path) as reader:
+        assert [reader[k] for k in range(len(reader))] == [PackedClaspDiagram.from_matrix(m) for m in matrices]
+
+@pytest.mark.parametrize('cut', [1, 3, 20])
+def test_truncated_unclosed_corpus_keeps_complete_records(tmp_path, cut):
+    path = tmp_path / 'truncated.clasp'
+    matrices = [random_valid_matrix(n) for n in range(4, 12)]
+    writer = CorpusWriter(path)
+    writer.write_many(matrices)
+    writer._file.close() # Crash before the index is written...
+    data = path.read_bytes()
+    path.write_bytes(data[:-cut]) # ...and in the middle of the last records
+
+    with CorpusReader(path) as reader:
+        read = list(reader)
+    expected = [PackedClaspDiagram.from_matrix(m) for m in matrices]
+    assert 0 < len(read) < len(expected) and read == expected[:len(read)]
+    complete = sum(len(encode_diagram(m)) for m in matrices[:len(read) + 1])
+    assert len(data) - cut < 12 + complete # The next record was indeed cut (12-byte header)
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'other.bin'
+    path.write_bytes(b'not a corpus')
+    with pytest.raises(ValueError):
+        CorpusReader(path)
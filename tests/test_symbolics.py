@@ -1,8 +1,15 @@
-from hypothesis import given, strategies as st
-from clasp_diagrams.symbolics import get_l_matrix
+from hypothesis import given, settings, strategies as st
+from clasp_diagrams.symbolics import get_l_matrix, get_sd_matrix, get_alexander_polynomial, get_alexander_coefficients, coefficients_to_polynomial, bareiss_det
+from clasp_diagrams.symbolics import get_alexander_fingerprint, get_alexander_fingerprint_complex, FINGERPRINT_POINTS
+from clasp_diagrams.symbolics import ALEXANDER_METHODS, get_le_matrix_from_arrays, get_alexander_coefficients_batch
+from clasp_diagrams.symbolics import get_alexander_fingerprints, get_alexander_values
+from clasp_diagrams.generators import random_chord_batch
+from clasp_diagrams.modular import DEFAULT_PRIME
+from clasp_diagrams.generators import random_valid_matrix
 from clasp_diagrams.objects import ClaspDiagram, ChordForMatrix
 from clasp_diagrams.utils import matrix_chords_intersect
 import numpy as np
+import pytest
 import sympy as sp
 
 # Only the testing of the generation of the L-matrix and alexander polynomial is performed.
@@ -39,6 +46,24 @@ def test_get_l_matrix2():
     
     assert np.array_equal(expected_l_matrix, calculated_l_matrix), f"L matrix mismatch: {calculated_l_matrix} != {expected_l_matrix}"
 
+@given(st.integers(min_value=0, max_value=60))
+def test_get_l_matrix_matches_pairwise_definition(n):
+    clasp_matrix = random_valid_matrix(n)
+
+    expected_l_matrix = np.zeros(shape=(n, n), dtype=int)
+    for i in range(n):
+        for j in range(i+1, n):
+            if matrix_chords_intersect(clasp_matrix[i], clasp_matrix[j]):
+                if clasp_matrix[i].height > clasp_matrix[j].height:
+                    expected_l_matrix[i][j] = 1
+                else:
+                    expected_l_matrix[j][i] = -1
+
+    calculated_l_matrix = get_l_matrix(clasp_matrix=clasp_matrix)
+
+    assert np.issubdtype(calculated_l_matrix.dtype, np.integer)
+    assert np.array_equal(expected_l_matrix, calculated_l_matrix)
+
 def test_get_alexander_polynomial():
     t = sp.symbols('t')
     alpo_unknot = sp.Integer(1)
@@ -76,4 +101,105 @@ def test_get_alexander_polynomial():
     assert sp.simplify(cd_5_2.alexander - alpo_5_2) == 0 or sp.simplify(-1 * cd_5_2.alexander - alpo_5_2) == 0
     assert sp.simplify(cd_6_1.alexander - alpo_6_1) == 0 or sp.simplify(-1 * cd_6_1.alexander - alpo_6_1) == 0
     assert sp.simplify(cd_6_2.alexander - alpo_6_2) == 0 or sp.simplify(-1 * cd_6_2.alexander - alpo_6_2) == 0
-    
\ No newline at end of file
+
+# =============== integer-coefficient engine vs sympy det() ===============
+KNOT_TABLE = [
+    ((), (1,)),
+    (((0, 2, '+', 2), (1, 3, '+', 1)), (1, -1, 1)),
+    (((0, 2, '-', 2), (1, 3, '+', 1)), (1, -3, 1)),
+    (((0, 3, '+', 3), (1, 4, '+', 2), (2, 5, '+', 1)), (1, -1, 1, -1, 1)),
+    (((0, 3, '+', 3), (1, 5, '+', 2), (2, 4, '+', 1)), (2, -3, 2)),
+    (((0, 3, '-', 3), (1, 5, '+', 1), (2, 4, '+', 2)), (2, -5, 2)),
+    (((0, 3, '-', 3), (1, 4, '+', 2), (2, 5, '+', 1)), (1, -3, 3, -3, 1)),
+]
+
+def test_get_alexander_coefficients_knot_table():
+    for chords, expected in KNOT_TABLE:
+        clasp = ClaspDiagram.from_matrix(matrix=tuple(ChordForMatrix(*chord) for chord in chords))
+        coefficients = get_alexander_coefficients(le_matrix=clasp.le_matrix)
+        assert coefficients == expected or tuple(-c for c in coefficients) == expected
+
+        # Agrees (with sign) with the sympy determinant path
+        sympy_alpo = get_alexander_polynomial(sd_matrix=get_sd_matrix(le_matrix=clasp.le_matrix))
+        assert sp.expand(coefficients_to_polynomial(coefficients) - sympy_alpo) == 0
+
+@given(st.integers(min_value=0, max_value=6))
+@settings(deadline=None)
+def test_get_alexander_coefficients_agrees_with_sympy(n):
+    clasp = ClaspDiagram.from_matrix(matrix=random_valid_matrix(n))
+    sympy_alpo = get_alexander_polynomial(sd_matrix=get_sd_matrix(le_matrix=clasp.le_matrix))
+    assert sp.expand(clasp.alexander - sympy_alpo) == 0
+
+def test_alexander_methods_agree_on_the_knot_table():
+    for chords, _ in KNOT_TABLE:
+        clasp = ClaspDiagram.from_matrix(matrix=tuple(ChordForMatrix(*chord) for chord in chords))
+        assert len({get_alexander_coefficients(clasp.le_matrix, method=method) for method in ALEXANDER_METHODS}) == 1
+
+@given(st.integers(min_value=1, max_value=24))
+@settings(deadline=None, max_examples=30)
+def test_modular_engines_agree_with_bareiss(n):
+    le_matrix = ClaspDiagram.from_matrix(matrix=random_valid_matrix(n)).le_matrix
+    expected = get_alexander_coefficients(le_matrix, method='bareiss')
+    assert get_alexander_coefficients(le_matrix, method='modular') == expected
+    assert get_alexander_coefficients(le_matrix, method='interpolation') == expected
+
+def test_get_alexander_coefficients_rejects_unknown_methods():
+    with pytest.raises(ValueError):
+        get_alexander_coefficients(np.eye(2, dtype=int), method='sympy')
+
+def test_bareiss_det():
+    assert bareiss_det([]) == 1
+    assert bareiss_det([[0, 1], [1, 0]]) == -1
+    assert bareiss_det([[2, 0, 1], [1, 3, 2], [1, 1, 1]]) == int(round(np.linalg.det([[2, 0, 1], [1, 3, 2], [1, 1, 1]])))
+
+# =============== numeric fingerprints ===============
+def _centered_value(coefficients, a):
+    # The polynomial made symmetric (centered at t^0) and signed so that its value at 1 is 1
+    sign = sum(coefficients)
+    d = (len(coefficients) - 1) // 2
+    return sign * sum(c * sp.Rational(a) ** (k - d) for k, c in enumerate(coefficients))
+
+@given(st.integers(min_value=0, max_value=12))
+@settings(deadline=None)
+def test_fingerprint_evaluates_the_alexander_polynomial(n):
+    clasp = ClaspDiagram.from_matrix(matrix=random_valid_matrix(n))
+    coefficients = clasp.alexander_coefficients
+    fingerprint = get_alexander_fingerprint(le_matrix=clasp.le_matrix)
+    for a, value in zip(FINGERPRINT_POINTS, fingerprint):
+        exact = _centered_value(coefficients, a)
+        assert value == exact.p * pow(exact.q, -1, DEFAULT_PRIME) % DEFAULT_PRIME
+
+    complex_values = get_alexander_fingerprint_complex(le_matrix=clasp.le_matrix, num_points=3)
+    omegas = np.exp(2j * np.pi * np.arange(1, 4) / 7)
+    sign, d = sum(coefficients), (len(coefficients) - 1) // 2
+    expected = [sign * sum(c * w ** (k - d) for k, c in enumerate(coefficients)) for w in omegas]
+    assert np.allclose(complex_values, np.real(expected))
+
+def test_fingerprint_separates_the_knot_table():
+    fingerprints = set()
+    for chords, _ in KNOT_TABLE[1:]:
+        clasp = ClaspDiagram.from_matrix(matrix=tuple(ChordForMatrix(*chord) for chord in chords))
+        fingerprints.add(clasp.fingerprint)
+    assert len(fingerprints) == len({expected for _, expected in KNOT_TABLE[1:]})
+
+# =============== batched evaluation ===============
+@pytest.mark.parametrize('n', [0, 1, 5, 9])
+def test_batched_evaluation_matches_single_diagrams(n):
+    chords = random_chord_batch(12, n, np.random.default_rng(n))
+    le_matrices = get_le_matrix_from_arrays(chords['start_point'], chords['end_point'], chords['height'], chords['sign'])
+    assert le_matrices.shape == (12, n, n)
+
+    coefficients = get_alexander_coefficients_batch(le_matrices)
+    fingerprints = get_alexander_fingerprints(le_matrices)
+    values = get_alexander_values(le_matrices, 2.0)
+    signs, logabsdets = get_alexander_values(le_matrices, 2.0, log=True)
+    for k, row in enumerate(chords):
+        le_matrix = get_le_matrix_from_arrays(row['start_point'], row['end_point'], row['height'], row['sign'])
+        assert np.array_equal(le_matrices[k], le_matrix)
+        assert coefficients[k] == get_alexander_coefficients(le_matrix)
+        assert tuple(fingerprints[k]) == get_alexander_fingerprint(le_matrix)
+        assert np.isclose(values[k], float(_centered_value(coefficients[k], 2)))
+        assert np.isclose(signs[k] * np.exp(logabsdets[k]), values[k])
+
+    assert get_alexander_coefficients_batch(le_matrices, method='bareiss') == coefficients
+    assert get_alexander_coefficients_batch(np.zeros((0, n, n), dtype=int)) == []
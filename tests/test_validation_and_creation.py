@@ -15,6 +15,12 @@ def test_chord_for_array_is_hashable():
     chord_set = {chord}
     assert chord in chord_set
 
+def test_unsafe_make_matches_validated_chords():
+    assert ChordForMatrix._unsafe_make(0, 1, '+', 1) == ChordForMatrix(0, 1, '+', 1)
+    assert hash(ChordForMatrix._unsafe_make(0, 1, '+', 1)) == hash(ChordForMatrix(0, 1, '+', 1))
+    assert ChordForArray._unsafe_make(1, '-', 2) == ChordForArray(1, '-', 2)
+    assert ChordForArray._unsafe_make(1, '-', 2) in {ChordForArray(1, '-', 2)}
+
 # =============== creation via matrix validation ===============
 # --- Creation validation ---
 def test_none_matrix_raises_value_error():
@@ -83,6 +89,30 @@ def test_creation_from_matrix(n):
     assert clasp.matrix == matrix
 
 
+# --- Lazy symbolics ---
+def test_symbolics_are_lazy():
+    clasp = ClaspDiagram.from_matrix(matrix=random_valid_matrix(4))
+    assert 'alexander' not in vars(clasp) and 'l_matrix' not in vars(clasp)
+
+    clasp.alexander
+    assert all(attr in vars(clasp) for attr in ('e_matrix', 'l_matrix', 'le_matrix', 'alexander_coefficients', 'alexander'))
+    assert 'sd_matrix' not in vars(clasp) # The sympy S_D matrix is not needed for the polynomial
+
+def test_symbolics_can_be_eager():
+    clasp = ClaspDiagram(matrix=random_valid_matrix(3), calculate_symbolics=True)
+    assert 'alexander' in vars(clasp)
+
+
+# --- Trusted creation ---
+@given(st.integers(min_value=0, max_value=10))
+@settings(deadline=None)
+def test_trusted_creation_matches_validated(n):
+    matrix = random_valid_matrix(n)
+    clasp = ClaspDiagram.from_matrix(matrix=matrix)
+    assert ClaspDiagram._from_trusted(matrix=matrix) == clasp
+    assert ClaspDiagram._from_trusted(array=clasp.array) == clasp
+
+
 # =============== creation via array validation ===============
 # --- Creation validation ---
 def test_none_array_raises_value_error():